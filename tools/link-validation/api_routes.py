@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+API Route Table
+
+Builds the table of serverless API routes from the files under api/, following
+Vercel's filesystem routing: ``api/tickets/types.js`` serves ``/api/tickets/types``,
+``index.js`` serves its directory, ``[param]`` segments match a single path segment
+and ``[...param]`` segments match the rest of the path. Files and directories whose
+names start with an underscore are helpers, not routes.
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Pattern, Tuple, Union
+
+
+ROUTE_EXTENSIONS = ('.js', '.mjs', '.cjs', '.ts')
+
+
+class ApiRouteTable:
+    """Exact and dynamic API routes discovered from the api/ directory."""
+
+    def __init__(self, project_root: Union[str, Path], build: bool = True):
+        self.project_root = Path(project_root).resolve()
+        self.static_routes: Dict[str, str] = {}
+        self.dynamic_routes: List[Tuple[str, Pattern, str]] = []
+        if build:
+            self._build()
+
+    def to_dict(self) -> Dict:
+        """Routes in JSON form; patterns are recompiled from the route on load."""
+        return {
+            'static': self.static_routes,
+            'dynamic': [[route, source] for route, _, source in self.dynamic_routes]
+        }
+
+    @classmethod
+    def from_dict(cls, project_root: Union[str, Path], data: Dict) -> 'ApiRouteTable':
+        """Rebuild a route table from to_dict() output without walking api/."""
+        table = cls(project_root, build=False)
+        table.static_routes = dict(data.get('static', {}))
+        table.dynamic_routes = [(route, cls._compile(tuple(route.strip('/').split('/'))), source)
+                                for route, source in data.get('dynamic', [])]
+        return table
+
+    def _build(self):
+        api_dir = self.project_root / 'api'
+        if not api_dir.exists():
+            return
+
+        for file_path in sorted(api_dir.rglob('*')):
+            if not file_path.is_file() or file_path.suffix not in ROUTE_EXTENSIONS:
+                continue
+            parts = file_path.relative_to(self.project_root).with_suffix('').parts
+            if any(part.startswith('_') for part in parts):
+                continue
+            if parts[-1] == 'index':
+                parts = parts[:-1]
+
+            route = '/' + '/'.join(parts)
+            source = file_path.relative_to(self.project_root).as_posix()
+            if '[' in route:
+                self.dynamic_routes.append((route, self._compile(parts), source))
+            else:
+                self.static_routes[route] = source
+
+    @staticmethod
+    def _compile(parts: Tuple[str, ...]) -> Pattern:
+        segments = []
+        for part in parts:
+            if part.startswith('[...') and part.endswith(']'):
+                segments.append('.+')
+            elif part.startswith('[') and part.endswith(']'):
+                segments.append('[^/]+')
+            else:
+                segments.append(re.escape(part))
+        return re.compile('^/' + '/'.join(segments) + '$')
+
+    def match(self, path: str) -> Optional[str]:
+        """Return the source file serving a request path, or None."""
+        path = path.split('?', 1)[0].split('#', 1)[0].rstrip('/') or '/'
+        source = self.static_routes.get(path)
+        if source is not None:
+            return source
+        for _, pattern, source in self.dynamic_routes:
+            if pattern.match(path):
+                return source
+        return None
+
+    def matches_prefix(self, prefix: str) -> bool:
+        """Return True if any route could serve a path starting with prefix.
+
+        Used for URLs built at runtime, e.g. ``/api/tickets/${id}``, where only the
+        static prefix is known.
+        """
+        if any(route.startswith(prefix) for route in self.static_routes):
+            return True
+        for route, _, _ in self.dynamic_routes:
+            static_part = route.split('[', 1)[0]
+            if route.startswith(prefix) or prefix.startswith(static_part):
+                return True
+        return False
+
+    def __len__(self) -> int:
+        return len(self.static_routes) + len(self.dynamic_routes)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Asset Reference Index
+
+Reverse index from every referenced project file to the files that reference it.
+HTML pages feed it through the link extractor; other scanners (stylesheets,
+scripts) can add their references through the same interface.
+
+Combined with the validator's file cache this gives orphaned asset detection:
+files under css/, js/ and images/ that nothing references. The comparison is a
+plain set difference over project-relative paths, so it stays cheap even with
+tens of thousands of assets.
+"""
+
+import fnmatch
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from .asset_resolver import AssetResolver, is_local_reference
+from .html_link_parser import ParseResults
+
+
+ASSET_DIRECTORIES = ('css', 'js', 'images')
+
+
+@dataclass
+class OrphanedAsset:
+    """An asset file that no page, stylesheet or script references."""
+    path: str
+    size: int
+
+
+class ReferenceIndex:
+    """Maps referenced files (project-relative paths) to the files referencing them."""
+
+    def __init__(self, resolver: AssetResolver):
+        self.resolver = resolver
+        self.referrers: Dict[str, Set[str]] = {}
+        self.unresolved: Dict[str, Set[str]] = {}
+        self._sources: Dict[str, str] = {}
+
+    def add_reference(self, source_file: str, href: str) -> Optional[str]:
+        """Resolve a reference and record it; return the target path if it exists."""
+        if not is_local_reference(href):
+            return None
+
+        target = self.resolver.resolve(href, source_file)
+        source = self._sources.get(source_file)
+        if source is None:
+            source = self._sources[source_file] = self.resolver.relative(Path(os.path.abspath(source_file)))
+        if target is None:
+            self.unresolved.setdefault(href, set()).add(source)
+            return None
+
+        relative_target = self.resolver.relative(target)
+        self.add_target(source, relative_target)
+        return relative_target
+
+    def add_target(self, source: str, target: str):
+        """Record an already-resolved reference."""
+        referrers = self.referrers.get(target)
+        if referrers is None:
+            referrers = self.referrers[target] = set()
+        referrers.add(source)
+
+    def add_parse_results(self, results: ParseResults):
+        """Index every local reference found by the HTML link extractor."""
+        for link in results.links:
+            # Runtime-built URLs only carry a static prefix, not a file path
+            if link.href and not link.attributes.get('dynamic'):
+                self.add_reference(link.source_file, link.href)
+
+    def get_referrers(self, target: str) -> Set[str]:
+        """Files referencing the given project-relative path."""
+        return self.referrers.get(target, set())
+
+    def referenced_paths(self) -> Set[str]:
+        return set(self.referrers)
+
+
+def collect_asset_paths(file_cache: Dict[str, Path],
+                        directories: Iterable[str] = ASSET_DIRECTORIES) -> Dict[str, Path]:
+    """Select file cache entries under the asset directories, keyed by POSIX path."""
+    prefixes = tuple(directory.rstrip('/') + '/' for directory in directories)
+    asset_paths = {}
+    for key, file_path in file_cache.items():
+        key = key.replace(os.sep, '/')
+        if key.startswith(prefixes):
+            asset_paths[key] = file_path
+    return asset_paths
+
+
+def find_orphaned_assets(asset_paths: Dict[str, Path], index: ReferenceIndex,
+                         ignore_patterns: Iterable[str] = ()) -> List[OrphanedAsset]:
+    """Return assets that the index never saw referenced, largest first."""
+    orphan_keys = asset_paths.keys() - index.referrers.keys()
+
+    patterns = list(ignore_patterns)
+    if patterns:
+        orphan_keys = {key for key in orphan_keys
+                       if not any(fnmatch.fnmatch(key, pattern) for pattern in patterns)}
+
+    orphans = [OrphanedAsset(key, asset_paths[key].stat().st_size) for key in orphan_keys]
+    orphans.sort(key=lambda orphan: (-orphan.size, orphan.path))
+    return orphans
+
+
+def build_orphan_report(orphans: List[OrphanedAsset], total_assets: int) -> Dict:
+    """Summarize orphaned assets by directory with their total size."""
+    by_directory: Dict[str, Dict[str, int]] = {}
+    for orphan in orphans:
+        directory = orphan.path.split('/', 1)[0]
+        entry = by_directory.setdefault(directory, {'count': 0, 'bytes': 0})
+        entry['count'] += 1
+        entry['bytes'] += orphan.size
+
+    return {
+        'summary': {
+            'assets_indexed': total_assets,
+            'orphaned': len(orphans),
+            'orphaned_bytes': sum(orphan.size for orphan in orphans),
+            'by_directory': by_directory
+        },
+        'orphans': [{'path': orphan.path, 'size': orphan.size} for orphan in orphans]
+    }
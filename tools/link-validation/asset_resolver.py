@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Asset Resolver
+
+Maps references found in HTML (and later CSS/JS) to files in the project tree.
+Absolute URLs are resolved from the project root; a path with no file on disk
+follows the rewrites declared in vercel.json (via ``VercelConfig``), the order
+the platform serves them in. Relative URLs are resolved against the referencing
+file's own directory. Lookups are memoized so each unique URL costs
+at most one filesystem check.
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+from urllib.parse import unquote, urlparse
+
+from .vercel_config import VercelConfig
+
+
+NON_FILE_SCHEMES = ('http:', 'https:', 'mailto:', 'tel:', 'javascript:', 'data:', 'blob:', '//')
+
+
+def split_reference(href: str) -> Tuple[str, str]:
+    """Split a reference into its decoded path and query string."""
+    parsed = urlparse(href.strip())
+    return unquote(parsed.path), parsed.query
+
+
+def is_local_reference(href: str) -> bool:
+    """Return True for references that may point at a file in the project."""
+    href = href.strip()
+    return bool(href) and not href.startswith('#') and not href.lower().startswith(NON_FILE_SCHEMES)
+
+
+class AssetResolver:
+    """Resolves local references to existing files under the project root."""
+
+    def __init__(self, project_root: Union[str, Path], vercel: Optional[VercelConfig] = None):
+        self.project_root = Path(project_root).resolve()
+        self._vercel = vercel
+        self._exists_cache: Dict[Path, bool] = {}
+        self._resolve_cache: Dict[Tuple[str, str], Optional[Path]] = {}
+
+    @property
+    def vercel(self) -> VercelConfig:
+        """Routing rules from vercel.json, loaded on first use"""
+        if self._vercel is None:
+            self._vercel = VercelConfig(self.project_root)
+        return self._vercel
+
+    def _rewrite(self, path: str) -> str:
+        """Path served for an absolute URL: the file on disk, else the matching rewrite."""
+        if self.is_file(Path(os.path.normpath(self.project_root / path.lstrip('/')))):
+            return path
+        destination = self.vercel.rewrite(path)
+        if destination is None or destination.startswith(('http://', 'https://')):
+            return path
+        return unquote(urlparse(destination).path) or path
+
+    def candidate_path(self, href: str, source_file: Optional[str] = None) -> Optional[Path]:
+        """Return the file a local reference would map to, whether or not it exists."""
+        if not is_local_reference(href):
+            return None
+
+        path, _ = split_reference(href)
+        if not path:
+            return None
+
+        if path.startswith('/'):
+            candidate = self.project_root / self._rewrite(path).lstrip('/')
+        elif source_file:
+            candidate = Path(os.path.abspath(source_file)).parent / path
+        else:
+            return None
+
+        # Normalize ".." segments without touching the filesystem
+        return Path(os.path.normpath(candidate))
+
+    def resolve(self, href: str, source_file: Optional[str] = None) -> Optional[Path]:
+        """Return the existing file a local reference points at, or None."""
+        path, _ = split_reference(href)
+        base = str(Path(os.path.abspath(source_file)).parent) if source_file and not path.startswith('/') else ''
+        key = (path, base)
+        if key in self._resolve_cache:
+            return self._resolve_cache[key]
+
+        candidate = self.candidate_path(href, source_file)
+        resolved = candidate if candidate is not None and self.is_file(candidate) else None
+        self._resolve_cache[key] = resolved
+        return resolved
+
+    def is_file(self, path: Path) -> bool:
+        """Memoized file existence check."""
+        exists = self._exists_cache.get(path)
+        if exists is None:
+            exists = self._exists_cache[path] = path.is_file()
+        return exists
+
+    def relative(self, path: Path) -> str:
+        """Project-relative POSIX path for display and indexing."""
+        try:
+            return path.relative_to(self.project_root).as_posix()
+        except ValueError:
+            return path.as_posix()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Cache-Busting Consistency
+
+Groups every local asset reference by the file it points at and lists each
+distinct query string it is requested with. ``/css/main.css?v=3``,
+``/css/main.css?v=4`` and a bare ``/css/main.css`` are the same file on disk
+and all pass link validation, but they are three cache keys in the browser, so
+a visitor moving between pages downloads the file once per variant.
+
+Files referenced with more than one variant are flagged, along with the pages
+that use each variant, the variant most pages already use (the one to
+standardize on), and the bytes repeat downloads cost. Version parameters are
+recognized with the same ``version_query_params`` as the Cache-Control report.
+"""
+
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import parse_qsl
+
+from .asset_resolver import AssetResolver, is_local_reference, split_reference
+from .cache_control import DEFAULT_VERSION_PARAMS, PAGE_EXTENSIONS
+from .html_link_parser import ParseResults
+from .profiling import Profiler, get_profiler
+
+
+@dataclass
+class AssetVariants:
+    """All query-string variants one asset file is referenced with."""
+    path: str
+    size: Optional[int]
+    variants: Dict[str, List[str]] = field(default_factory=dict)  # query -> pages
+
+    @property
+    def inconsistent(self) -> bool:
+        return len(self.variants) > 1
+
+    @property
+    def preferred(self) -> str:
+        """The variant most pages use; ties go to the later version string."""
+        return max(self.variants, key=lambda query: (len(self.variants[query]), query))
+
+    @property
+    def wasted_bytes(self) -> int:
+        """Bytes downloaded again by a visitor who sees every variant once."""
+        return (self.size or 0) * (len(self.variants) - 1)
+
+
+class CacheBustingAuditor:
+    """Finds assets requested under several query strings across pages."""
+
+    def __init__(self, project_root: str, profiler: Optional[Profiler] = None, config: Optional[Dict] = None):
+        self.project_root = Path(project_root).resolve()
+        self.profiler = get_profiler(profiler)
+        self.resolver = AssetResolver(self.project_root)
+        settings = (config or {}).get('cache_control', {})
+        self.version_params = set(settings.get('version_query_params', DEFAULT_VERSION_PARAMS))
+
+    def version(self, query: str) -> Optional[str]:
+        """Value of the version parameter in a query string, if any."""
+        for name, value in parse_qsl(query, keep_blank_values=True):
+            if name in self.version_params:
+                return value
+        return None
+
+    def collect(self, results: ParseResults) -> Dict[str, AssetVariants]:
+        """Variants per asset file, keyed by project-relative path."""
+        assets: Dict[str, AssetVariants] = {}
+        with self.profiler.phase('cache_busting'):
+            for link in results.links:
+                if not is_local_reference(link.href):
+                    continue
+                path, query = split_reference(link.href)
+                if os.path.splitext(path)[1].lower() in PAGE_EXTENSIONS:
+                    continue
+                target = self.resolver.resolve(link.href, link.source_file) \
+                    or self.resolver.candidate_path(link.href, link.source_file)
+                if target is None:
+                    continue
+                key = self.resolver.relative(target)
+                asset = assets.get(key)
+                if asset is None:
+                    size = target.stat().st_size if self.resolver.is_file(target) else None
+                    asset = assets[key] = AssetVariants(key, size)
+                pages = asset.variants.setdefault(query, [])
+                page = os.path.relpath(link.source_file, self.project_root)
+                if page not in pages:
+                    pages.append(page)
+        self.profiler.count('cache_busting_assets', len(assets))
+        return assets
+
+    def build_report(self, results: ParseResults) -> Dict:
+        """Inconsistent assets first, worst repeat-download cost first."""
+        assets = self.collect(results)
+        flagged = sorted((asset for asset in assets.values() if asset.inconsistent),
+                         key=lambda asset: (-asset.wasted_bytes, -len(asset.variants), asset.path))
+        return {
+            'summary': {
+                'assets': len(assets),
+                'versioned_assets': sum(1 for asset in assets.values()
+                                        if any(self.version(query) is not None for query in asset.variants)),
+                'inconsistent_assets': len(flagged),
+                'wasted_bytes': sum(asset.wasted_bytes for asset in flagged)
+            },
+            'inconsistent': [self._asset_entry(asset) for asset in flagged]
+        }
+
+    def _asset_entry(self, asset: AssetVariants) -> Dict:
+        preferred = asset.preferred
+        return {
+            'path': asset.path,
+            'size': asset.size,
+            'wasted_bytes': asset.wasted_bytes,
+            'preferred': preferred,
+            'variants': [
+                {
+                    'query': query,
+                    'version': self.version(query),
+                    'pages': sorted(pages)
+                }
+                for query, pages in sorted(asset.variants.items(), key=lambda item: (-len(item[1]), item[0]))
+            ],
+            'pages_to_update': sorted({page for query, pages in asset.variants.items()
+                                       if query != preferred for page in pages})
+        }
+
+
+def format_cache_busting_report(report: Dict, top: int = 20) -> str:
+    """Format a cache-busting consistency report for terminal output."""
+    summary = report['summary']
+    lines = [
+        f"Assets referenced: {summary['assets']} ({summary['versioned_assets']} with a version parameter)",
+        f"Inconsistent variants: {summary['inconsistent_assets']} assets, "
+        f"{summary['wasted_bytes'] / 1024:.1f}K downloaded again across pages"
+    ]
+    for asset in report['inconsistent'][:top]:
+        lines.append("")
+        lines.append(f"  {asset['path']} (use '{asset['preferred'] or '<no query>'}')")
+        for variant in asset['variants']:
+            shown = ', '.join(variant['pages'][:3])
+            more = f" +{len(variant['pages']) - 3}" if len(variant['pages']) > 3 else ''
+            label = f"?{variant['query']}" if variant['query'] else '(no query)'
+            lines.append(f"      {label:36} {len(variant['pages']):3d} pages  {shown}{more}")
+    if len(report['inconsistent']) > top:
+        lines.append(f"\n  ... and {len(report['inconsistent']) - top} more")
+    return "\n".join(lines)
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Cache-Control Coverage
+
+Works out the ``Cache-Control`` every asset referenced by a page is served with,
+using the ``headers`` rules compiled from vercel.json, and flags policies that
+do not fit the URL:
+
+- ``immutable`` (or a year-long ``max-age``) on a URL that is not fingerprinted:
+  browsers keep the old file after a deploy
+- a fingerprinted URL that is revalidated or expires quickly: repeat visitors
+  pay a round trip for a file that can never change
+- no rule setting ``Cache-Control`` at all: the platform default
+  (``max-age=0, must-revalidate``) applies, so every view revalidates
+
+A URL counts as fingerprinted when its file name carries a content hash
+(``main-BfoDxb1i.js``, ``app.3f9a2c1d.css``) or its query string carries a
+version parameter (``?v=42``). Both checks come from ``cache_control`` in the
+config. Header rules match the URL path only, as on the platform.
+"""
+
+import os
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from .asset_resolver import AssetResolver, is_local_reference, split_reference
+from .html_link_parser import ParseResults
+from .profiling import Profiler, get_profiler
+from .vercel_config import VercelConfig
+
+
+# What the platform sends for static files when no rule sets Cache-Control
+PLATFORM_DEFAULT = 'public, max-age=0, must-revalidate'
+
+ONE_YEAR = 31536000
+
+DEFAULT_FINGERPRINT_PATTERNS = [
+    r'[.-][0-9a-f]{8,}\.\w+$',                 # hex content hash
+    r'[.-](?=[A-Za-z_]*\d)[A-Za-z0-9_]{8}\.\w+$',  # Vite/Rollup base64url hash
+]
+DEFAULT_VERSION_PARAMS = ['v', 'ver', 'version', 'hash', 'rev']
+DEFAULT_LONG_LIVED_SECONDS = 30 * 86400
+
+# rule id -> (severity, description)
+RULES = {
+    'immutable-not-fingerprinted': ('error', 'Served immutable/long-lived but the URL changes with no deploy'),
+    'fingerprinted-short-lived': ('warning', 'Fingerprinted URL is revalidated or expires quickly'),
+    'no-cache-rule': ('warning', 'No vercel.json rule sets Cache-Control; the platform default applies'),
+}
+
+PAGE_EXTENSIONS = ('', '.html', '.htm')
+
+
+def parse_cache_control(value: str) -> Dict[str, Optional[str]]:
+    """Cache-Control directives, lowercased, with their argument if any."""
+    directives = {}
+    for part in value.split(','):
+        name, _, argument = part.strip().partition('=')
+        if name:
+            directives[name.strip().lower()] = argument.strip().strip('"') or None
+    return directives
+
+
+def max_age(directives: Dict[str, Optional[str]]) -> int:
+    """Browser freshness lifetime in seconds (0 when revalidation is forced)."""
+    if 'no-store' in directives or 'no-cache' in directives:
+        return 0
+    try:
+        return int(directives.get('max-age') or 0)
+    except ValueError:
+        return 0
+
+
+@dataclass
+class CachePolicy:
+    """Effective caching of one asset URL."""
+    path: str
+    cache_control: str
+    rule: Optional[str]  # vercel.json source that set it, None for the platform default
+    fingerprint: Optional[str]  # 'filename', 'query' or None
+
+    @property
+    def directives(self) -> Dict[str, Optional[str]]:
+        return parse_cache_control(self.cache_control)
+
+    @property
+    def max_age(self) -> int:
+        return max_age(self.directives)
+
+    @property
+    def immutable(self) -> bool:
+        return 'immutable' in self.directives
+
+
+class CacheControlAuditor:
+    """Effective Cache-Control for every asset pages reference."""
+
+    def __init__(self, project_root: str, profiler: Optional[Profiler] = None,
+                 config: Optional[Dict] = None, vercel: Optional[VercelConfig] = None):
+        self.project_root = os.path.abspath(project_root)
+        self.profiler = get_profiler(profiler)
+        self.resolver = AssetResolver(self.project_root)
+        self.vercel = vercel or VercelConfig(self.project_root)
+
+        settings = (config or {}).get('cache_control', {})
+        self.fingerprint_patterns = [
+            re.compile(pattern) for pattern in settings.get('fingerprint_patterns', DEFAULT_FINGERPRINT_PATTERNS)
+        ]
+        self.version_params = set(settings.get('version_query_params', DEFAULT_VERSION_PARAMS))
+        self.long_lived_seconds = settings.get('long_lived_seconds', DEFAULT_LONG_LIVED_SECONDS)
+
+    def fingerprint(self, path: str, query: str) -> Optional[str]:
+        """How a URL is versioned: 'filename', 'query' or None."""
+        name = path.rsplit('/', 1)[-1]
+        if any(pattern.search(name) for pattern in self.fingerprint_patterns):
+            return 'filename'
+        params = {part.split('=', 1)[0] for part in query.split('&') if part}
+        if params & self.version_params:
+            return 'query'
+        return None
+
+    def url_path(self, href: str, source_file: str) -> Optional[Tuple[str, str]]:
+        """(URL path, query) an asset reference is requested at, or None for pages."""
+        path, query = split_reference(href)
+        if not path.startswith('/'):
+            candidate = self.resolver.candidate_path(href, source_file)
+            if candidate is None:
+                return None
+            path = '/' + os.path.relpath(candidate, self.project_root).replace(os.sep, '/')
+        if os.path.splitext(path)[1].lower() in PAGE_EXTENSIONS:
+            return None
+        return path, query
+
+    def policy(self, path: str, query: str = '') -> CachePolicy:
+        """Effective caching for an asset URL."""
+        value, rule = self.vercel.headers_for(path).get('cache-control', (PLATFORM_DEFAULT, None))
+        return CachePolicy(path, value, rule, self.fingerprint(path, query))
+
+    def findings(self, policy: CachePolicy) -> List[Tuple[str, str]]:
+        """(rule, message) pairs for one asset's policy."""
+        lifetime = policy.max_age
+        long_lived = policy.immutable or lifetime >= self.long_lived_seconds
+        findings = []
+        if policy.rule is None:
+            findings.append(('no-cache-rule', f"Served with the default '{PLATFORM_DEFAULT}'"))
+        if long_lived and not policy.fingerprint:
+            findings.append(('immutable-not-fingerprinted',
+                             f"'{policy.cache_control}' from {policy.rule or 'default'}, "
+                             f"but the file name has no content hash"))
+        elif policy.fingerprint and not (policy.immutable and lifetime >= ONE_YEAR):
+            findings.append(('fingerprinted-short-lived',
+                             f"Versioned by {policy.fingerprint} but served '{policy.cache_control}'; "
+                             f"use 'public, max-age={ONE_YEAR}, immutable'"))
+        return findings
+
+    def build_report(self, results: ParseResults) -> Dict:
+        """Effective policy and findings for each unique asset URL, with the pages using it."""
+        assets: Dict[Tuple[str, str], Dict] = {}
+        with self.profiler.phase('cache_control'):
+            for link in results.links:
+                if not is_local_reference(link.href):
+                    continue
+                url = self.url_path(link.href, link.source_file)
+                if url is None:
+                    continue
+                entry = assets.get(url)
+                if entry is None:
+                    policy = self.policy(*url)
+                    entry = assets[url] = {
+                        'url': url[0] + (f'?{url[1]}' if url[1] else ''),
+                        'cache_control': policy.cache_control,
+                        'rule': policy.rule,
+                        'max_age': policy.max_age,
+                        'immutable': policy.immutable,
+                        'fingerprint': policy.fingerprint,
+                        'findings': [{'rule': rule, 'severity': RULES[rule][0], 'message': message}
+                                     for rule, message in self.findings(policy)],
+                        'pages': []
+                    }
+                page = os.path.relpath(link.source_file, self.project_root)
+                if page not in entry['pages']:
+                    entry['pages'].append(page)
+        self.profiler.count('cache_policies', len(assets))
+
+        by_rule: Dict[str, int] = {}
+        by_policy: Dict[str, int] = {}
+        for entry in assets.values():
+            by_policy[entry['cache_control']] = by_policy.get(entry['cache_control'], 0) + 1
+            for finding in entry['findings']:
+                by_rule[finding['rule']] = by_rule.get(finding['rule'], 0) + 1
+
+        flagged = sorted((entry for entry in assets.values() if entry['findings']),
+                         key=lambda entry: (-len(entry['pages']), entry['url']))
+        return {
+            'summary': {
+                'assets': len(assets),
+                'flagged_assets': len(flagged),
+                'by_rule': by_rule,
+                'by_policy': dict(sorted(by_policy.items(), key=lambda item: -item[1]))
+            },
+            'rules': {rule: {'severity': severity, 'description': description}
+                      for rule, (severity, description) in RULES.items()},
+            'flagged': flagged,
+            'assets': sorted(assets.values(), key=lambda entry: entry['url'])
+        }
+
+
+def format_cache_report(report: Dict, top: int = 20) -> str:
+    """Format a Cache-Control coverage report for terminal output."""
+    summary = report['summary']
+    lines = [f"Assets referenced: {summary['assets']} ({summary['flagged_assets']} flagged)", "", "Policies:"]
+    for value, count in summary['by_policy'].items():
+        lines.append(f"  {count:4d}  {value}")
+
+    if summary['by_rule']:
+        lines.append("")
+        for rule, count in sorted(summary['by_rule'].items(), key=lambda item: -item[1]):
+            lines.append(f"  {rule:28}: {count:4d}  {report['rules'][rule]['description']}")
+
+    if report['flagged']:
+        lines.append("")
+        lines.append("Flagged assets (most referenced first):")
+        for entry in report['flagged'][:top]:
+            rules = ', '.join(finding['rule'] for finding in entry['findings'])
+            lines.append(f"  {entry['url']} ({len(entry['pages'])} pages): {rules}")
+            lines.append(f"      Cache-Control: {entry['cache_control']}")
+        if len(report['flagged']) > top:
+            lines.append(f"  ... and {len(report['flagged']) - top} more")
+    return "\n".join(lines)
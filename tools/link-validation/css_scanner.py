@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+CSS Reference Scanner
+
+Single-pass scanner for ``url()`` and ``@import`` references in stylesheets. A
+single compiled regex walks the text once, skipping comments and unrelated string
+literals, and line numbers are counted incrementally between matches, so the
+cost is linear in the file size. ``data:`` URIs and fragment-only references
+(``url(#filter)``) are ignored.
+
+Each stylesheet is scanned at most once per scanner, no matter how many pages
+include it, and ``@import`` chains are followed so deep or circular import chains
+can be reported.
+"""
+
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from .asset_resolver import AssetResolver
+from .profiling import Profiler, get_profiler
+
+
+_CSS_TOKEN = re.compile(r'''
+    /\*.*?(?:\*/|\Z)                                                        # comment
+  | @import\s+(?:url\(\s*)?(?P<iq>["']?)(?P<import>[^"')\s;]+)(?P=iq)       # @import
+  | url\(\s*(?:"(?P<dq>[^"]*)"|'(?P<sq>[^']*)'|(?P<bare>[^)"'\s]*))\s*\)   # url()
+  | "(?:\\.|[^"\\\n])*"                                                     # other strings
+  | '(?:\\.|[^'\\\n])*'
+''', re.DOTALL | re.VERBOSE | re.IGNORECASE)
+
+
+@dataclass
+class CSSReference:
+    """A single url() or @import reference in a stylesheet."""
+    href: str
+    line_number: int
+    kind: str  # 'import' or 'url'
+
+
+def scan_css_text(text: str) -> List[CSSReference]:
+    """Extract url() and @import references from stylesheet text."""
+    references = []
+    line = 1
+    position = 0
+
+    for match in _CSS_TOKEN.finditer(text):
+        start = match.start()
+        line += text.count('\n', position, start)
+        position = start
+
+        if match.group('import') is not None:
+            href, kind = match.group('import'), 'import'
+        else:
+            href = match.group('dq')
+            if href is None:
+                href = match.group('sq')
+            if href is None:
+                href = match.group('bare')
+            if href is None:
+                continue
+            kind = 'url'
+
+        href = href.strip()
+        if not href or href.startswith('#') or href.lower().startswith('data:'):
+            continue
+        references.append(CSSReference(href, line, kind))
+
+    return references
+
+
+class CSSScanner:
+    """Scans stylesheets once each and follows their @import chains."""
+
+    def __init__(self, resolver: Optional[AssetResolver] = None, profiler: Optional[Profiler] = None):
+        self.resolver = resolver
+        self.profiler = get_profiler(profiler)
+        self.scanned: Dict[str, List[CSSReference]] = {}
+        self.imports: Dict[str, List[str]] = {}
+
+    def scan_file(self, path: str) -> List[CSSReference]:
+        """Scan a stylesheet, returning cached references if already scanned."""
+        path = os.path.abspath(path)
+        references = self.scanned.get(path)
+        if references is not None:
+            self.profiler.count('css_scan_cache_hits')
+            return references
+
+        with self.profiler.file(path), self.profiler.phase('css_scan'):
+            try:
+                with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                    references = scan_css_text(f.read())
+            except OSError:
+                references = []
+
+        self.profiler.count('stylesheets_scanned')
+        self.scanned[path] = references
+        self.imports[path] = []
+
+        # Follow @import chains so imported sheets are scanned exactly once too
+        if self.resolver is not None:
+            for reference in references:
+                if reference.kind != 'import':
+                    continue
+                target = self.resolver.resolve(reference.href, path)
+                if target is not None:
+                    self.imports[path].append(str(target))
+                    self.scan_file(str(target))
+
+        return references
+
+    def scan_files(self, paths: Iterable[str]) -> Dict[str, List[CSSReference]]:
+        """Scan several stylesheets; returns every scanned sheet, including imports."""
+        for path in paths:
+            self.scan_file(path)
+        return self.scanned
+
+    def import_depth(self, path: str) -> int:
+        """Length of the longest @import chain starting at a stylesheet (-1 if circular)."""
+        return self._import_depth(os.path.abspath(path), set(), {})
+
+    def _import_depth(self, path: str, visiting: set, depths: Dict[str, int]) -> int:
+        if path in depths:
+            return depths[path]
+        if path in visiting:
+            return -1
+
+        visiting.add(path)
+        depth = 0
+        for imported in self.imports.get(path, []):
+            child = self._import_depth(imported, visiting, depths)
+            if child < 0:
+                depth = -1
+                break
+            depth = max(depth, child + 1)
+        visiting.discard(path)
+        depths[path] = depth
+        return depth
+
+    def import_chains(self) -> List[Dict]:
+        """Describe every stylesheet that uses @import, deepest chains first."""
+        chains = []
+        for path, imported in self.imports.items():
+            if not imported:
+                continue
+            depth = self.import_depth(path)
+            chains.append({
+                'stylesheet': self._display(path),
+                'imports': [self._display(target) for target in imported],
+                'depth': depth,
+                'circular': depth < 0
+            })
+        chains.sort(key=lambda chain: (not chain['circular'], -chain['depth'], chain['stylesheet']))
+        return chains
+
+    def _display(self, path: str) -> str:
+        return self.resolver.relative(Path(path)) if self.resolver else path
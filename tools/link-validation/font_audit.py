@@ -0,0 +1,480 @@
+#!/usr/bin/env python3
+"""
+Web Font Loading Audit
+
+Connects the ``@font-face`` rules in local stylesheets (and inline ``<style>``
+blocks) to the pages that load them, and checks how each font is delivered:
+
+- every ``src`` URL of a face resolves to a file (missing-font-file)
+- a face offers a woff2 source, the smallest format every current browser reads
+  (no-woff2)
+- ``font-display`` is set, so text is not invisible while the font loads
+  (missing-font-display); for hosted font stylesheets such as Google Fonts the
+  ``display=`` query parameter plays the same role
+- fonts used by first-render selectors (``html``, ``body``, headings) are
+  preloaded on the pages that use them (critical-font-not-preloaded)
+- ``<link rel="preload" as="font">`` targets a face the page actually loads
+  (unused-font-preload) and carries ``crossorigin``, without which the preload
+  is fetched a second time (font-preload-missing-crossorigin)
+
+Stylesheets are parsed and their faces checked once each, however many pages
+link them; ``@import`` chains are followed with the shared CSS scanner. Hosted
+font stylesheet URLs are checked once each but reported on every page that
+links them; the preload checks run per page. Which selectors count as first render, and which
+families are always critical, come from ``web_fonts`` in the config.
+"""
+
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from .asset_resolver import AssetResolver, is_local_reference, split_reference
+from .css_scanner import CSSScanner
+from .html_link_parser import LinkInfo, ParseResults
+from .profiling import Profiler, get_profiler
+from .resource_hints import origin_of, rel_tokens
+
+
+# rule id -> (severity, description)
+RULES = {
+    'missing-font-file': ('error', '@font-face src points at a file that does not exist'),
+    'no-woff2': ('warning', '@font-face has no woff2 source'),
+    'missing-font-display': ('warning', 'Font is loaded without font-display, so text stays invisible until it arrives'),
+    'critical-font-not-preloaded': ('warning', 'Font used by first-render selectors is not preloaded'),
+    'unused-font-preload': ('warning', 'Preloaded font is not used by any @font-face the page loads'),
+    'font-preload-missing-crossorigin': ('error', 'Font preload without crossorigin is fetched twice'),
+}
+
+DEFAULT_CRITICAL_SELECTORS = ['html', 'body', 'h1', 'h2', 'h3']
+DEFAULT_FONT_SERVICES = ['https://fonts.googleapis.com']
+
+GENERIC_FAMILIES = {'serif', 'sans-serif', 'monospace', 'cursive', 'fantasy', 'system-ui', 'ui-serif',
+                    'ui-sans-serif', 'ui-monospace', 'ui-rounded', 'emoji', 'math', 'fangsong',
+                    'inherit', 'initial', 'unset', 'revert', '-apple-system', 'blinkmacsystemfont'}
+
+_COMMENT = re.compile(r'/\*.*?(?:\*/|\Z)', re.DOTALL)
+# Innermost blocks only, so rules nested in @media or @supports are found too
+_RULE = re.compile(r'([^{}]*)\{([^{}]*)\}')
+_DECLARATION = re.compile(r'([-\w]+)\s*:\s*([^;]+)')
+_SOURCE = re.compile(r'''url\(\s*["']?([^"')]+?)["']?\s*\)(?:\s*format\(\s*["']?([^"')]+)["']?\s*\))?''',
+                     re.IGNORECASE)
+_VAR = re.compile(r'var\(\s*(--[-\w]+)\s*(?:,\s*([^()]*))?\)')
+# font shorthand: [style variant weight] size[/line-height] family-list
+_FONT_SHORTHAND = re.compile(r'(?:^|\s)[\d.]+(?:[a-z]+|%)(?:\s*/\s*[\d.]+[a-z%]*)?\s+(.+)$', re.IGNORECASE)
+
+
+def family_names(value: str) -> List[str]:
+    """Family names of a font-family list, generic families dropped."""
+    names = []
+    for name in value.split(','):
+        name = name.strip().strip('"\'').strip()
+        if name and name.lower() not in GENERIC_FAMILIES and not name.startswith('var('):
+            names.append(name)
+    return names
+
+
+@dataclass
+class FontSource:
+    """One url() entry of an @font-face src."""
+    url: str
+    format: Optional[str]
+
+    @property
+    def is_woff2(self) -> bool:
+        if self.format:
+            return self.format.lower() == 'woff2'
+        return split_reference(self.url)[0].lower().endswith('.woff2')
+
+
+@dataclass
+class FontFace:
+    """An @font-face rule and where it is declared."""
+    family: str
+    stylesheet: str
+    line_number: int
+    sources: List[FontSource] = field(default_factory=list)
+    display: Optional[str] = None
+    weight: str = '400'
+    style: str = 'normal'
+
+    @property
+    def label(self) -> str:
+        return f"{self.family} {self.weight} {self.style}"
+
+    def preload_source(self) -> Optional[FontSource]:
+        """The source worth preloading: woff2 if there is one, else the first."""
+        for source in self.sources:
+            if source.is_woff2:
+                return source
+        return self.sources[0] if self.sources else None
+
+
+@dataclass
+class FontFinding:
+    """A single font finding, on a stylesheet or on a page."""
+    rule: str
+    location: str
+    line_number: int
+    target: str
+    message: str
+
+    @property
+    def severity(self) -> str:
+        return RULES[self.rule][0]
+
+    def to_dict(self) -> Dict:
+        return {
+            'rule': self.rule,
+            'severity': self.severity,
+            'line_number': self.line_number,
+            'target': self.target,
+            'message': self.message
+        }
+
+
+@dataclass
+class StylesheetFonts:
+    """Font faces one stylesheet declares and the families its first-render rules use."""
+    stylesheet: str  # project-relative path, or page:line for an inline <style>
+    base_file: str   # file its url()s resolve against
+    faces: List[FontFace] = field(default_factory=list)
+    critical_values: List[str] = field(default_factory=list)  # font/font-family of first-render rules
+    custom_properties: Dict[str, str] = field(default_factory=dict)
+    findings: List[FontFinding] = field(default_factory=list)
+
+
+def parse_stylesheet_fonts(text: str, stylesheet: str, base_file: str, critical_selectors: Set[str],
+                           line_offset: int = 0) -> StylesheetFonts:
+    """Font faces, custom properties and first-render families of a stylesheet."""
+    text = _COMMENT.sub(lambda match: '\n' * match.group(0).count('\n'), text)
+    sheet = StylesheetFonts(stylesheet, base_file)
+    line = 1 + line_offset
+    position = 0
+
+    for rule in _RULE.finditer(text):
+        line += text.count('\n', position, rule.start(2))
+        position = rule.start(2)
+        selector = ' '.join(rule.group(1).split()).lower()
+        declarations = {name.lower(): value.strip() for name, value in _DECLARATION.findall(rule.group(2))}
+
+        for name, value in declarations.items():
+            if name.startswith('--'):
+                sheet.custom_properties[name] = value
+
+        if selector.endswith('@font-face'):
+            family = family_names(declarations.get('font-family', ''))
+            if not family:
+                continue
+            face = FontFace(family[0], stylesheet, line,
+                            display=declarations.get('font-display'),
+                            weight=declarations.get('font-weight', '400'),
+                            style=declarations.get('font-style', 'normal'))
+            face.sources = [FontSource(url.strip(), fmt)
+                            for url, fmt in _SOURCE.findall(declarations.get('src', ''))
+                            if not url.strip().lower().startswith('data:')]
+            sheet.faces.append(face)
+            continue
+
+        if any(_matches_critical(part, critical_selectors) for part in selector.split(',')):
+            if 'font-family' in declarations:
+                sheet.critical_values.append(declarations['font-family'])
+            if 'font' in declarations:
+                sheet.critical_values.append(declarations['font'])
+    return sheet
+
+
+def _matches_critical(selector: str, critical_selectors: Set[str]) -> bool:
+    """Whether a selector's subject element is one of the first-render elements."""
+    subject = re.split(r'[\s>+~]+', selector.strip())[-1] if selector.strip() else ''
+    element = re.match(r'[a-z][a-z0-9-]*', subject)
+    return element is not None and element.group(0) in critical_selectors
+
+
+def font_family_value(value: str, custom_properties: Dict[str, str]) -> str:
+    """A font-family or font shorthand value with var() references expanded."""
+    for _ in range(5):  # Properties that refer to other properties
+        expanded = _VAR.sub(lambda match: custom_properties.get(match.group(1), match.group(2) or ''), value)
+        if expanded == value:
+            break
+        value = expanded
+    shorthand = _FONT_SHORTHAND.search(value)
+    return shorthand.group(1) if shorthand else value
+
+
+class WebFontAuditor:
+    """Audits @font-face delivery once per stylesheet and font preloads per page."""
+
+    def __init__(self, project_root: str, profiler: Optional[Profiler] = None, config: Optional[Dict] = None):
+        self.project_root = Path(project_root).resolve()
+        self.profiler = get_profiler(profiler)
+        self.resolver = AssetResolver(self.project_root)
+        self.css_scanner = CSSScanner(self.resolver, profiler=self.profiler)
+
+        settings = (config or {}).get('web_fonts', {})
+        self.critical_selectors = set(settings.get('critical_selectors', DEFAULT_CRITICAL_SELECTORS))
+        self.critical_families = {name.lower() for name in settings.get('critical_families', [])}
+        self.font_services = {origin_of(service) or service
+                              for service in settings.get('font_services', DEFAULT_FONT_SERVICES)}
+        self.sheets: Dict[str, StylesheetFonts] = {}
+        # Hosted font stylesheet URL -> whether it lacks display=
+        self.hosted: Dict[str, bool] = {}
+
+    def stylesheet(self, path: str) -> StylesheetFonts:
+        """Fonts of a local stylesheet, parsed and checked the first time it is seen."""
+        path = os.path.abspath(path)
+        sheet = self.sheets.get(path)
+        if sheet is not None:
+            return sheet
+        self.css_scanner.scan_file(path)
+        try:
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                text = f.read()
+        except OSError:
+            text = ''
+        sheet = parse_stylesheet_fonts(text, self.resolver.relative(Path(path)), path, self.critical_selectors)
+        self._check_faces(sheet)
+        self.sheets[path] = sheet
+        self.profiler.count('font_stylesheets')
+        return sheet
+
+    def inline_stylesheet(self, source_file: str, line_number: int, content: str) -> StylesheetFonts:
+        key = f"{source_file}:{line_number}"
+        sheet = self.sheets.get(key)
+        if sheet is None:
+            label = f"{os.path.relpath(source_file, self.project_root)}:{line_number} <style>"
+            sheet = parse_stylesheet_fonts(content, label, source_file, self.critical_selectors,
+                                           line_offset=line_number - 1)
+            self._check_faces(sheet)
+            self.sheets[key] = sheet
+        return sheet
+
+    def _check_faces(self, sheet: StylesheetFonts):
+        for face in sheet.faces:
+            for source in face.sources:
+                if is_local_reference(source.url) and self.resolver.resolve(source.url, sheet.base_file) is None:
+                    sheet.findings.append(FontFinding('missing-font-file', sheet.stylesheet, face.line_number,
+                                                      source.url, f"{face.label}: {source.url} does not exist"))
+            if face.sources and not any(source.is_woff2 for source in face.sources):
+                sheet.findings.append(FontFinding('no-woff2', sheet.stylesheet, face.line_number, face.label,
+                                                  f"{face.label} is served only as "
+                                                  f"{', '.join(self._format_of(source) for source in face.sources)}"))
+            if not face.display:
+                sheet.findings.append(FontFinding('missing-font-display', sheet.stylesheet, face.line_number,
+                                                  face.label, f"Add font-display: swap to {face.label}"))
+
+    @staticmethod
+    def _format_of(source: FontSource) -> str:
+        if source.format:
+            return source.format
+        return os.path.splitext(split_reference(source.url)[0])[1].lstrip('.') or 'unknown'
+
+    def hosted_stylesheet(self, href: str, source_file: str, line_number: int) -> List[FontFinding]:
+        """Checks of a font service stylesheet URL, reported against the page and line linking it.
+
+        The URL is parsed once however many pages link it.
+        """
+        missing_display = self.hosted.get(href)
+        if missing_display is None:
+            missing_display = not parse_qs(urlparse(href.strip()).query).get('display')
+            self.hosted[href] = missing_display
+        if not missing_display:
+            return []
+        page = os.path.relpath(source_file, self.project_root)
+        return [FontFinding('missing-font-display', page, line_number, href,
+                            "Add &display=swap to the font service URL")]
+
+    def _sheet_closure(self, path: str, seen: Set[str]) -> List[StylesheetFonts]:
+        """A stylesheet and everything it @imports, each once."""
+        path = os.path.abspath(path)
+        if path in seen:
+            return []
+        seen.add(path)
+        sheets = [self.stylesheet(path)]
+        for imported in self.css_scanner.imports.get(path, []):
+            sheets.extend(self._sheet_closure(imported, seen))
+        return sheets
+
+    def _preload_key(self, href: str, base_file: str) -> str:
+        if is_local_reference(href):
+            target = self.resolver.candidate_path(href, base_file)
+            if target is not None:
+                return str(target)
+        return split_reference(href.strip())[0]
+
+    def audit_page(self, source_file: str, links: List[LinkInfo], inline_styles: List[Tuple[int, str]]) -> Dict:
+        """Faces a page loads and its preload findings."""
+        sheets: List[StylesheetFonts] = []
+        seen: Set[str] = set()
+        preloads: List[LinkInfo] = []
+        hosted = []
+        findings = []
+        for link in links:
+            if link.tag != 'link' or not link.href:
+                continue
+            rels = rel_tokens(link.attributes)
+            if 'preload' in rels and (link.attributes.get('as') or '').lower() == 'font':
+                preloads.append(link)
+            if 'stylesheet' not in rels:
+                continue
+            if origin_of(link.href) in self.font_services:
+                hosted.append(link.href)
+                findings.extend(self.hosted_stylesheet(link.href, source_file, link.line_number))
+            elif is_local_reference(link.href):
+                target = self.resolver.resolve(link.href, source_file)
+                if target is not None:
+                    sheets.extend(self._sheet_closure(str(target), seen))
+        for line_number, content in inline_styles:
+            sheets.append(self.inline_stylesheet(source_file, line_number, content))
+
+        faces = [face for sheet in sheets for face in sheet.faces]
+        # Custom properties cascade across stylesheets: typography.css may define
+        # --font-sans for base.css to use
+        custom_properties: Dict[str, str] = {}
+        for sheet in sheets:
+            custom_properties.update(sheet.custom_properties)
+        critical = set(self.critical_families)
+        face_keys: Dict[str, FontFace] = {}
+        for sheet in sheets:
+            for value in sheet.critical_values:
+                critical.update(name.lower() for name in family_names(font_family_value(value, custom_properties)))
+            for face in sheet.faces:
+                for source in face.sources:
+                    face_keys[self._preload_key(source.url, sheet.base_file)] = face
+
+        page = os.path.relpath(source_file, self.project_root)
+
+        preloaded: Set[int] = set()
+        for link in preloads:
+            face = face_keys.get(self._preload_key(link.href, source_file))
+            if face is None:
+                findings.append(FontFinding('unused-font-preload', page, link.line_number, link.href,
+                                            "No @font-face on this page uses the preloaded font"))
+            else:
+                preloaded.add(id(face))
+            if 'crossorigin' not in link.attributes:
+                findings.append(FontFinding('font-preload-missing-crossorigin', page, link.line_number, link.href,
+                                            'Add crossorigin to the font preload'))
+
+        for sheet in sheets:
+            for face in sheet.faces:
+                if face.family.lower() not in critical or id(face) in preloaded or face.style != 'normal':
+                    continue
+                source = face.preload_source()
+                target = self.resolver.resolve(source.url, sheet.base_file) \
+                    if source is not None and is_local_reference(source.url) else None
+                if target is None:
+                    continue
+                href = '/' + self.resolver.relative(target)
+                findings.append(FontFinding('critical-font-not-preloaded', page, 0, href,
+                                            f"{face.label} renders above the fold; add "
+                                            f"<link rel=\"preload\" as=\"font\" href=\"{href}\" crossorigin>"))
+
+        findings.sort(key=lambda finding: finding.line_number)
+        return {
+            'page': page,
+            'fonts': sorted({face.label for face in faces}),
+            'hosted_font_stylesheets': hosted,
+            'findings': findings
+        }
+
+    def build_report(self, results: ParseResults) -> Dict:
+        """Stylesheet findings once per sheet, preload findings per page."""
+        inline_styles: Dict[str, List[Tuple[int, str]]] = {}
+        for block in results.inline_blocks:
+            if block.tag == 'style':
+                inline_styles.setdefault(block.source_file, []).append((block.line_number, block.content))
+
+        with self.profiler.phase('web_fonts'):
+            pages = [self.audit_page(source_file, links, inline_styles.get(source_file, []))
+                     for source_file, links in results.get_links_by_file().items()]
+        self.profiler.count('font_faces', sum(len(sheet.faces) for sheet in self.sheets.values()))
+
+        face_pages: Dict[str, int] = {}
+        for page in pages:
+            for label in page['fonts']:
+                face_pages[label] = face_pages.get(label, 0) + 1
+
+        stylesheets = []
+        for sheet in sorted(self.sheets.values(), key=lambda sheet: sheet.stylesheet):
+            if not sheet.faces and not sheet.findings:
+                continue
+            stylesheets.append({
+                'stylesheet': sheet.stylesheet,
+                'faces': [{
+                    'family': face.family,
+                    'weight': face.weight,
+                    'style': face.style,
+                    'display': face.display,
+                    'line_number': face.line_number,
+                    'sources': [source.url for source in face.sources],
+                    'pages': face_pages.get(face.label, 0)
+                } for face in sheet.faces],
+                'findings': [finding.to_dict() for finding in sheet.findings]
+            })
+        hosted_pages: Dict[str, int] = {}
+        for page in pages:
+            for url in set(page['hosted_font_stylesheets']):
+                hosted_pages[url] = hosted_pages.get(url, 0) + 1
+        hosted = [{'url': url, 'missing_display': missing_display, 'pages': hosted_pages.get(url, 0)}
+                  for url, missing_display in sorted(self.hosted.items())]
+
+        all_findings = [finding for sheet in self.sheets.values() for finding in sheet.findings]
+        all_findings += [finding for page in pages for finding in page['findings']]
+        by_rule: Dict[str, int] = {}
+        for finding in all_findings:
+            by_rule[finding.rule] = by_rule.get(finding.rule, 0) + 1
+
+        pages.sort(key=lambda page: (-len(page['findings']), page['page']))
+        return {
+            'summary': {
+                'pages': len(pages),
+                'stylesheets': len(self.sheets),
+                'font_faces': sum(len(sheet.faces) for sheet in self.sheets.values()),
+                'hosted_font_stylesheets': len(self.hosted),
+                'findings': len(all_findings),
+                'by_rule': dict(sorted(by_rule.items(), key=lambda item: -item[1]))
+            },
+            'rules': {rule: {'severity': severity, 'description': description}
+                      for rule, (severity, description) in RULES.items()},
+            'stylesheets': stylesheets,
+            'hosted': hosted,
+            'pages': [dict(page, findings=[finding.to_dict() for finding in page['findings']])
+                      for page in pages]
+        }
+
+
+def format_font_report(report: Dict, top: int = 15) -> str:
+    """Format a web font report for terminal output."""
+    summary = report['summary']
+    lines = [
+        f"Font faces: {summary['font_faces']} in {summary['stylesheets']} stylesheets, "
+        f"{summary['hosted_font_stylesheets']} hosted font stylesheets, {summary['pages']} pages",
+        f"Findings: {summary['findings']}"
+    ]
+    for rule, count in summary['by_rule'].items():
+        lines.append(f"  {rule:32}: {count:4d}  {report['rules'][rule]['description']}")
+
+    for sheet in report['stylesheets'][:top]:
+        lines.append("")
+        lines.append(f"  {sheet['stylesheet']} ({len(sheet['faces'])} faces)")
+        for finding in sheet['findings']:
+            lines.append(f"      line {finding['line_number']}: {finding['rule']} - {finding['message']}")
+    for hosted in report['hosted']:
+        if hosted['missing_display']:
+            lines.append("")
+            lines.append(f"  {hosted['url']} ({hosted['pages']} pages)")
+            lines.append("      missing-font-display - Add &display=swap to the font service URL")
+
+    shown = [page for page in report['pages'] if page['findings']][:top]
+    if shown:
+        lines.append("")
+        lines.append("Pages:")
+        for page in shown:
+            lines.append(f"  {page['page']}")
+            for finding in page['findings']:
+                location = f"line {finding['line_number']}" if finding['line_number'] else "page"
+                lines.append(f"      {location}: {finding['rule']} - {finding['message']}")
+    return "\n".join(lines)
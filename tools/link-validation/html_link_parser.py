@@ -16,6 +16,13 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Set, Optional, Tuple
 from urllib.parse import urlparse
 from pathlib import Path
+from .asset_resolver import AssetResolver
+from .css_scanner import CSSScanner
+from .js_scanner import JS_SCRIPT_TYPES, JSScanner, scan_js_text
+from .parse_cache import ParseCache, content_digest, decode_attributes, encode_attributes, file_source
+from .perf_lint import PerfFinding, PerfLinter
+from .profiling import Profiler, get_profiler
+from .srcset import SRCSET_TAG, parse_srcset
 
 
 @dataclass
@@ -33,6 +40,16 @@ class LinkInfo:
     error_message: str = ""
 
 
+@dataclass
+class InlineBlock:
+    """Content of an inline <script> or <style> block found in HTML."""
+    tag: str
+    source_file: str
+    line_number: int
+    content: str
+    attributes: Dict[str, str]
+
+
 @dataclass
 class ParseResults:
     """Results from parsing HTML files for links."""
@@ -44,6 +61,21 @@ class ParseResults:
     anchor_links: List[LinkInfo] = field(default_factory=list)
     email_links: List[LinkInfo] = field(default_factory=list)
     social_links: List[LinkInfo] = field(default_factory=list)
+    inline_blocks: List[InlineBlock] = field(default_factory=list)
+    perf_findings: List[PerfFinding] = field(default_factory=list)
+    
+    def extend(self, other: 'ParseResults'):
+        """Merge another set of results into this one."""
+        self.inline_blocks.extend(other.inline_blocks)
+        self.perf_findings.extend(other.perf_findings)
+        self.links.extend(other.links)
+        self.navigation_links.extend(other.navigation_links)
+        self.content_links.extend(other.content_links)
+        self.asset_links.extend(other.asset_links)
+        self.external_links.extend(other.external_links)
+        self.anchor_links.extend(other.anchor_links)
+        self.email_links.extend(other.email_links)
+        self.social_links.extend(other.social_links)
     
     def get_by_category(self, category: str) -> List[LinkInfo]:
         """Get links by category."""
@@ -53,6 +85,13 @@ class ParseResults:
         """Get set of unique href values."""
         return {link.href for link in self.links}
     
+    def get_links_by_file(self) -> Dict[str, List[LinkInfo]]:
+        """Group links by the file they were found in, preserving order."""
+        by_file = {}
+        for link in self.links:
+            by_file.setdefault(link.source_file, []).append(link)
+        return by_file
+    
     def get_external_domains(self) -> Set[str]:
         """Get set of external domains referenced."""
         domains = set()
@@ -66,6 +105,23 @@ class ParseResults:
         return domains
 
 
+def discover_html_files(project_root: str) -> List[str]:
+    """Find root-level HTML files and every HTML file under pages/, in stable order."""
+    html_files = []
+    
+    # Root level HTML files
+    for file in sorted(Path(project_root).glob('*.html')):
+        html_files.append(str(file))
+        
+    # Pages directory HTML files, including section subdirectories
+    pages_dir = Path(project_root) / 'pages'
+    if pages_dir.exists():
+        for file in sorted(pages_dir.rglob('*.html')):
+            html_files.append(str(file))
+    
+    return html_files
+
+
 class ALCBFHTMLParser(HTMLParser):
     """HTML parser specialized for A Lo Cubano Boulder Fest website structure."""
     
@@ -78,8 +134,13 @@ class ALCBFHTMLParser(HTMLParser):
         self.in_header = False
         self.in_footer = False
         self.in_main = False
+        self.in_picture = False
         self.current_context = ""
         self.tag_stack = []
+        self.inline_blocks = []
+        self._inline_block = None
+        self._inline_chunks = []
+        self.perf_lint = PerfLinter(file_path)
         
         # Patterns for different link types
         self.social_domains = {
@@ -98,6 +159,7 @@ class ALCBFHTMLParser(HTMLParser):
         """Handle opening tags, extract links and track context."""
         attrs_dict = dict(attrs)
         self.tag_stack.append(tag)
+        self.perf_lint.start_tag(tag, attrs_dict, self.getpos()[0])
         
         # Update context flags
         if tag in ['nav', 'navigation']:
@@ -108,6 +170,19 @@ class ALCBFHTMLParser(HTMLParser):
             self.in_footer = True
         elif tag == 'main':
             self.in_main = True
+        elif tag == 'picture':
+            self.in_picture = True
+        
+        # Capture inline script and style content for the script scanner and inline audit
+        if (tag == 'script' and 'src' not in attrs_dict) or tag == 'style':
+            self._inline_block = InlineBlock(
+                tag=tag,
+                source_file=self.file_path,
+                line_number=self.getpos()[0],
+                content="",
+                attributes=attrs_dict.copy()
+            )
+            self._inline_chunks = []
             
         # Extract href links
         if 'href' in attrs_dict:
@@ -137,6 +212,24 @@ class ALCBFHTMLParser(HTMLParser):
             )
             self.links.append(link_info)
             
+        # Extract each srcset candidate (responsive images)
+        if tag in ('img', 'source') and attrs_dict.get('srcset'):
+            context = self._get_current_context()
+            for candidate in parse_srcset(attrs_dict['srcset']):
+                attributes = {'element': tag, 'descriptor': candidate.descriptor}
+                for name in ('sizes', 'width', 'type', 'media'):
+                    if attrs_dict.get(name):
+                        attributes[name] = attrs_dict[name]
+                self.links.append(LinkInfo(
+                    href=candidate.url,
+                    text=attrs_dict.get('alt', '') or '',
+                    source_file=self.file_path,
+                    line_number=self.current_line,
+                    tag=SRCSET_TAG,
+                    attributes=attributes,
+                    context=context
+                ))
+            
         # Extract action attributes from forms
         if tag == 'form' and 'action' in attrs_dict:
             action = attrs_dict['action']
@@ -155,6 +248,14 @@ class ALCBFHTMLParser(HTMLParser):
         """Handle closing tags, update context."""
         if self.tag_stack:
             self.tag_stack.pop()
+        self.perf_lint.end_tag(tag)
+        
+        if self._inline_block is not None and tag == self._inline_block.tag:
+            self._inline_block.content = "".join(self._inline_chunks)
+            if self._inline_block.content.strip():
+                self.inline_blocks.append(self._inline_block)
+            self._inline_block = None
+            self._inline_chunks = []
             
         # Update context flags
         if tag in ['nav', 'navigation']:
@@ -165,9 +266,14 @@ class ALCBFHTMLParser(HTMLParser):
             self.in_footer = False
         elif tag == 'main':
             self.in_main = False
+        elif tag == 'picture':
+            self.in_picture = False
     
     def handle_data(self, data: str):
         """Handle text data, update link text for most recent links."""
+        if self._inline_block is not None:
+            self._inline_chunks.append(data)
+        
         clean_data = data.strip()
         if clean_data and self.links:
             # Update text for the most recent link if it's empty
@@ -190,6 +296,8 @@ class ALCBFHTMLParser(HTMLParser):
             contexts.append("main")
         if self.in_footer:
             contexts.append("footer")
+        if self.in_picture:
+            contexts.append("picture")
             
         # Add tag context
         if self.tag_stack:
@@ -302,20 +410,53 @@ class LinkCategorizer:
 class HTMLLinkExtractor:
     """Main interface for extracting and analyzing links from HTML files."""
     
-    def __init__(self, project_root: str = None):
+    def __init__(self, project_root: str = None, profiler: Optional[Profiler] = None,
+                 use_cache: bool = True):
         self.project_root = project_root or os.getcwd()
         self.categorizer = LinkCategorizer()
+        self.profiler = get_profiler(profiler)
+        self.use_cache = use_cache
+        self.parse_cache: Optional[ParseCache] = None
+        self._css_scanner = None
+        self._js_scanner = None
     
     def parse_file(self, file_path: str) -> ParseResults:
         """Parse a single HTML file and return categorized links."""
+        profiler = self.profiler
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            with profiler.file(file_path):
+                with profiler.phase('read'):
+                    with open(file_path, 'rb') as f:
+                        data = f.read()
+                        source = file_source(file_path, os.fstat(f.fileno()))
                 
-            parser = ALCBFHTMLParser(file_path)
-            parser.feed(content)
+                cached = None
+                if self.parse_cache is not None:
+                    with profiler.phase('parse_cache'):
+                        digest = content_digest(data)
+                        cached = self.parse_cache.get(digest, source)
+                
+                if cached is not None:
+                    links, inline_blocks, findings = self._restore_cached(file_path, *cached)
+                else:
+                    with profiler.phase('parse'):
+                        parser = ALCBFHTMLParser(file_path)
+                        parser.feed(data.decode('utf-8'))
+                        findings = parser.perf_lint.finish()
+                    links, inline_blocks = parser.links, parser.inline_blocks
+                    if self.parse_cache is not None:
+                        self.parse_cache.put(digest, *self._cache_records(links, inline_blocks, findings),
+                                             source=source)
+                
+                with profiler.phase('categorize'):
+                    results = self.categorizer.categorize_all(links)
+                results.inline_blocks = inline_blocks
+                results.perf_findings = findings
             
-            return self.categorizer.categorize_all(parser.links)
+            profiler.count('files_parsed')
+            profiler.count('links_extracted', len(results.links))
+            profiler.count('perf_findings', len(findings))
+            return results
             
         except Exception as e:
             # Return empty results with error info
@@ -329,38 +470,173 @@ class HTMLLinkExtractor:
             return results
     
     def parse_project(self) -> ParseResults:
-        """Parse all HTML files in the project."""
+        """Parse all HTML files in the project.
+        
+        Unchanged files are restored from the content-addressed parse cache
+        instead of being parsed again; new entries are merged into the cache
+        afterwards, pruning those whose source file was deleted or changed.
+        """
         all_results = ParseResults()
         
         # Find all HTML files
-        html_files = []
+        with self.profiler.phase('discover'):
+            html_files = discover_html_files(self.project_root)
         
-        # Root level HTML files
-        for file in Path(self.project_root).glob('*.html'):
-            html_files.append(str(file))
-            
-        # Pages directory HTML files
-        pages_dir = Path(self.project_root) / 'pages'
-        if pages_dir.exists():
-            for file in pages_dir.glob('*.html'):
-                html_files.append(str(file))
+        if self.use_cache and self.parse_cache is None:
+            self.parse_cache = ParseCache(self.project_root, profiler=self.profiler)
         
         # Parse each file
         for file_path in html_files:
             file_results = self.parse_file(file_path)
             
             # Merge results
-            all_results.links.extend(file_results.links)
-            all_results.navigation_links.extend(file_results.navigation_links)
-            all_results.content_links.extend(file_results.content_links)
-            all_results.asset_links.extend(file_results.asset_links)
-            all_results.external_links.extend(file_results.external_links)
-            all_results.anchor_links.extend(file_results.anchor_links)
-            all_results.email_links.extend(file_results.email_links)
-            all_results.social_links.extend(file_results.social_links)
+            all_results.extend(file_results)
+        
+        if self.parse_cache is not None:
+            try:
+                self.parse_cache.save()
+            except OSError as e:
+                print(f"Warning: could not write parse cache: {e}")
         
         return all_results
     
+    @staticmethod
+    def _cache_records(links: List[LinkInfo], inline_blocks: List[InlineBlock],
+                       findings: List[PerfFinding]) -> Tuple[List, List, List]:
+        link_records = [
+            (link.href, link.text, link.line_number, link.tag, encode_attributes(link.attributes), link.context)
+            for link in links
+        ]
+        block_records = [
+            (block.tag, block.line_number, block.content, encode_attributes(block.attributes))
+            for block in inline_blocks
+        ]
+        finding_records = [
+            (finding.rule, finding.line_number, finding.target, finding.message)
+            for finding in findings
+        ]
+        return link_records, block_records, finding_records
+    
+    @staticmethod
+    def _restore_cached(file_path: str, link_records: List, block_records: List,
+                        finding_records: List) -> Tuple[List, List, List]:
+        links = [
+            LinkInfo(href=href, text=text, source_file=file_path, line_number=line,
+                     tag=tag, attributes=decode_attributes(attributes), context=context)
+            for href, text, line, tag, attributes, context in link_records
+        ]
+        inline_blocks = [
+            InlineBlock(tag=tag, source_file=file_path, line_number=line,
+                        content=content, attributes=decode_attributes(attributes))
+            for tag, line, content, attributes in block_records
+        ]
+        findings = [
+            PerfFinding(rule=rule, source_file=file_path, line_number=line, target=target, message=message)
+            for rule, line, target, message in finding_records
+        ]
+        return links, inline_blocks, findings
+    
+    def parse_stylesheets(self, results: Optional[ParseResults] = None) -> ParseResults:
+        """Extract url() and @import references from stylesheets.
+        
+        Scans every stylesheet under css/ plus any stylesheet the given page
+        results load, following @import chains. Each sheet is scanned once and
+        references keep the stylesheet as their source file, so relative URLs
+        resolve against the stylesheet's own location.
+        """
+        resolver = self.css_scanner.resolver
+        stylesheets = []
+        
+        with self.profiler.phase('discover'):
+            css_dir = Path(self.project_root) / 'css'
+            if css_dir.exists():
+                stylesheets.extend(str(file) for file in sorted(css_dir.rglob('*.css')))
+            
+            if results is not None:
+                for link in results.links:
+                    if link.tag == 'link' and 'stylesheet' in link.attributes.get('rel', '').lower().split():
+                        target = resolver.resolve(link.href, link.source_file)
+                        if target is not None:
+                            stylesheets.append(str(target))
+        
+        self.css_scanner.scan_files(stylesheets)
+        
+        links = []
+        for stylesheet, references in self.css_scanner.scanned.items():
+            for reference in references:
+                links.append(LinkInfo(
+                    href=reference.href,
+                    text="",
+                    source_file=stylesheet,
+                    line_number=reference.line_number,
+                    tag=f"css-{reference.kind}",
+                    attributes={},
+                    context="stylesheet"
+                ))
+        
+        with self.profiler.phase('categorize'):
+            return self.categorizer.categorize_all(links)
+    
+    def parse_scripts(self, results: Optional[ParseResults] = None) -> ParseResults:
+        """Extract URL references from JavaScript modules and inline scripts.
+        
+        Scans every module under js/ once, plus the inline <script> blocks
+        captured while parsing the given page results. References built at
+        runtime keep only their static prefix and are marked with a 'dynamic'
+        attribute.
+        """
+        scripts = []
+        with self.profiler.phase('discover'):
+            js_dir = Path(self.project_root) / 'js'
+            if js_dir.exists():
+                scripts.extend(str(file) for file in sorted(js_dir.rglob('*.js')))
+                scripts.extend(str(file) for file in sorted(js_dir.rglob('*.mjs')))
+        
+        self.js_scanner.scan_files(scripts)
+        
+        links = []
+        for script, references in self.js_scanner.scanned.items():
+            links.extend(self._script_links(script, references))
+        
+        if results is not None:
+            with self.profiler.phase('js_scan'):
+                for block in results.inline_blocks:
+                    if block.tag != 'script' or block.attributes.get('type', '').lower() not in JS_SCRIPT_TYPES:
+                        continue
+                    references = scan_js_text(block.content, line_offset=block.line_number - 1)
+                    links.extend(self._script_links(block.source_file, references))
+        
+        with self.profiler.phase('categorize'):
+            return self.categorizer.categorize_all(links)
+    
+    def _script_links(self, source_file: str, references) -> List[LinkInfo]:
+        return [
+            LinkInfo(
+                href=reference.href,
+                text="",
+                source_file=source_file,
+                line_number=reference.line_number,
+                tag=f"js-{reference.kind}",
+                attributes={'dynamic': 'true'} if reference.dynamic else {},
+                context="script"
+            )
+            for reference in references
+        ]
+    
+    @property
+    def js_scanner(self) -> JSScanner:
+        """Script scanner shared across calls so each module is scanned once."""
+        if self._js_scanner is None:
+            self._js_scanner = JSScanner(profiler=self.profiler)
+        return self._js_scanner
+    
+    @property
+    def css_scanner(self) -> CSSScanner:
+        """Stylesheet scanner shared across calls so each sheet is scanned once."""
+        if self._css_scanner is None:
+            self._css_scanner = CSSScanner(AssetResolver(self.project_root), profiler=self.profiler)
+        return self._css_scanner
+    
     def get_link_analysis(self, results: ParseResults) -> Dict[str, any]:
         """Generate comprehensive link analysis."""
         analysis = {
@@ -386,7 +662,7 @@ class HTMLLinkExtractor:
         """Export links to CSV file for analysis."""
         import csv
         
-        with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
+        with self.profiler.phase('report_write'), open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
             fieldnames = [
                 'href', 'text', 'source_file', 'line_number', 'tag',
                 'category', 'context', 'is_valid', 'target', 'rel',
@@ -399,7 +675,7 @@ class HTMLLinkExtractor:
                 writer.writerow({
                     'href': link.href,
                     'text': link.text,
-                    'source_file': os.path.basename(link.source_file),
+                    'source_file': os.path.relpath(link.source_file, self.project_root),
                     'line_number': link.line_number,
                     'tag': link.tag,
                     'category': link.category,
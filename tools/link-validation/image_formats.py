@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Modern Image Format Report
+
+Finds JPEG, PNG and GIF images that pages serve where WebP or AVIF would be
+smaller, and estimates the bytes each switch saves per page and across the site.
+
+For every local ``<img>``/``<source>`` reference (``srcset`` candidates included)
+the analyzer checks:
+
+- the file's real format, dimensions and alpha, read from its header only
+- whether a ``.webp``/``.avif`` sibling already exists, next to the file or in a
+  configured variant directory (``images/hero-optimized/desktop/`` for
+  ``images/hero/``); the saving is then the exact size difference
+- whether the reference sits inside ``<picture>``, where modern sources are
+  expected to be served already
+
+Without a sibling, the saving is estimated from configured size ratios per
+source format, bounded below by a bits-per-pixel floor computed from the header
+dimensions, so images that are already heavily compressed are not over-credited.
+Nothing is decoded; headers are cached per file in ``image_headers.json``.
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .asset_resolver import AssetResolver, is_local_reference
+from .html_link_parser import ParseResults
+from .image_headers import ImageHeader, ImageHeaderReader
+from .profiling import Profiler, get_profiler
+
+
+IMAGE_TAGS = {'img', 'source', 'srcset'}
+LEGACY_FORMATS = ('jpeg', 'png', 'gif')
+MODERN_FORMATS = ('avif', 'webp')
+MODERN_EXTENSIONS = {'avif': '.avif', 'webp': '.webp'}
+
+DEFAULT_RATIOS = {
+    'jpeg': {'webp': 0.70, 'avif': 0.50},
+    'png': {'webp': 0.74, 'avif': 0.60},
+    'gif': {'webp': 0.60, 'avif': 0.50},
+}
+DEFAULT_MIN_BITS_PER_PIXEL = {'webp': 0.6, 'avif': 0.4}
+DEFAULT_MIN_IMAGE_BYTES = 2048
+
+
+class ImageOpportunity:
+    """Format analysis of one image file."""
+
+    def __init__(self, path: str, size: int, header: Optional[ImageHeader]):
+        self.path = path
+        self.size = size
+        self.header = header
+        self.status = 'convert'
+        self.best_format: Optional[str] = None
+        self.best_size = size
+        self.siblings: Dict[str, Dict] = {}
+        self.pages: List[str] = []
+        self.in_picture_pages: List[str] = []
+
+    @property
+    def savings(self) -> int:
+        return max(0, self.size - self.best_size) if self.status in ('sibling', 'convert') else 0
+
+    def to_dict(self) -> Dict:
+        header = self.header
+        return {
+            'path': self.path,
+            'size': self.size,
+            'format': header.format if header else None,
+            'dimensions': [header.width, header.height] if header else None,
+            'status': self.status,
+            'best_format': self.best_format,
+            'estimated_size': self.best_size,
+            'savings': self.savings,
+            'site_savings': self.savings * len(self.pages),
+            'siblings': self.siblings,
+            'pages': self.pages,
+            'in_picture_pages': self.in_picture_pages
+        }
+
+
+class ModernFormatAnalyzer:
+    """Estimates WebP/AVIF savings for the images pages reference."""
+
+    def __init__(self, project_root: str, profiler: Optional[Profiler] = None,
+                 config: Optional[Dict] = None, use_cache: bool = True):
+        self.project_root = Path(project_root).resolve()
+        self.profiler = get_profiler(profiler)
+        self.resolver = AssetResolver(self.project_root)
+        self.headers = ImageHeaderReader(self.project_root, profiler=self.profiler, use_cache=use_cache)
+
+        settings = (config or {}).get('modern_image_formats', {})
+        self.ratios = settings.get('estimated_ratios', DEFAULT_RATIOS)
+        self.min_bits_per_pixel = settings.get('min_bits_per_pixel', DEFAULT_MIN_BITS_PER_PIXEL)
+        self.min_image_bytes = settings.get('min_image_bytes', DEFAULT_MIN_IMAGE_BYTES)
+        self.variant_directories = settings.get('variant_directories', {})
+        self._images: Dict[Path, ImageOpportunity] = {}
+
+    def _sibling_candidates(self, path: Path) -> List[Tuple[str, Path]]:
+        """Possible WebP/AVIF versions: same directory and stem, then variant directories."""
+        relative = self.resolver.relative(path)
+        stems = [path.with_suffix('')]
+        for source, targets in self.variant_directories.items():
+            if relative.startswith(source):
+                rest = Path(relative[len(source):]).with_suffix('')
+                stems.extend(self.project_root / target / rest for target in targets)
+        return [(image_format, stem.with_name(stem.name + extension))
+                for stem in stems for image_format, extension in MODERN_EXTENSIONS.items()]
+
+    def analyze_file(self, path: Path) -> ImageOpportunity:
+        """Format, siblings and estimated savings for one image file (memoized)."""
+        opportunity = self._images.get(path)
+        if opportunity is not None:
+            return opportunity
+
+        header = self.headers.read(path)
+        opportunity = ImageOpportunity(self.resolver.relative(path), path.stat().st_size, header)
+        self._images[path] = opportunity
+
+        image_format = header.format if header else None
+        if image_format not in LEGACY_FORMATS:
+            opportunity.status = 'modern' if image_format in MODERN_FORMATS else 'unknown'
+            return opportunity
+        if opportunity.size < self.min_image_bytes:
+            opportunity.status = 'too-small'
+            return opportunity
+
+        for sibling_format, candidate in self._sibling_candidates(path):
+            if sibling_format in opportunity.siblings or not self.resolver.is_file(candidate):
+                continue
+            opportunity.siblings[sibling_format] = {
+                'path': self.resolver.relative(candidate),
+                'size': candidate.stat().st_size
+            }
+
+        if opportunity.siblings:
+            opportunity.status = 'sibling'
+            best_format, best = min(opportunity.siblings.items(), key=lambda item: item[1]['size'])
+            opportunity.best_format, opportunity.best_size = best_format, best['size']
+            return opportunity
+
+        estimates = {
+            target: self._estimate(opportunity.size, header, image_format, target) for target in MODERN_FORMATS
+        }
+        opportunity.best_format, opportunity.best_size = min(estimates.items(), key=lambda item: item[1])
+        return opportunity
+
+    def _estimate(self, size: int, header: ImageHeader, source: str, target: str) -> int:
+        ratio = self.ratios.get(source, {}).get(target, 1.0)
+        floor = int(header.pixels * self.min_bits_per_pixel.get(target, 0) / 8)
+        return min(size, max(int(size * ratio), floor))
+
+    def analyze(self, results: ParseResults) -> Dict:
+        """Per-image and per-page savings for every image the pages reference."""
+        pages: Dict[str, Dict[str, ImageOpportunity]] = {}
+        with self.profiler.phase('image_formats'):
+            for link in results.links:
+                if link.tag not in IMAGE_TAGS or not is_local_reference(link.href):
+                    continue
+                target = self.resolver.resolve(link.href, link.source_file)
+                if target is None:
+                    continue
+                opportunity = self.analyze_file(target)
+                page = os.path.relpath(link.source_file, self.project_root)
+                if 'picture' in link.context.split('|') and opportunity.status in ('sibling', 'convert'):
+                    if page not in opportunity.in_picture_pages:
+                        opportunity.in_picture_pages.append(page)
+                    continue
+                page_images = pages.setdefault(page, {})
+                if opportunity.path not in page_images:
+                    page_images[opportunity.path] = opportunity
+                    opportunity.pages.append(page)
+
+        self.headers.save()
+        return self._build_report(pages)
+
+    def _build_report(self, pages: Dict[str, Dict[str, ImageOpportunity]]) -> Dict:
+        images = sorted(self._images.values(), key=lambda image: (-image.savings * len(image.pages), image.path))
+        opportunities = [image for image in images if image.savings and image.pages]
+
+        page_rows = []
+        for page, page_images in pages.items():
+            legacy = [image for image in page_images.values() if image.savings]
+            page_rows.append({
+                'page': page,
+                'images': len(page_images),
+                'legacy_images': len(legacy),
+                'bytes': sum(image.size for image in page_images.values()),
+                'savings': sum(image.savings for image in legacy),
+                'top_images': [image.path for image in sorted(legacy, key=lambda image: -image.savings)[:5]]
+            })
+        page_rows.sort(key=lambda row: (-row['savings'], row['page']))
+
+        statuses: Dict[str, int] = {}
+        for image in images:
+            statuses[image.status] = statuses.get(image.status, 0) + 1
+
+        return {
+            'summary': {
+                'images_referenced': len(images),
+                'by_status': statuses,
+                'opportunities': len(opportunities),
+                'with_existing_siblings': sum(1 for image in opportunities if image.status == 'sibling'),
+                'served_in_picture': sum(1 for image in images if image.in_picture_pages),
+                'unique_savings': sum(image.savings for image in opportunities),
+                'page_view_savings': sum(row['savings'] for row in page_rows)
+            },
+            'images': [image.to_dict() for image in opportunities],
+            'pages': page_rows
+        }
+
+
+def format_image_report(report: Dict, top: int = 15) -> str:
+    """Format a modern image format report for terminal output."""
+    summary = report['summary']
+    lines = [
+        f"Images referenced: {summary['images_referenced']} "
+        f"({', '.join(f'{count} {status}' for status, count in sorted(summary['by_status'].items()))})",
+        f"Opportunities: {summary['opportunities']} "
+        f"({summary['with_existing_siblings']} already have a WebP/AVIF sibling)",
+        f"Savings: {summary['unique_savings'] / 1024:.1f}K across unique files, "
+        f"{summary['page_view_savings'] / 1024:.1f}K summed over one view of every page",
+    ]
+
+    if report['images']:
+        lines.append("")
+        lines.append("Top images (savings x pages):")
+        for image in report['images'][:top]:
+            source = f"use {image['siblings'][image['best_format']]['path']}" if image['status'] == 'sibling' \
+                else f"convert to {image['best_format']} (estimate)"
+            lines.append(f"  {image['site_savings'] / 1024:9.1f}K  {image['path']} "
+                         f"({image['size'] / 1024:.0f}K, {len(image['pages'])} pages) -> {source}")
+
+    shown = [row for row in report['pages'] if row['savings']][:top]
+    if shown:
+        lines.append("")
+        lines.append("Pages:")
+        for row in shown:
+            lines.append(f"  {row['savings'] / 1024:9.1f}K  {row['page']} "
+                         f"({row['legacy_images']}/{row['images']} images)")
+    return "\n".join(lines)
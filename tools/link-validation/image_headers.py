@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Image Header Reader
+
+Reads format, dimensions and alpha from the first bytes of PNG, JPEG, GIF, WebP
+and AVIF files without decoding any pixels. Each format keeps its size in a
+fixed place near the start of the file:
+
+- PNG: the IHDR chunk right after the signature
+- GIF: the logical screen descriptor after the signature
+- JPEG: the first SOFn segment; segments before it are skipped by their length
+  fields, so large EXIF blocks are seeked over rather than read
+- WebP: the VP8 / VP8L / VP8X chunk header
+- AVIF: the ``ispe`` property inside ``meta/iprp/ipco`` boxes
+
+The format is taken from the file's magic bytes, not its extension, so a PNG
+saved as ``.jpg`` is reported as PNG. Results are kept in a stat-keyed cache
+shared by every analysis that needs image dimensions.
+"""
+
+import struct
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import BinaryIO, Dict, Optional, Tuple, Union
+
+from .profiling import Profiler, get_profiler
+from .stat_cache import StatKeyedCache
+
+
+# Bytes read up front; enough for every format except JPEG with large metadata
+HEAD_BYTES = 512
+
+# Upper bound on bytes scanned for AVIF boxes
+AVIF_SCAN_BYTES = 64 * 1024
+
+_JPEG_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+_AVIF_CONTAINERS = {b'meta': 4, b'iprp': 0, b'ipco': 0}  # box type -> header bytes before children
+
+
+@dataclass
+class ImageHeader:
+    """Format and dimensions read from an image file's header."""
+    format: str  # 'png', 'jpeg', 'gif', 'webp' or 'avif'
+    width: int
+    height: int
+    has_alpha: Optional[bool] = None
+    progressive: Optional[bool] = None
+    animated: Optional[bool] = None
+
+    @property
+    def pixels(self) -> int:
+        return self.width * self.height
+
+
+def _png(head: bytes) -> Optional[ImageHeader]:
+    if len(head) < 26 or head[12:16] != b'IHDR':
+        return None
+    width, height = struct.unpack('>II', head[16:24])
+    color_type = head[25]
+    return ImageHeader('png', width, height, has_alpha=color_type in (4, 6))
+
+
+def _gif(head: bytes) -> Optional[ImageHeader]:
+    if len(head) < 10:
+        return None
+    width, height = struct.unpack('<HH', head[6:10])
+    return ImageHeader('gif', width, height)
+
+
+def _webp(head: bytes) -> Optional[ImageHeader]:
+    chunk = head[12:16]
+    if chunk == b'VP8 ' and len(head) >= 30 and head[23:26] == b'\x9d\x01\x2a':
+        width, height = struct.unpack('<HH', head[26:30])
+        return ImageHeader('webp', width & 0x3FFF, height & 0x3FFF, has_alpha=False, animated=False)
+    if chunk == b'VP8L' and len(head) >= 25 and head[20] == 0x2F:
+        bits = int.from_bytes(head[21:25], 'little')
+        return ImageHeader('webp', (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1,
+                           has_alpha=bool(bits >> 28 & 1), animated=False)
+    if chunk == b'VP8X' and len(head) >= 30:
+        flags = head[20]
+        width = int.from_bytes(head[24:27], 'little') + 1
+        height = int.from_bytes(head[27:30], 'little') + 1
+        return ImageHeader('webp', width, height, has_alpha=bool(flags & 0x10), animated=bool(flags & 0x02))
+    return None
+
+
+def _jpeg(f: BinaryIO) -> Optional[ImageHeader]:
+    f.seek(2)
+    while True:
+        byte = f.read(1)
+        while byte and byte != b'\xff':
+            byte = f.read(1)
+        while byte == b'\xff':  # Fill bytes
+            byte = f.read(1)
+        if not byte:
+            return None
+        marker = byte[0]
+        if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7:
+            continue  # Markers without a length
+        if marker == 0xD9:
+            return None
+        length_bytes = f.read(2)
+        if len(length_bytes) < 2:
+            return None
+        length = struct.unpack('>H', length_bytes)[0]
+        if marker in _JPEG_SOF_MARKERS:
+            segment = f.read(5)
+            if len(segment) < 5:
+                return None
+            height, width = struct.unpack('>HH', segment[1:5])
+            return ImageHeader('jpeg', width, height, has_alpha=False, progressive=marker == 0xC2)
+        f.seek(length - 2, 1)
+
+
+def _avif_boxes(data: bytes, start: int, end: int):
+    """Yield (type, payload start, box end) for ISOBMFF boxes in a byte range."""
+    position = start
+    while position + 8 <= end:
+        size, box_type = struct.unpack('>I4s', data[position:position + 8])
+        header = 8
+        if size == 1 and position + 16 <= end:
+            size = struct.unpack('>Q', data[position + 8:position + 16])[0]
+            header = 16
+        elif size == 0:
+            size = end - position
+        if size < header:
+            return
+        yield box_type, position + header, min(position + size, end)
+        position += size
+
+
+def _avif(data: bytes) -> Optional[ImageHeader]:
+    dimensions = []
+    has_alpha = False
+
+    def walk(start: int, end: int):
+        nonlocal has_alpha
+        for box_type, payload, box_end in _avif_boxes(data, start, end):
+            if box_type in _AVIF_CONTAINERS:
+                walk(payload + _AVIF_CONTAINERS[box_type], box_end)
+            elif box_type == b'ispe' and box_end - payload >= 12:
+                dimensions.append(struct.unpack('>II', data[payload + 4:payload + 12]))
+            elif box_type == b'auxC' and b'alpha' in data[payload:box_end]:
+                has_alpha = True
+
+    walk(0, len(data))
+    if not dimensions:
+        return None
+    # The primary image is the largest; alpha planes and thumbnails are smaller or equal
+    width, height = max(dimensions, key=lambda size: size[0] * size[1])
+    return ImageHeader('avif', width, height, has_alpha=has_alpha, animated=data[8:12] == b'avis')
+
+
+def read_image_header(path: Union[str, Path]) -> Optional[ImageHeader]:
+    """Read an image's header, or None when the format is unknown or truncated."""
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(HEAD_BYTES)
+            if head.startswith(b'\x89PNG\r\n\x1a\n'):
+                return _png(head)
+            if head[:6] in (b'GIF87a', b'GIF89a'):
+                return _gif(head)
+            if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+                return _webp(head)
+            if head[:3] == b'\xff\xd8\xff':
+                return _jpeg(f)
+            if head[4:8] == b'ftyp' and head[8:12] in (b'avif', b'avis', b'mif1', b'msf1'):
+                if len(head) == HEAD_BYTES:
+                    head += f.read(AVIF_SCAN_BYTES - HEAD_BYTES)
+                return _avif(head)
+    except (OSError, struct.error):
+        return None
+    return None
+
+
+class ImageHeaderReader:
+    """Memoized, disk-cached image header reads."""
+
+    def __init__(self, project_root: Union[str, Path], profiler: Optional[Profiler] = None,
+                 use_cache: bool = True):
+        self.profiler = get_profiler(profiler)
+        self.cache = StatKeyedCache(project_root, 'image_headers') if use_cache else None
+        self._headers: Dict[Path, Optional[ImageHeader]] = {}
+
+    def read(self, path: Path) -> Optional[ImageHeader]:
+        """Header for an image file, reading the file only when the cache is stale."""
+        if path in self._headers:
+            return self._headers[path]
+
+        header = None
+        try:
+            stat = path.stat()
+        except OSError:
+            self._headers[path] = None
+            return None
+
+        cached = self.cache.get(path, stat) if self.cache else None
+        if cached is not None:
+            header = ImageHeader(**cached['header']) if cached.get('header') else None
+        else:
+            with self.profiler.phase('image_headers'):
+                header = read_image_header(path)
+            self.profiler.count('image_headers_read')
+            if self.cache:
+                self.cache.set(path, {'header': asdict(header) if header else None}, stat)
+
+        self._headers[path] = header
+        return header
+
+    def dimensions(self, path: Path) -> Optional[Tuple[int, int]]:
+        header = self.read(path)
+        return (header.width, header.height) if header else None
+
+    def save(self):
+        if self.cache:
+            self.cache.save()
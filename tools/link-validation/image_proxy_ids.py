@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Image Proxy ID Index
+
+``/api/image-proxy/<id>`` links name Google Drive file IDs. The URL pattern
+alone says nothing about whether the ID exists, so a typo only shows up as a
+404 and a slow proxy round trip at runtime. This index holds the IDs listed in
+local manifests such as ``.gallery-sync-cache.json``, written by
+``scripts/sync-gallery-images.js`` (its ``files`` object is keyed by Drive ID),
+so links can be checked offline.
+
+The manifests are compiled into one binary file under the link validation
+cache::
+
+    header | source fingerprint | bloom filter bits | ID index | ID blob
+
+The Bloom filter answers most unknown IDs without touching the ID table; a
+positive answer is confirmed by binary search over the sorted ID index, so
+false positives never pass. The file is memory-mapped, so opening an index of
+millions of IDs costs a header read. It is rebuilt only when a manifest's path,
+mtime or size changes.
+
+Supported manifests: JSON objects with a ``files`` object keyed by ID, JSON
+lists of IDs or of objects with an ``id``, any other JSON (every ``id`` string
+found is taken), and plain text with one ID per line.
+"""
+
+import hashlib
+import json
+import math
+import mmap
+import re
+import struct
+from pathlib import Path
+from typing import Iterable, List, Optional, Set, Union
+
+from .profiling import Profiler, get_profiler
+from .stat_cache import atomic_write_bytes, get_cache_dir
+
+
+MAGIC = b'ALPI'
+FORMAT_VERSION = 1
+
+DEFAULT_MANIFESTS = ['.gallery-sync-cache.json']
+DEFAULT_FALSE_POSITIVE_RATE = 0.01
+
+FINGERPRINT_SIZE = 16
+
+_HEADER = struct.Struct('<4sHHQQI')  # magic, format, hash count, bit count, ID count, blob size
+_ID = struct.Struct('<II')           # offset, length in the blob
+
+# Drive file IDs, as accepted by the image proxy route
+ID_PATTERN = re.compile(r'^[a-zA-Z0-9_-]{10,50}$')
+
+
+def manifest_ids(path: Path) -> Set[str]:
+    """IDs listed by one manifest file."""
+    if path.suffix.lower() != '.json':
+        with open(path, 'r', encoding='utf-8') as f:
+            return {line.strip() for line in f if ID_PATTERN.match(line.strip())}
+
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, dict) and isinstance(data.get('files'), dict):
+        return {key for key in data['files'] if ID_PATTERN.match(key)}
+    if isinstance(data, list) and all(isinstance(item, str) for item in data):
+        return {item for item in data if ID_PATTERN.match(item)}
+
+    ids = set()
+    pending = [data]
+    while pending:
+        value = pending.pop()
+        if isinstance(value, dict):
+            found = value.get('id')
+            if isinstance(found, str) and ID_PATTERN.match(found):
+                ids.add(found)
+            pending.extend(value.values())
+        elif isinstance(value, list):
+            pending.extend(value)
+    return ids
+
+
+def _bit_positions(key: bytes, hash_count: int, bit_count: int) -> Iterable[int]:
+    """Double hashing: hash_count bit positions from one 128-bit digest."""
+    digest = hashlib.blake2b(key, digest_size=16).digest()
+    first = int.from_bytes(digest[:8], 'little')
+    second = int.from_bytes(digest[8:], 'little') | 1
+    return ((first + index * second) % bit_count for index in range(hash_count))
+
+
+def build_index(ids: Iterable[str], fingerprint: bytes,
+                false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE) -> bytes:
+    """Serialize IDs as a Bloom filter plus a sorted exact index."""
+    encoded = sorted({value.encode('utf-8') for value in ids})
+    count = len(encoded)
+    bit_count = max(64, math.ceil(-count * math.log(false_positive_rate) / math.log(2) ** 2))
+    bit_count = (bit_count + 7) // 8 * 8
+    hash_count = max(1, round(bit_count / max(count, 1) * math.log(2)))
+
+    bits = bytearray(bit_count // 8)
+    index = bytearray()
+    offset = 0
+    for key in encoded:
+        for position in _bit_positions(key, hash_count, bit_count):
+            bits[position >> 3] |= 1 << (position & 7)
+        index += _ID.pack(offset, len(key))
+        offset += len(key)
+
+    blob = b''.join(encoded)
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, hash_count, bit_count, count, len(blob))
+    return b''.join([header, fingerprint, bytes(bits), bytes(index), blob])
+
+
+class ImageProxyIndex:
+    """Known Drive file IDs from local manifests, compiled and memory-mapped."""
+
+    def __init__(self, project_root: Union[str, Path], manifests: Optional[List[str]] = None,
+                 false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE, profiler: Optional[Profiler] = None):
+        self.project_root = Path(project_root).resolve()
+        self.profiler = get_profiler(profiler)
+        self.manifests = [self.project_root / path for path in (manifests or DEFAULT_MANIFESTS)]
+        self.false_positive_rate = false_positive_rate
+        self.path = get_cache_dir(self.project_root) / 'image_proxy_ids.bin'
+        self._map: Optional[mmap.mmap] = None
+        self._hash_count = 0
+        self._bit_count = 0
+        self._count = 0
+        self._bits_at = 0
+        self._index_at = 0
+        self._blob_at = 0
+
+        self.sources = [path for path in self.manifests if path.is_file()]
+        if self.sources:
+            with self.profiler.phase('image_proxy_index'):
+                fingerprint = self._fingerprint()
+                if not self._open(fingerprint):
+                    self._build(fingerprint)
+
+    @property
+    def available(self) -> bool:
+        """Whether any manifest exists to check IDs against."""
+        return bool(self.sources)
+
+    def describe(self) -> str:
+        """Project-relative names of the manifests the IDs came from."""
+        return ', '.join(path.relative_to(self.project_root).as_posix() for path in self.sources)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _fingerprint(self) -> bytes:
+        state = hashlib.blake2b(digest_size=FINGERPRINT_SIZE)
+        state.update(struct.pack('<d', self.false_positive_rate))
+        for path in self.sources:
+            stat = path.stat()
+            state.update(f"{path}\0{stat.st_mtime_ns}\0{stat.st_size}\0".encode('utf-8'))
+        return state.digest()
+
+    def _open(self, fingerprint: bytes) -> bool:
+        try:
+            with open(self.path, 'rb') as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return False  # Missing or empty index file
+
+        size = _HEADER.size + FINGERPRINT_SIZE
+        if len(mapped) < size:
+            mapped.close()
+            return False
+        magic, format_version, hash_count, bit_count, count, blob_size = _HEADER.unpack_from(mapped, 0)
+        stored = mapped[_HEADER.size:size]
+        blob_at = size + bit_count // 8 + count * _ID.size
+        if magic != MAGIC or format_version != FORMAT_VERSION or stored != fingerprint \
+                or blob_at + blob_size > len(mapped):
+            mapped.close()
+            return False
+
+        self._map = mapped
+        self._hash_count, self._bit_count, self._count = hash_count, bit_count, count
+        self._bits_at = size
+        self._index_at = size + bit_count // 8
+        self._blob_at = blob_at
+        return True
+
+    def _build(self, fingerprint: bytes):
+        ids: Set[str] = set()
+        readable = []
+        for path in self.sources:
+            try:
+                ids |= manifest_ids(path)
+            except (OSError, ValueError):
+                continue
+            readable.append(path)
+        # Without a readable manifest there is nothing to check against, which
+        # is not the same as knowing no IDs
+        self.sources = readable
+        if not readable:
+            return
+        atomic_write_bytes(self.path, build_index(ids, fingerprint, self.false_positive_rate))
+        self.profiler.count('image_proxy_ids', len(ids))
+        if not self._open(fingerprint):
+            raise OSError(f"Cannot read back image proxy index {self.path}")
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def might_contain(self, file_id: str) -> bool:
+        """Bloom filter test: False means the ID is certainly unknown."""
+        if self._map is None or not self._count:
+            return False
+        mapped, bits_at = self._map, self._bits_at
+        for position in _bit_positions(file_id.encode('utf-8'), self._hash_count, self._bit_count):
+            if not mapped[bits_at + (position >> 3)] & (1 << (position & 7)):
+                return False
+        return True
+
+    def _id(self, index: int) -> bytes:
+        offset, length = _ID.unpack_from(self._map, self._index_at + index * _ID.size)
+        start = self._blob_at + offset
+        return self._map[start:start + length]
+
+    def __contains__(self, file_id: str) -> bool:
+        if not self.might_contain(file_id):
+            return False
+        key = file_id.encode('utf-8')
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._id(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        found = low < self._count and self._id(low) == key
+        if not found:
+            self.profiler.count('image_proxy_bloom_false_positives')
+        return found
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Inline Script and Style Audit
+
+Inline ``<script>`` and ``<style>`` blocks travel with every HTML response and
+are never cached on their own, so a block repeated across pages is downloaded
+again on each of them. Using the blocks the link parser already captures (and
+caches), this report gives:
+
+- inline script and style bytes per page
+- groups of identical blocks across pages, compared after whitespace is
+  collapsed, by hash
+- groups of near-identical blocks, where most of the token shingles match
+  (the same widget script with a different event id, for example)
+- a ranking of blocks to move into a cacheable external file, by bytes saved
+  per view times the number of pages that carry them
+
+Only blocks a page could load from a file are ranked: JavaScript and CSS, not
+JSON-LD, import maps or templates. Thresholds come from ``inline_blocks`` in the
+config.
+"""
+
+import hashlib
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Optional
+
+from .html_link_parser import InlineBlock, ParseResults
+from .js_scanner import JS_SCRIPT_TYPES
+from .profiling import Profiler, get_profiler
+
+
+DEFAULT_MIN_BLOCK_BYTES = 512
+DEFAULT_SIMILARITY = 0.85
+SHINGLE_SIZE = 5
+
+# Bytes an external reference costs in place of the block (<script src="/js/x.js"></script>)
+REFERENCE_BYTES = 40
+
+_TOKEN = re.compile(r'\w+|[^\w\s]')
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize(content: str) -> str:
+    """Block content with whitespace runs collapsed, for exact comparison."""
+    return _WHITESPACE.sub(' ', content).strip()
+
+
+def shingles(content: str) -> FrozenSet[int]:
+    """Hashes of overlapping token windows, for near-duplicate comparison."""
+    tokens = _TOKEN.findall(content)
+    if len(tokens) < SHINGLE_SIZE:
+        return frozenset([hash(tuple(tokens))])
+    return frozenset(hash(tuple(tokens[index:index + SHINGLE_SIZE]))
+                     for index in range(len(tokens) - SHINGLE_SIZE + 1))
+
+
+def externalizable(block: InlineBlock) -> bool:
+    """True for blocks a page could load from a cacheable file instead."""
+    if block.tag == 'style':
+        return True
+    return (block.attributes.get('type') or '').strip().lower() in JS_SCRIPT_TYPES
+
+
+@dataclass
+class BlockInfo:
+    """An inline block with its size and fingerprints."""
+    block: InlineBlock
+    page: str
+    size: int
+    digest: str
+    shingles: Optional[FrozenSet[int]] = None
+
+
+@dataclass
+class BlockGroup:
+    """Inline blocks that are the same code, on one or more pages."""
+    tag: str
+    members: List[BlockInfo] = field(default_factory=list)
+    exact: bool = True
+
+    @property
+    def pages(self) -> List[str]:
+        return sorted({member.page for member in self.members})
+
+    @property
+    def size(self) -> int:
+        return max(member.size for member in self.members)
+
+    @property
+    def savings(self) -> int:
+        """Bytes saved across one view of every page carrying the block."""
+        return max(0, self.size - REFERENCE_BYTES) * len(self.pages)
+
+
+class InlineBlockAuditor:
+    """Measures inline blocks per page and groups repeated ones."""
+
+    def __init__(self, project_root: str, profiler: Optional[Profiler] = None, config: Optional[Dict] = None):
+        self.project_root = os.path.abspath(project_root)
+        self.profiler = get_profiler(profiler)
+        settings = (config or {}).get('inline_blocks', {})
+        self.min_block_bytes = settings.get('min_block_bytes', DEFAULT_MIN_BLOCK_BYTES)
+        self.similarity = settings.get('similarity', DEFAULT_SIMILARITY)
+
+    def _info(self, block: InlineBlock) -> BlockInfo:
+        normalized = normalize(block.content)
+        return BlockInfo(
+            block=block,
+            page=os.path.relpath(block.source_file, self.project_root),
+            size=len(block.content.encode('utf-8')),
+            digest=hashlib.blake2b(f'{block.tag}\0{normalized}'.encode('utf-8'), digest_size=16).hexdigest()
+        )
+
+    def group(self, blocks: List[BlockInfo]) -> List[BlockGroup]:
+        """Exact groups by digest, then merge groups whose shingles are similar enough."""
+        exact: Dict[str, BlockGroup] = {}
+        for info in blocks:
+            exact.setdefault(info.digest, BlockGroup(info.block.tag)).members.append(info)
+        groups = sorted(exact.values(), key=lambda group: -group.size)
+
+        # Near-duplicate merge: compare one representative per exact group, only
+        # against groups of the same tag and similar size
+        for group in groups:
+            group.members[0].shingles = shingles(group.members[0].block.content)
+        merged: List[BlockGroup] = []
+        for group in groups:
+            representative = group.members[0]
+            for target in merged:
+                if target.tag != group.tag or group.size < target.size * self.similarity:
+                    continue
+                other = target.members[0].shingles
+                overlap = len(representative.shingles & other) / len(representative.shingles | other)
+                if overlap >= self.similarity:
+                    target.members.extend(group.members)
+                    target.exact = False
+                    break
+            else:
+                merged.append(group)
+        return merged
+
+    def build_report(self, results: ParseResults) -> Dict:
+        """Per-page inline bytes, repeated blocks and externalization candidates."""
+        pages: Dict[str, Dict] = {}
+        candidates: List[BlockInfo] = []
+        with self.profiler.phase('inline_blocks'):
+            for block in results.inline_blocks:
+                info = self._info(block)
+                row = pages.setdefault(info.page, {'page': info.page, 'script_bytes': 0, 'style_bytes': 0,
+                                                   'blocks': 0})
+                row[f'{block.tag}_bytes'] += info.size
+                row['blocks'] += 1
+                if externalizable(block) and info.size >= self.min_block_bytes:
+                    candidates.append(info)
+            groups = self.group(candidates)
+        self.profiler.count('inline_blocks', len(results.inline_blocks))
+
+        for row in pages.values():
+            row['total_bytes'] = row['script_bytes'] + row['style_bytes']
+        ranked = sorted(groups, key=lambda group: (-group.savings, group.members[0].page))
+        repeated = [group for group in ranked if len(group.pages) > 1]
+        return {
+            'summary': {
+                'pages': len(pages),
+                'inline_blocks': len(results.inline_blocks),
+                'script_bytes': sum(row['script_bytes'] for row in pages.values()),
+                'style_bytes': sum(row['style_bytes'] for row in pages.values()),
+                'repeated_groups': len(repeated),
+                'repeated_bytes': sum(group.size * (len(group.pages) - 1) for group in repeated),
+                'externalization_savings': sum(group.savings for group in ranked)
+            },
+            'pages': sorted(pages.values(), key=lambda row: (-row['total_bytes'], row['page'])),
+            'candidates': [self._group_entry(group) for group in ranked]
+        }
+
+    @staticmethod
+    def _group_entry(group: BlockGroup) -> Dict:
+        first = group.members[0].block
+        return {
+            'tag': group.tag,
+            'size': group.size,
+            'pages': group.pages,
+            'savings': group.savings,
+            'match': 'exact' if group.exact else 'near',
+            'locations': [{'page': member.page, 'line_number': member.block.line_number, 'size': member.size}
+                          for member in group.members],
+            'preview': normalize(first.content)[:80]
+        }
+
+
+def format_inline_report(report: Dict, top: int = 15) -> str:
+    """Format an inline block report for terminal output."""
+    summary = report['summary']
+    lines = [
+        f"Inline blocks: {summary['inline_blocks']} on {summary['pages']} pages "
+        f"({summary['script_bytes'] / 1024:.1f}K script, {summary['style_bytes'] / 1024:.1f}K style)",
+        f"Repeated across pages: {summary['repeated_groups']} groups, "
+        f"{summary['repeated_bytes'] / 1024:.1f}K duplicated",
+        f"Moving every candidate to an external file saves {summary['externalization_savings'] / 1024:.1f}K "
+        f"over one view of each page"
+    ]
+
+    lines.append("")
+    lines.append("Heaviest pages (script / style):")
+    for row in report['pages'][:top]:
+        lines.append(f"  {row['script_bytes'] / 1024:8.1f}K {row['style_bytes'] / 1024:8.1f}K  {row['page']}")
+
+    if report['candidates']:
+        lines.append("")
+        lines.append("Externalization candidates (bytes x pages):")
+        for candidate in report['candidates'][:top]:
+            first = candidate['locations'][0]
+            lines.append(f"  {candidate['savings'] / 1024:8.1f}K  <{candidate['tag']}> "
+                         f"{candidate['size'] / 1024:.1f}K x {len(candidate['pages'])} pages "
+                         f"({candidate['match']}), e.g. {first['page']}:{first['line_number']}")
+    return "\n".join(lines)
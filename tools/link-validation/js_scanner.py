@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+JavaScript Reference Scanner
+
+Lightweight string-literal scanner for URL references in JavaScript modules and
+inline ``<script>`` blocks. It is not a JS parser: a single compiled regex walks
+the source once, skipping comments and collecting string and template literals,
+and the few characters before each literal decide what kind of reference it is:
+
+- ``import ... from '...'`` / ``export ... from '...'`` / ``import '...'``  (import)
+- ``import('...')``                                                      (dynamic-import)
+- ``fetch('...')``                                                       (fetch)
+- ``location.href = '...'``, ``location.assign/replace('...')``          (navigation)
+- any other root-relative literal that names an asset or API path        (literal)
+
+Template literals are static when they contain no ``${...}``. When the
+interpolation only appears in the query string the path is still static; when
+it appears in the path, the reference is marked dynamic and only its static
+prefix is kept.
+"""
+
+import os
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+from .profiling import Profiler, get_profiler
+
+
+_JS_TOKEN = re.compile(r'''
+    //[^\n]*                                          # line comment
+  | /\*.*?(?:\*/|\Z)                                  # block comment
+  | "(?P<dq>(?:\\.|[^"\\\n])*)"                       # double-quoted string
+  | '(?P<sq>(?:\\.|[^'\\\n])*)'                       # single-quoted string
+  | `(?P<tpl>(?:\\.|[^`\\])*)`                        # template literal
+''', re.DOTALL | re.VERBOSE)
+
+# Context immediately before a literal, matched against a short look-behind window
+_CONTEXTS = (
+    ('dynamic-import', re.compile(r'\bimport\s*\(\s*$')),
+    ('import', re.compile(r'(?:\bfrom|(?:^|[;{}\n])\s*import)\s*$')),
+    ('fetch', re.compile(r'\bfetch\s*\(\s*$')),
+    ('navigation', re.compile(
+        r'\blocation(?:\.href)?\s*=\s*$|\blocation\.(?:assign|replace)\s*\(\s*$|\bwindow\.open\s*\(\s*$'
+    )),
+)
+
+_CONTEXT_WINDOW = 48
+
+_ASSET_LITERAL = re.compile(
+    r'^/(?:api/[\w\-./]+|[\w\-./]+\.(?:css|js|mjs|json|png|jpe?g|gif|svg|webp|avif|ico|woff2?|ttf|otf|mp3|mp4|pdf|html))$',
+    re.IGNORECASE
+)
+
+# Script types whose content is JavaScript
+JS_SCRIPT_TYPES = {'', 'text/javascript', 'application/javascript', 'module', 'text/ecmascript'}
+
+
+@dataclass
+class JSReference:
+    """A URL or module specifier found in JavaScript source."""
+    href: str
+    line_number: int
+    kind: str
+    dynamic: bool = False  # href is only the static prefix of a runtime-built URL
+
+
+def _is_url_like(value: str) -> bool:
+    return value.startswith(('/', './', '../')) and ' ' not in value and '\n' not in value
+
+
+def scan_js_text(text: str, line_offset: int = 0) -> List[JSReference]:
+    """Extract static URL references and import specifiers from JavaScript source."""
+    references = []
+    line = 1 + line_offset
+    position = 0
+
+    for match in _JS_TOKEN.finditer(text):
+        start = match.start()
+        line += text.count('\n', position, start)
+        position = start
+
+        value = match.group('dq')
+        if value is None:
+            value = match.group('sq')
+        dynamic = False
+        if value is None:
+            value = match.group('tpl')
+            if value is None:
+                continue  # comment
+            if '${' in value:
+                prefix = value[:value.index('${')]
+                if '?' in prefix:
+                    value = prefix.split('?', 1)[0]
+                else:
+                    value, dynamic = prefix, True
+
+        if not value or not _is_url_like(value):
+            continue
+
+        window = text[max(0, start - _CONTEXT_WINDOW):start]
+        kind = 'literal'
+        for context_kind, pattern in _CONTEXTS:
+            if pattern.search(window):
+                kind = context_kind
+                break
+
+        if kind == 'literal' and (dynamic or not _ASSET_LITERAL.match(value)):
+            continue
+        if dynamic and value in ('/', './', '../'):
+            continue
+
+        references.append(JSReference(value, line, kind, dynamic))
+
+    return references
+
+
+def array_literal_strings(text: str, start: int) -> List[JSReference]:
+    """Static string elements of the array literal whose ``[`` is at ``text[start]``.
+
+    Nested arrays and objects are walked too, so ``{url: '/a.js'}`` entries are
+    included; template literals with interpolation are skipped.
+    """
+    strings = []
+    depth = 0
+    line = 1 + text.count('\n', 0, start)
+    position = start
+    for match in _JS_TOKEN.finditer(text, start):
+        gap = text[position:match.start()]
+        for character in gap:
+            if character in '[{(':
+                depth += 1
+            elif character in ']})':
+                depth -= 1
+                if depth == 0:
+                    return strings
+        line += gap.count('\n')
+        position = match.end()
+
+        value = match.group('dq')
+        if value is None:
+            value = match.group('sq')
+        if value is None:
+            value = match.group('tpl')
+            if value is not None and '${' in value:
+                value = None
+        if value is not None:
+            strings.append(JSReference(value, line, 'array'))
+        line += match.group(0).count('\n')
+    return strings
+
+
+class JSScanner:
+    """Scans JavaScript files once each and keeps their references."""
+
+    def __init__(self, profiler: Optional[Profiler] = None):
+        self.profiler = get_profiler(profiler)
+        self.scanned: Dict[str, List[JSReference]] = {}
+
+    def scan_file(self, path: str) -> List[JSReference]:
+        """Scan a script file, returning cached references if already scanned."""
+        path = os.path.abspath(path)
+        references = self.scanned.get(path)
+        if references is not None:
+            self.profiler.count('js_scan_cache_hits')
+            return references
+
+        with self.profiler.file(path), self.profiler.phase('js_scan'):
+            try:
+                with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                    references = scan_js_text(f.read())
+            except OSError:
+                references = []
+
+        self.profiler.count('scripts_scanned')
+        self.scanned[path] = references
+        return references
+
+    def scan_files(self, paths: Iterable[str]) -> Dict[str, List[JSReference]]:
+        for path in paths:
+            self.scan_file(path)
+        return self.scanned
@@ -4,12 +4,16 @@ Link Analyzer CLI
 
 Command-line interface for the A Lo Cubano Boulder Fest HTML link analysis tools.
 Provides easy access to parsing, validation, and reporting functionality.
+
+Only the parser is imported at startup. Networking (requests), CSV export and
+JSON report writing are imported by the commands that use them, so quick runs
+stay cheap when the tools are invoked repeatedly.
 """
 
 import argparse
 import sys
 from .html_link_parser import HTMLLinkExtractor
-from .link_validation_utils import LinkAnalyzer
+from .profiling import Profiler
 
 
 def main():
@@ -23,6 +27,24 @@ Examples:
   %(prog)s --file page.html     # Analyze a single HTML file
   %(prog)s --category nav       # Show only navigation links
   %(prog)s --export-csv         # Export detailed data to CSV
+  %(prog)s --sqlite links.db    # Export links, targets and results to SQLite
+  %(prog)s --sqlite links.db --incremental  # Only rewrite changed pages
+  %(prog)s --quick --profile    # Show slowest phases and files
+  %(prog)s --crawl              # Crawl the local dev server (base_url in config)
+  %(prog)s --page-weight        # Rank pages by HTML + asset transfer size
+  %(prog)s --orphans            # List css/js/images files nothing references
+  %(prog)s --graph              # Click depth, orphan pages and dead ends
+  %(prog)s --graph --graph-dot site.dot  # Also write a Graphviz file
+  %(prog)s --perf-lint          # Core Web Vitals lint (CLS, LCP, render blocking)
+  %(prog)s --resource-hints     # Audit preconnect/preload hints and third-party origins
+  %(prog)s --image-formats      # WebP/AVIF savings per image and page
+  %(prog)s --srcset             # srcset candidates vs real image widths
+  %(prog)s --cache-control      # Effective Cache-Control of every referenced asset
+  %(prog)s --redirects          # Internal links that go through redirects
+  %(prog)s --cache-busting      # Assets requested under several ?v= variants
+  %(prog)s --service-worker     # Precache lists and web manifest URLs, precache size
+  %(prog)s --inline-blocks      # Inline script/style bytes and blocks repeated across pages
+  %(prog)s --fonts              # @font-face files, woff2, font-display and font preloads
         """
     )
     
@@ -37,30 +59,130 @@ Examples:
                        help='Show links from specific category only')
     parser.add_argument('--export-csv', action='store_true',
                        help='Export detailed analysis to CSV file')
+    parser.add_argument('--sqlite', type=str, metavar='DB',
+                       help='Export pages, links, targets and validation results to an SQLite database')
+    parser.add_argument('--incremental', action='store_true',
+                       help='With --sqlite, only rewrite pages whose content changed')
     parser.add_argument('--validate-external', action='store_true',
                        help='Validate external links (may be slow)')
     parser.add_argument('--project-root', type=str, default='.',
                        help='Project root directory (default: current directory)')
+    parser.add_argument('--crawl', action='store_true',
+                       help='Crawl the locally served site and check real responses')
+    parser.add_argument('--base-url', type=str,
+                       help='Server to crawl (default: project_settings.base_url from config)')
+    parser.add_argument('--concurrency', type=int,
+                       help='Maximum concurrent requests while crawling')
+    parser.add_argument('--page-weight', action='store_true',
+                       help='Report raw and compressed page weight including assets')
+    parser.add_argument('--orphans', action='store_true',
+                       help='Report assets that no page, stylesheet or script references')
+    parser.add_argument('--graph', action='store_true',
+                       help='Analyze the page link graph (click depth from /home, orphans, dead ends)')
+    parser.add_argument('--graph-dot', type=str, metavar='FILE',
+                       help='Write the page link graph in Graphviz DOT format (with --graph)')
+    parser.add_argument('--perf-lint', action='store_true',
+                       help='Report Core Web Vitals lint findings per page')
+    parser.add_argument('--resource-hints', action='store_true',
+                       help='Audit preconnect, dns-prefetch and preload hints and third-party origins')
+    parser.add_argument('--image-formats', action='store_true',
+                       help='Estimate WebP/AVIF byte savings for referenced JPEG/PNG/GIF images')
+    parser.add_argument('--srcset', action='store_true',
+                       help='Check srcset candidates and icon sizes against real image dimensions')
+    parser.add_argument('--cache-control', action='store_true',
+                       help='Report the Cache-Control vercel.json gives each referenced asset')
+    parser.add_argument('--redirects', action='store_true',
+                       help='Report internal links that land on redirects, chains and loops')
+    parser.add_argument('--cache-busting', action='store_true',
+                       help='Group asset references by file and flag inconsistent query/version variants')
+    parser.add_argument('--service-worker', action='store_true',
+                       help='Validate service worker precache lists and web manifests, and total precache size')
+    parser.add_argument('--inline-blocks', action='store_true',
+                       help='Report inline script/style bytes per page and blocks repeated across pages')
+    parser.add_argument('--fonts', action='store_true',
+                       help='Audit web font loading: @font-face files, woff2, font-display and preloads')
+    parser.add_argument('--profile', action='store_true',
+                       help='Print per-phase and per-file timings and counters')
+    parser.add_argument('--profile-memory', action='store_true',
+                       help='Include tracemalloc peak memory per phase (implies --profile)')
     
     args = parser.parse_args()
     
+    profiler = None
+    if args.profile or args.profile_memory:
+        profiler = Profiler(trace_memory=args.profile_memory)
+    
     # Default to quick analysis if no specific action is specified
-    if not any([args.quick, args.full, args.file, args.category, args.export_csv]):
+    if not any([args.quick, args.full, args.file, args.category, args.export_csv, args.crawl,
+                args.page_weight, args.orphans, args.graph, args.sqlite, args.perf_lint,
+                args.resource_hints, args.image_formats, args.srcset, args.cache_control,
+                args.redirects, args.cache_busting, args.service_worker, args.inline_blocks,
+                args.fonts]):
         args.quick = True
     
     try:
-        if args.file:
+        if args.crawl:
+            # Live crawl against a running server
+            run_crawl(args.project_root, args.base_url, args.concurrency, profiler)
+        elif args.page_weight:
+            # Page weight report
+            run_page_weight(args.project_root, profiler)
+        elif args.orphans:
+            # Orphaned asset report
+            run_orphan_report(args.project_root, profiler)
+        elif args.sqlite:
+            # SQLite export
+            run_sqlite_export(args.project_root, args.sqlite, args.incremental, profiler)
+        elif args.graph:
+            # Page link graph analysis
+            run_link_graph(args.project_root, args.graph_dot, profiler)
+        elif args.perf_lint:
+            # Core Web Vitals lint
+            run_perf_lint(args.project_root, profiler)
+        elif args.resource_hints:
+            # Resource hint and third-party origin audit
+            run_resource_hint_audit(args.project_root, profiler)
+        elif args.image_formats:
+            # Modern image format opportunities
+            run_image_format_report(args.project_root, profiler)
+        elif args.srcset:
+            # Responsive image candidate audit
+            run_responsive_image_audit(args.project_root, profiler)
+        elif args.cache_control:
+            # Cache-Control coverage of referenced assets
+            run_cache_control_audit(args.project_root, profiler)
+        elif args.redirects:
+            # Redirect chains behind internal links
+            run_redirect_report(args.project_root, profiler)
+        elif args.cache_busting:
+            # Cache-busting query consistency
+            run_cache_busting_report(args.project_root, profiler)
+        elif args.service_worker:
+            # Service worker precache and manifest check
+            run_service_worker_report(args.project_root, profiler)
+        elif args.inline_blocks:
+            # Inline script and style size and duplication
+            run_inline_block_report(args.project_root, profiler)
+        elif args.fonts:
+            # Web font loading audit
+            run_font_audit(args.project_root, profiler)
+        elif args.file:
             # Analyze single file
-            analyze_single_file(args.file, args.project_root)
+            analyze_single_file(args.file, args.project_root, profiler)
         elif args.category:
             # Show specific category
-            show_category(args.category, args.project_root)
+            show_category(args.category, args.project_root, profiler)
         elif args.full or args.validate_external:
             # Full analysis
-            run_full_analysis(args.project_root, validate_external=True)
+            run_full_analysis(args.project_root, validate_external=True, profiler=profiler)
         else:
             # Quick analysis
-            run_quick_analysis(args.project_root, export_csv=args.export_csv)
+            run_quick_analysis(args.project_root, export_csv=args.export_csv, profiler=profiler)
+        
+        if profiler:
+            print()
+            print(profiler.format_report())
+            profiler.stop()
             
     except KeyboardInterrupt:
         print("\nAnalysis interrupted by user.")
@@ -70,12 +192,12 @@ Examples:
         sys.exit(1)
 
 
-def analyze_single_file(file_path: str, project_root: str):
+def analyze_single_file(file_path: str, project_root: str, profiler: Profiler = None):
     """Analyze a single HTML file."""
     print(f"Analyzing file: {file_path}")
     print("-" * 40)
     
-    extractor = HTMLLinkExtractor(project_root)
+    extractor = HTMLLinkExtractor(project_root, profiler=profiler)
     results = extractor.parse_file(file_path)
     
     print(f"Total links: {len(results.links)}")
@@ -100,7 +222,7 @@ def analyze_single_file(file_path: str, project_root: str):
                 print(f"    ... and {len(links) - 5} more")
 
 
-def show_category(category: str, project_root: str):
+def show_category(category: str, project_root: str, profiler: Profiler = None):
     """Show links from a specific category."""
     category_map = {
         'nav': 'navigation_links',
@@ -112,7 +234,7 @@ def show_category(category: str, project_root: str):
         'anchor': 'anchor_links'
     }
     
-    extractor = HTMLLinkExtractor(project_root)
+    extractor = HTMLLinkExtractor(project_root, profiler=profiler)
     results = extractor.parse_project()
     
     attr_name = category_map[category]
@@ -126,12 +248,12 @@ def show_category(category: str, project_root: str):
         print(f"{link.href:30} | {file_name:20} | {link.text[:25]}")
 
 
-def run_quick_analysis(project_root: str, export_csv: bool = False):
+def run_quick_analysis(project_root: str, export_csv: bool = False, profiler: Profiler = None):
     """Run quick analysis without external validation."""
     print("A Lo Cubano Boulder Fest - Quick Link Analysis")
     print("=" * 50)
     
-    extractor = HTMLLinkExtractor(project_root)
+    extractor = HTMLLinkExtractor(project_root, profiler=profiler)
     results = extractor.parse_project()
     analysis = extractor.get_link_analysis(results)
     
@@ -158,12 +280,24 @@ def run_quick_analysis(project_root: str, export_csv: bool = False):
         print("Detailed data exported to 'quick_analysis.csv'")
 
 
-def run_full_analysis(project_root: str, validate_external: bool = True):
+def save_json_report(report: dict, filename: str, profiler: Profiler = None):
+    """Write a report as indented UTF-8 JSON, with profile data when profiling is enabled."""
+    import json
+    
+    if profiler is not None and profiler.enabled:
+        report = dict(report, profile=profiler.to_dict())
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+
+def run_full_analysis(project_root: str, validate_external: bool = True, profiler: Profiler = None):
     """Run comprehensive analysis with validation."""
+    from .link_validation_utils import LinkAnalyzer
+    
     print("A Lo Cubano Boulder Fest - Comprehensive Link Analysis")
     print("=" * 60)
     
-    analyzer = LinkAnalyzer(project_root)
+    analyzer = LinkAnalyzer(project_root, profiler=profiler)
     results, validation_results = analyzer.run_full_analysis(validate_external)
     analyzer.generate_reports(results, validation_results)
     
@@ -189,6 +323,29 @@ def run_full_analysis(project_root: str, validate_external: bool = True):
             for link in missing[:5]:
                 print(f"    - {link.href} (in {link.source_file.split('/')[-1]})")
     
+    if 'stylesheets' in validation_results:
+        stylesheet_val = validation_results['stylesheets']
+        print("\nStylesheet url()/@import validation:")
+        print(f"  Valid: {len(stylesheet_val.get('valid', []))}")
+        print(f"  Missing: {len(stylesheet_val.get('missing', []))}")
+        for link in stylesheet_val.get('missing', [])[:5]:
+            print(f"    - {link.href} (in {link.source_file.split('/')[-1]}:{link.line_number})")
+        
+        chains = analyzer.extractor.css_scanner.import_chains()
+        if chains:
+            print("  @import chains:")
+            for chain in chains[:5]:
+                depth = "circular" if chain['circular'] else f"depth {chain['depth']}"
+                print(f"    - {chain['stylesheet']} ({depth}): {', '.join(chain['imports'])}")
+    
+    if 'scripts' in validation_results:
+        script_val = validation_results['scripts']
+        print("\nScript fetch/import/navigation validation:")
+        print(f"  Valid: {len(script_val.get('valid', []))}")
+        print(f"  Missing: {len(script_val.get('missing', []))}")
+        for link in script_val.get('missing', [])[:5]:
+            print(f"    - {link.href} (in {link.source_file.split('/')[-1]}:{link.line_number})")
+    
     if validate_external and 'external' in validation_results:
         external_val = validation_results['external']
         print("\nExternal link validation:")
@@ -205,5 +362,326 @@ def run_full_analysis(project_root: str, validate_external: bool = True):
                     print(f"  {issue_type.replace('_', ' ').title()}: {len(issues)}")
 
 
+def run_crawl(project_root: str, base_url: str = None, concurrency: int = None,
+              profiler: Profiler = None):
+    """Crawl a locally served site and report broken, slow and redirected URLs."""
+    from .link_validator import load_config
+    from .live_crawler import LiveCrawler
+    
+    print("A Lo Cubano Boulder Fest - Live Crawl")
+    print("=" * 50)
+    
+    config = load_config(project_root)
+    crawler = LiveCrawler.from_config(config, base_url=base_url,
+                                      concurrency=concurrency, profiler=profiler)
+    results = crawler.run('/')
+    report = crawler.build_report(results)
+    
+    print(crawler.format_report(report))
+    
+    save_json_report(report, 'link_crawl_report.json', profiler)
+    print("\nCrawl report saved to 'link_crawl_report.json'")
+
+
+def run_page_weight(project_root: str, profiler: Profiler = None):
+    """Rank pages by the bytes of HTML and directly referenced assets."""
+    from .page_weight import PageWeightAnalyzer
+    
+    print("A Lo Cubano Boulder Fest - Page Weight")
+    print("=" * 50)
+    
+    extractor = HTMLLinkExtractor(project_root, profiler=profiler)
+    results = extractor.parse_project()
+    analyzer = PageWeightAnalyzer(project_root, profiler=profiler)
+    report = analyzer.analyze(results)
+    
+    print(analyzer.format_report(report))
+    
+    save_json_report(report, 'page_weight_report.json', profiler)
+    print("\nPage weight report saved to 'page_weight_report.json'")
+
+
+def run_orphan_report(project_root: str, profiler: Profiler = None):
+    """List assets that nothing references, with their total size."""
+    from .asset_index import (ReferenceIndex, build_orphan_report, collect_asset_paths,
+                              find_orphaned_assets)
+    from .asset_resolver import AssetResolver
+    from .link_validator import LinkValidator
+    
+    print("A Lo Cubano Boulder Fest - Orphaned Assets")
+    print("=" * 50)
+    
+    validator = LinkValidator(project_root, profiler=profiler)
+    extractor = HTMLLinkExtractor(project_root, profiler=profiler)
+    results = extractor.parse_project()
+    
+    stylesheet_results = extractor.parse_stylesheets(results)
+    script_results = extractor.parse_scripts(results)
+    
+    index = ReferenceIndex(AssetResolver(project_root))
+    with extractor.profiler.phase('reference_index'):
+        index.add_parse_results(results)
+        index.add_parse_results(stylesheet_results)
+        index.add_parse_results(script_results)
+    
+    asset_paths = collect_asset_paths(validator.get_cached_files())
+    ignore_patterns = validator.config.get("asset_analysis", {}).get("orphan_ignore_patterns", [])
+    orphans = find_orphaned_assets(asset_paths, index, ignore_patterns)
+    report = build_orphan_report(orphans, len(asset_paths))
+    
+    summary = report['summary']
+    print(f"Assets indexed: {summary['assets_indexed']}")
+    print(f"Orphaned: {summary['orphaned']} ({summary['orphaned_bytes'] / 1024:.1f}K)")
+    for directory, entry in sorted(summary['by_directory'].items()):
+        print(f"  {directory:10}: {entry['count']:4d} files, {entry['bytes'] / 1024:.1f}K")
+    print()
+    
+    for orphan in orphans[:25]:
+        print(f"  {orphan.size / 1024:9.1f}K  {orphan.path}")
+    if len(orphans) > 25:
+        print(f"  ... and {len(orphans) - 25} more")
+    
+    save_json_report(report, 'orphaned_assets_report.json', profiler)
+    print("\nOrphaned asset report saved to 'orphaned_assets_report.json'")
+
+
+def run_link_graph(project_root: str, dot_file: str = None, profiler: Profiler = None):
+    """Analyze page-to-page links: click depth, orphan pages, dead ends and cycles."""
+    from .link_graph import SiteGraphBuilder
+    from .link_validator import load_config
+    
+    print("A Lo Cubano Boulder Fest - Site Link Graph")
+    print("=" * 50)
+    
+    config = load_config(project_root)
+    max_depth = config.get("graph_settings", {}).get("max_click_depth", 3)
+    
+    extractor = HTMLLinkExtractor(project_root, profiler=profiler)
+    results = extractor.parse_project()
+    script_results = extractor.parse_scripts(results)
+    
+    builder = SiteGraphBuilder(project_root, profiler=profiler)
+    builder.build(results, script_results.links)
+    report = builder.analyze(max_depth=max_depth)
+    
+    print(builder.format_report(report))
+    
+    save_json_report(report, 'link_graph_report.json', profiler)
+    print("\nLink graph report saved to 'link_graph_report.json'")
+    
+    if dot_file:
+        with open(dot_file, 'w', encoding='utf-8') as f:
+            f.write(builder.to_dot(report))
+        print(f"Graphviz graph saved to '{dot_file}'")
+
+
+def run_perf_lint(project_root: str, profiler: Profiler = None):
+    """Report layout shift, LCP and render-blocking lint findings per page."""
+    from .link_validator import load_config
+    from .perf_lint import build_lint_report, format_lint_report
+    
+    print("A Lo Cubano Boulder Fest - Core Web Vitals Lint")
+    print("=" * 50)
+    
+    extractor = HTMLLinkExtractor(project_root, profiler=profiler)
+    results = extractor.parse_project()
+    report = build_lint_report(results.perf_findings, project_root, load_config(project_root))
+    
+    print(format_lint_report(report))
+    
+    save_json_report(report, 'perf_lint_report.json', profiler)
+    print("\nCore Web Vitals lint report saved to 'perf_lint_report.json'")
+
+
+def run_resource_hint_audit(project_root: str, profiler: Profiler = None):
+    """Audit resource hints against what each page loads, and count third-party origins."""
+    from .link_validator import load_config
+    from .resource_hints import ResourceHintAuditor, format_hint_report
+    
+    print("A Lo Cubano Boulder Fest - Resource Hints")
+    print("=" * 50)
+    
+    extractor = HTMLLinkExtractor(project_root, profiler=profiler)
+    results = extractor.parse_project()
+    auditor = ResourceHintAuditor(project_root, profiler=profiler, config=load_config(project_root))
+    report = auditor.build_report(results)
+    
+    print(format_hint_report(report))
+    
+    save_json_report(report, 'resource_hints_report.json', profiler)
+    print("\nResource hint report saved to 'resource_hints_report.json'")
+
+
+def run_image_format_report(project_root: str, profiler: Profiler = None):
+    """Rank JPEG/PNG/GIF images by the bytes WebP or AVIF would save."""
+    from .image_formats import ModernFormatAnalyzer, format_image_report
+    from .link_validator import load_config
+    
+    print("A Lo Cubano Boulder Fest - Modern Image Formats")
+    print("=" * 50)
+    
+    extractor = HTMLLinkExtractor(project_root, profiler=profiler)
+    results = extractor.parse_project()
+    analyzer = ModernFormatAnalyzer(project_root, profiler=profiler, config=load_config(project_root))
+    report = analyzer.analyze(results)
+    
+    print(format_image_report(report))
+    
+    save_json_report(report, 'image_formats_report.json', profiler)
+    print("\nImage format report saved to 'image_formats_report.json'")
+
+
+def run_responsive_image_audit(project_root: str, profiler: Profiler = None):
+    """Check srcset candidates and icon sizes against the images' real dimensions."""
+    from .link_validator import load_config
+    from .responsive_images import ResponsiveImageAuditor, format_responsive_report
+    
+    print("A Lo Cubano Boulder Fest - Responsive Images")
+    print("=" * 50)
+    
+    extractor = HTMLLinkExtractor(project_root, profiler=profiler)
+    results = extractor.parse_project()
+    auditor = ResponsiveImageAuditor(project_root, profiler=profiler, config=load_config(project_root))
+    report = auditor.build_report(results)
+    
+    print(format_responsive_report(report))
+    
+    save_json_report(report, 'srcset_report.json', profiler)
+    print("\nResponsive image report saved to 'srcset_report.json'")
+
+
+def run_cache_control_audit(project_root: str, profiler: Profiler = None):
+    """Report the effective Cache-Control of every asset pages reference."""
+    from .cache_control import CacheControlAuditor, format_cache_report
+    from .link_validator import load_config
+    
+    print("A Lo Cubano Boulder Fest - Cache-Control Coverage")
+    print("=" * 50)
+    
+    extractor = HTMLLinkExtractor(project_root, profiler=profiler)
+    results = extractor.parse_project()
+    auditor = CacheControlAuditor(project_root, profiler=profiler, config=load_config(project_root))
+    report = auditor.build_report(results)
+    
+    print(format_cache_report(report))
+    
+    save_json_report(report, 'cache_control_report.json', profiler)
+    print("\nCache-Control report saved to 'cache_control_report.json'")
+
+
+def run_redirect_report(project_root: str, profiler: Profiler = None):
+    """Report internal links that go through vercel.json redirects, with the fix for each."""
+    from .redirect_chains import RedirectChainAnalyzer, format_redirect_report
+    
+    print("A Lo Cubano Boulder Fest - Redirect Chains")
+    print("=" * 50)
+    
+    extractor = HTMLLinkExtractor(project_root, profiler=profiler)
+    results = extractor.parse_project()
+    report = RedirectChainAnalyzer(project_root, profiler=profiler).analyze(results)
+    
+    print(format_redirect_report(report))
+    
+    save_json_report(report, 'redirects_report.json', profiler)
+    print("\nRedirect report saved to 'redirects_report.json'")
+
+
+def run_cache_busting_report(project_root: str, profiler: Profiler = None):
+    """List assets referenced under more than one query string, with the pages using each."""
+    from .cache_busting import CacheBustingAuditor, format_cache_busting_report
+    from .link_validator import load_config
+    
+    print("A Lo Cubano Boulder Fest - Cache-Busting Consistency")
+    print("=" * 50)
+    
+    extractor = HTMLLinkExtractor(project_root, profiler=profiler)
+    results = extractor.parse_project()
+    auditor = CacheBustingAuditor(project_root, profiler=profiler, config=load_config(project_root))
+    report = auditor.build_report(results)
+    
+    print(format_cache_busting_report(report))
+    
+    save_json_report(report, 'cache_busting_report.json', profiler)
+    print("\nCache-busting report saved to 'cache_busting_report.json'")
+
+
+def run_service_worker_report(project_root: str, profiler: Profiler = None):
+    """Validate service worker precache lists and web manifests against the file tree."""
+    from .link_validator import load_config
+    from .service_worker import ServiceWorkerAuditor, format_service_worker_report
+    
+    print("A Lo Cubano Boulder Fest - Service Workers and Manifests")
+    print("=" * 50)
+    
+    auditor = ServiceWorkerAuditor(project_root, profiler=profiler, config=load_config(project_root))
+    report = auditor.audit()
+    
+    print(format_service_worker_report(report))
+    
+    save_json_report(report, 'service_worker_report.json', profiler)
+    print("\nService worker report saved to 'service_worker_report.json'")
+
+
+def run_inline_block_report(project_root: str, profiler: Profiler = None):
+    """Measure inline script/style blocks and rank repeated ones for moving to external files."""
+    from .inline_blocks import InlineBlockAuditor, format_inline_report
+    from .link_validator import load_config
+    
+    print("A Lo Cubano Boulder Fest - Inline Scripts and Styles")
+    print("=" * 50)
+    
+    extractor = HTMLLinkExtractor(project_root, profiler=profiler)
+    results = extractor.parse_project()
+    auditor = InlineBlockAuditor(project_root, profiler=profiler, config=load_config(project_root))
+    report = auditor.build_report(results)
+    
+    print(format_inline_report(report))
+    
+    save_json_report(report, 'inline_blocks_report.json', profiler)
+    print("\nInline block report saved to 'inline_blocks_report.json'")
+
+
+def run_font_audit(project_root: str, profiler: Profiler = None):
+    """Check @font-face delivery per stylesheet and font preloads per page."""
+    from .font_audit import WebFontAuditor, format_font_report
+    from .link_validator import load_config
+    
+    print("A Lo Cubano Boulder Fest - Web Fonts")
+    print("=" * 50)
+    
+    extractor = HTMLLinkExtractor(project_root, profiler=profiler)
+    results = extractor.parse_project()
+    auditor = WebFontAuditor(project_root, profiler=profiler, config=load_config(project_root))
+    report = auditor.build_report(results)
+    
+    print(format_font_report(report))
+    
+    save_json_report(report, 'fonts_report.json', profiler)
+    print("\nFont report saved to 'fonts_report.json'")
+
+
+def run_sqlite_export(project_root: str, db_path: str, incremental: bool = False,
+                      profiler: Profiler = None):
+    """Export parse and validation results to an indexed SQLite database."""
+    from .sqlite_export import SQLiteExporter
+    
+    print("A Lo Cubano Boulder Fest - SQLite Export")
+    print("=" * 50)
+    
+    extractor = HTMLLinkExtractor(project_root, profiler=profiler)
+    results = extractor.parse_project()
+    
+    exporter = SQLiteExporter(project_root, db_path, profiler=profiler)
+    stats = exporter.export(results, incremental=incremental)
+    
+    print(f"Pages: {stats['pages']} ({stats['pages_written']} written, "
+          f"{stats['pages_unchanged']} unchanged, {stats['pages_removed']} removed)")
+    print(f"Links written: {stats['links_written']}")
+    print(f"Targets: {stats['targets']} ({stats['invalid_targets']} invalid)")
+    print(f"\nDatabase saved to '{db_path}'")
+    print("Example: SELECT p.path FROM links l JOIN pages p ON p.id = l.page_id "
+          "JOIN targets t ON t.id = l.target_id WHERE t.resolved_path = 'js/main.js';")
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
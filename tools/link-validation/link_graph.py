@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Site Link Graph
+
+Builds a directed graph of page-to-page links and analyzes it for navigation
+problems: click depth from the home page, pages no other page links to, dead-end
+pages with no outgoing page links, and strongly connected components.
+
+Pages are numbered with dense integer IDs and edges are stored as per-node
+adjacency lists, so building the graph and every analysis (BFS for depth,
+iterative Tarjan for components) run in O(pages + edges).
+"""
+
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from .asset_resolver import AssetResolver, is_local_reference
+from .html_link_parser import LinkInfo, ParseResults
+from .profiling import Profiler, get_profiler
+from .vercel_config import VercelConfig
+
+
+# Link tags that take the visitor to another page
+PAGE_LINK_TAGS = {'a', 'area', 'js-navigation'}
+
+HOME_URL = '/home'
+
+
+class LinkGraph:
+    """Directed graph with integer node IDs and adjacency lists."""
+
+    def __init__(self):
+        self.nodes: List[str] = []
+        self.ids: Dict[str, int] = {}
+        self.adjacency: List[List[int]] = []
+        self._edge_sets: List[Set[int]] = []
+
+    def add_node(self, name: str) -> int:
+        """Return the ID for a node, adding it if needed."""
+        node = self.ids.get(name)
+        if node is None:
+            node = self.ids[name] = len(self.nodes)
+            self.nodes.append(name)
+            self.adjacency.append([])
+            self._edge_sets.append(set())
+        return node
+
+    def add_edge(self, source: int, target: int):
+        """Add a directed edge, ignoring self-links and duplicates."""
+        if source != target and target not in self._edge_sets[source]:
+            self._edge_sets[source].add(target)
+            self.adjacency[source].append(target)
+
+    @property
+    def edge_count(self) -> int:
+        return sum(len(targets) for targets in self.adjacency)
+
+    def in_degrees(self) -> List[int]:
+        degrees = [0] * len(self.nodes)
+        for targets in self.adjacency:
+            for target in targets:
+                degrees[target] += 1
+        return degrees
+
+    def depths_from(self, start: int) -> List[int]:
+        """Breadth-first click depth from a node; -1 for unreachable nodes."""
+        depths = [-1] * len(self.nodes)
+        depths[start] = 0
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            for target in self.adjacency[node]:
+                if depths[target] < 0:
+                    depths[target] = depths[node] + 1
+                    queue.append(target)
+        return depths
+
+    def strongly_connected_components(self) -> List[List[int]]:
+        """Tarjan's algorithm, iterative so deep sites cannot hit the recursion limit."""
+        count = len(self.nodes)
+        index = [-1] * count
+        lowlink = [0] * count
+        on_stack = [False] * count
+        stack: List[int] = []
+        components: List[List[int]] = []
+        next_index = 0
+
+        for root in range(count):
+            if index[root] >= 0:
+                continue
+            work = [(root, 0)]
+            while work:
+                node, edge = work[-1]
+                if edge == 0:
+                    index[node] = lowlink[node] = next_index
+                    next_index += 1
+                    stack.append(node)
+                    on_stack[node] = True
+
+                targets = self.adjacency[node]
+                while edge < len(targets):
+                    target = targets[edge]
+                    edge += 1
+                    if index[target] < 0:
+                        work[-1] = (node, edge)
+                        work.append((target, 0))
+                        break
+                    if on_stack[target]:
+                        lowlink[node] = min(lowlink[node], index[target])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+                    if lowlink[node] == index[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack[member] = False
+                            component.append(member)
+                            if member == node:
+                                break
+                        components.append(component)
+
+        return components
+
+
+class SiteGraphBuilder:
+    """Builds the page link graph from parse results using vercel.json routing."""
+
+    def __init__(self, project_root: str, profiler: Optional[Profiler] = None,
+                 router: Optional[VercelConfig] = None):
+        self.project_root = Path(project_root).resolve()
+        self.profiler = get_profiler(profiler)
+        self.router = router or VercelConfig(self.project_root)
+        self.resolver = AssetResolver(self.project_root)
+        self.graph = LinkGraph()
+        self.unresolved: Dict[str, Set[str]] = {}
+        self._page_ids: Dict[str, int] = {}
+
+    def build(self, results: ParseResults, extra_links: Iterable[LinkInfo] = ()) -> LinkGraph:
+        """Add every parsed page as a node and every page link as an edge."""
+        with self.profiler.phase('graph_build'):
+            for source_file in results.get_links_by_file():
+                self._page_id(source_file)
+
+            for link in list(results.links) + list(extra_links):
+                if link.tag not in PAGE_LINK_TAGS or not is_local_reference(link.href):
+                    continue
+                if link.attributes.get('dynamic'):
+                    continue
+                if link.tag == 'js-navigation' and not link.source_file.endswith('.html'):
+                    continue  # Navigation from shared modules has no single source page
+
+                target = self.router.resolve_page(link.href, link.source_file)
+                source = self._page_id(link.source_file)
+                if target is None:
+                    if self._looks_like_page(link.href):
+                        self.unresolved.setdefault(link.href, set()).add(self.graph.nodes[source])
+                    continue
+                self.graph.add_edge(source, self._page_id(str(target)))
+
+        self.profiler.count('graph_nodes', len(self.graph.nodes))
+        self.profiler.count('graph_edges', self.graph.edge_count)
+        return self.graph
+
+    def _page_id(self, file_path: str) -> int:
+        node = self._page_ids.get(file_path)
+        if node is None:
+            node = self._page_ids[file_path] = self.graph.add_node(
+                self.resolver.relative(Path(file_path).resolve()))
+        return node
+
+    @staticmethod
+    def _looks_like_page(href: str) -> bool:
+        path = href.split('#', 1)[0].split('?', 1)[0]
+        suffix = Path(path).suffix.lower()
+        return bool(path) and not path.startswith('/api/') and suffix in ('', '.html')
+
+    def home_id(self) -> Optional[int]:
+        home = self.router.resolve_page(HOME_URL)
+        if home is None:
+            return None
+        return self.graph.ids.get(self.resolver.relative(home))
+
+    def analyze(self, max_depth: int = 3) -> Dict:
+        """Depth, orphan page, dead-end and component report for the built graph."""
+        graph = self.graph
+        with self.profiler.phase('graph_analyze'):
+            home = self.home_id()
+            depths = graph.depths_from(home) if home is not None else [-1] * len(graph.nodes)
+            in_degrees = graph.in_degrees()
+            components = graph.strongly_connected_components()
+
+        histogram: Dict[str, int] = {}
+        for depth in depths:
+            key = str(depth) if depth >= 0 else 'unreachable'
+            histogram[key] = histogram.get(key, 0) + 1
+
+        cycles = sorted((sorted(graph.nodes[node] for node in component)
+                         for component in components if len(component) > 1),
+                        key=len, reverse=True)
+
+        return {
+            'summary': {
+                'pages': len(graph.nodes),
+                'links': graph.edge_count,
+                'home': graph.nodes[home] if home is not None else None,
+                'max_depth': max(depths) if depths else 0,
+                'max_allowed_depth': max_depth,
+                'depth_histogram': histogram,
+                'strongly_connected_components': len(components),
+                'largest_component': max((len(component) for component in components), default=0)
+            },
+            'depths': {graph.nodes[node]: depth for node, depth in
+                       sorted(enumerate(depths), key=lambda item: (item[1], graph.nodes[item[0]]))},
+            'too_deep': sorted(graph.nodes[node] for node, depth in enumerate(depths) if depth > max_depth),
+            'unreachable_from_home': sorted(graph.nodes[node] for node, depth in enumerate(depths) if depth < 0),
+            'orphan_pages': sorted(graph.nodes[node] for node, degree in enumerate(in_degrees)
+                                   if degree == 0 and node != home),
+            'dead_ends': sorted(graph.nodes[node] for node, targets in enumerate(graph.adjacency) if not targets),
+            'components': cycles,
+            'unresolved_page_links': {href: sorted(sources) for href, sources in sorted(self.unresolved.items())},
+            'edges': [[graph.nodes[source], graph.nodes[target]]
+                      for source, targets in enumerate(graph.adjacency) for target in targets]
+        }
+
+    def to_dot(self, report: Dict) -> str:
+        """Render the graph in Graphviz DOT format, ranked by click depth."""
+        graph = self.graph
+        depths = report['depths']
+        lines = ['digraph site {', '  rankdir=LR;', '  node [shape=box, fontsize=10];']
+        for node, name in enumerate(graph.nodes):
+            depth = depths.get(name, -1)
+            label = f"{name}\\n{'depth ' + str(depth) if depth >= 0 else 'unreachable'}"
+            style = ''
+            if depth < 0:
+                style = ', color=red'
+            elif depth > report['summary']['max_allowed_depth']:
+                style = ', color=orange'
+            lines.append(f'  n{node} [label="{label}"{style}];')
+        for source, targets in enumerate(graph.adjacency):
+            for target in targets:
+                lines.append(f'  n{source} -> n{target};')
+        lines.append('}')
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def format_report(report: Dict, top: int = 15) -> str:
+        """Format the graph report for terminal output."""
+        summary = report['summary']
+        lines = []
+        lines.append(f"Pages: {summary['pages']}  Links: {summary['links']}  Home: {summary['home']}")
+        lines.append(f"Max click depth: {summary['max_depth']} (allowed {summary['max_allowed_depth']})")
+        histogram = ', '.join(f"{depth}: {count}" for depth, count in summary['depth_histogram'].items())
+        lines.append(f"Pages by depth: {histogram}")
+        lines.append(f"Strongly connected components: {summary['strongly_connected_components']} "
+                     f"(largest {summary['largest_component']} pages)")
+
+        sections = [
+            ('TOO DEEP', report['too_deep']),
+            ('UNREACHABLE FROM HOME', report['unreachable_from_home']),
+            ('ORPHAN PAGES (no incoming links)', report['orphan_pages']),
+            ('DEAD ENDS (no outgoing page links)', report['dead_ends']),
+        ]
+        for title, pages in sections:
+            if not pages:
+                continue
+            lines.append("")
+            lines.append(f"{title}: {len(pages)}")
+            for page in pages[:top]:
+                depth = report['depths'].get(page, -1)
+                lines.append(f"  - {page}" + (f" (depth {depth})" if depth >= 0 else ""))
+            if len(pages) > top:
+                lines.append(f"  ... and {len(pages) - top} more")
+
+        if report['unresolved_page_links']:
+            lines.append("")
+            lines.append(f"UNRESOLVED PAGE LINKS: {len(report['unresolved_page_links'])}")
+            for href, sources in list(report['unresolved_page_links'].items())[:top]:
+                lines.append(f"  - {href} (from {', '.join(sources[:3])})")
+
+        return "\n".join(lines)
@@ -8,23 +8,38 @@ Designed to work with the html_link_parser module for comprehensive link analysi
 
 import os
 import json
-import requests
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 from urllib.parse import urljoin, urlparse
+from .api_routes import ApiRouteTable
 from .html_link_parser import HTMLLinkExtractor, ParseResults, LinkInfo
+from .profiling import Profiler, get_profiler
+from .vercel_config import VercelConfig
 
 
 class LinkValidator:
     """Validates links found in HTML files."""
     
-    def __init__(self, project_root: str = None, base_url: str = "http://localhost:8000"):
+    def __init__(self, project_root: str = None, base_url: str = "http://localhost:8000",
+                 profiler: Optional[Profiler] = None):
         self.project_root = project_root or os.getcwd()
         self.base_url = base_url
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'ALCBFLinkValidator/1.0 (Website Link Checker)'
-        })
+        self.profiler = get_profiler(profiler)
+        self._api_routes = None
+        self._vercel = None
+        self._session = None
+    
+    @property
+    def session(self):
+        """HTTP session for external checks; requests is only imported when needed."""
+        if self._session is None:
+            import requests
+            
+            self._session = requests.Session()
+            self._session.headers.update({
+                'User-Agent': 'ALCBFLinkValidator/1.0 (Website Link Checker)'
+            })
+        return self._session
     
     def validate_internal_links(self, results: ParseResults) -> Dict[str, List[LinkInfo]]:
         """Validate internal links by checking if files exist."""
@@ -44,14 +59,30 @@ class LinkValidator:
             'invalid_format': []
         }
         
-        for link in internal_links:
-            if self._validate_internal_link(link):
-                validation_results['valid'].append(link)
-            else:
-                validation_results['missing'].append(link)
+        with self.profiler.phase('validate_internal'):
+            for link in internal_links:
+                if self._validate_internal_link(link):
+                    validation_results['valid'].append(link)
+                else:
+                    validation_results['missing'].append(link)
         
+        self.profiler.count('links_validated', len(internal_links))
         return validation_results
     
+    @property
+    def api_routes(self) -> ApiRouteTable:
+        """Serverless routes from the api/ directory, built on first use."""
+        if self._api_routes is None:
+            self._api_routes = ApiRouteTable(self.project_root)
+        return self._api_routes
+    
+    @property
+    def vercel(self) -> VercelConfig:
+        """Rewrites and redirects compiled from vercel.json, built on first use."""
+        if self._vercel is None:
+            self._vercel = VercelConfig(self.project_root)
+        return self._vercel
+    
     def _validate_internal_link(self, link: LinkInfo) -> bool:
         """Check if an internal link points to an existing file or valid route."""
         href = link.href
@@ -59,7 +90,22 @@ class LinkValidator:
         # Skip anchor links
         if href.startswith('#'):
             return True
+        
+        # API calls map onto the serverless functions under api/
+        if href.startswith('/api/'):
+            if link.attributes.get('dynamic'):
+                return self.api_routes.matches_prefix(href)
+            return self.api_routes.match(href) is not None
+        
+        # Only the static prefix of a runtime-built URL is known
+        if link.attributes.get('dynamic'):
+            return True
             
+        # Stylesheet and script references resolve relative to the file itself
+        base_dir = Path(self.project_root)
+        if link.tag.startswith(('css-', 'js-')) and not href.startswith('/'):
+            base_dir = Path(link.source_file).parent
+        
         # Clean the href
         if href.startswith('/'):
             href = href[1:]  # Remove leading slash
@@ -73,20 +119,30 @@ class LinkValidator:
         # Check for file extensions
         if '.' in href:
             # Direct file check
-            file_path = Path(self.project_root) / href
+            file_path = base_dir / href
+            self.profiler.count('stat_calls')
             return file_path.exists()
         else:
             # Route-based check (for pages like /about, /artists)
+            if link.href.startswith('/') and self.vercel.resolve_page(link.href) is not None:
+                return True
+            
             possible_paths = [
                 Path(self.project_root) / f"{href}.html",
                 Path(self.project_root) / "pages" / f"{href}.html",
                 Path(self.project_root) / href / "index.html"
             ]
             
-            return any(path.exists() for path in possible_paths)
+            for path in possible_paths:
+                self.profiler.count('stat_calls')
+                if path.exists():
+                    return True
+            return False
     
     def validate_external_links(self, results: ParseResults, timeout: int = 10) -> Dict[str, List[LinkInfo]]:
         """Validate external links by making HTTP requests."""
+        import requests
+        
         external_links = [link for link in results.links 
                          if link.href.startswith(('http://', 'https://'))]
         
@@ -97,21 +153,23 @@ class LinkValidator:
             'error': []
         }
         
-        for link in external_links:
-            try:
-                response = self.session.head(link.href, timeout=timeout, allow_redirects=True)
-                if response.status_code < 400:
-                    validation_results['valid'].append(link)
-                else:
-                    link.error_message = f"HTTP {response.status_code}"
-                    validation_results['invalid'].append(link)
-                    
-            except requests.Timeout:
-                link.error_message = "Request timeout"
-                validation_results['timeout'].append(link)
-            except requests.RequestException as e:
-                link.error_message = str(e)
-                validation_results['error'].append(link)
+        with self.profiler.phase('validate_external'):
+            for link in external_links:
+                try:
+                    self.profiler.count('http_requests')
+                    response = self.session.head(link.href, timeout=timeout, allow_redirects=True)
+                    if response.status_code < 400:
+                        validation_results['valid'].append(link)
+                    else:
+                        link.error_message = f"HTTP {response.status_code}"
+                        validation_results['invalid'].append(link)
+                        
+                except requests.Timeout:
+                    link.error_message = "Request timeout"
+                    validation_results['timeout'].append(link)
+                except requests.RequestException as e:
+                    link.error_message = str(e)
+                    validation_results['error'].append(link)
         
         return validation_results
     
@@ -149,6 +207,9 @@ class LinkValidator:
 class LinkReporter:
     """Generate reports from link parsing and validation results."""
     
+    def __init__(self, profiler: Optional[Profiler] = None):
+        self.profiler = get_profiler(profiler)
+    
     def generate_summary_report(self, results: ParseResults, validation_results: Dict = None) -> str:
         """Generate a human-readable summary report."""
         report = []
@@ -237,6 +298,9 @@ class LinkReporter:
             }
         }
         
+        if self.profiler.enabled:
+            report['profile'] = self.profiler.to_dict()
+        
         if validation_results:
             report['validation'] = {}
             for category, subcategories in validation_results.items():
@@ -270,22 +334,23 @@ class LinkReporter:
     
     def save_report(self, content: str, filename: str):
         """Save report content to file."""
-        with open(filename, 'w', encoding='utf-8') as f:
+        with self.profiler.phase('report_write'), open(filename, 'w', encoding='utf-8') as f:
             f.write(content)
     
     def save_json_report(self, data: Dict, filename: str):
         """Save JSON report to file."""
-        with open(filename, 'w', encoding='utf-8') as f:
+        with self.profiler.phase('report_write'), open(filename, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
 
 
 class LinkAnalyzer:
     """High-level interface for comprehensive link analysis."""
     
-    def __init__(self, project_root: str = None):
-        self.extractor = HTMLLinkExtractor(project_root)
-        self.validator = LinkValidator(project_root)
-        self.reporter = LinkReporter()
+    def __init__(self, project_root: str = None, profiler: Optional[Profiler] = None):
+        self.profiler = get_profiler(profiler)
+        self.extractor = HTMLLinkExtractor(project_root, profiler=self.profiler)
+        self.validator = LinkValidator(project_root, profiler=self.profiler)
+        self.reporter = LinkReporter(profiler=self.profiler)
     
     def run_full_analysis(self, validate_external: bool = False) -> Tuple[ParseResults, Dict]:
         """Run complete link analysis and validation."""
@@ -297,13 +362,22 @@ class LinkAnalyzer:
         
         validation_results = {'internal': internal_validation}
         
+        print("Scanning stylesheets...")
+        stylesheet_results = self.extractor.parse_stylesheets(results)
+        validation_results['stylesheets'] = self.validator.validate_internal_links(stylesheet_results)
+        
+        print("Scanning scripts...")
+        script_results = self.extractor.parse_scripts(results)
+        validation_results['scripts'] = self.validator.validate_internal_links(script_results)
+        
         if validate_external:
             print("Validating external links...")
             external_validation = self.validator.validate_external_links(results)
             validation_results['external'] = external_validation
         
         print("Checking accessibility attributes...")
-        accessibility_issues = self.validator.check_accessibility_attributes(results)
+        with self.profiler.phase('accessibility'):
+            accessibility_issues = self.validator.check_accessibility_attributes(results)
         validation_results['accessibility'] = accessibility_issues
         
         return results, validation_results
@@ -311,11 +385,13 @@ class LinkAnalyzer:
     def generate_reports(self, results: ParseResults, validation_results: Dict):
         """Generate and save all reports."""
         # Summary report
-        summary = self.reporter.generate_summary_report(results, validation_results)
+        with self.profiler.phase('report'):
+            summary = self.reporter.generate_summary_report(results, validation_results)
         self.reporter.save_report(summary, 'link_analysis_summary.txt')
         
         # Detailed JSON report
-        json_report = self.reporter.generate_detailed_json_report(results, validation_results)
+        with self.profiler.phase('report'):
+            json_report = self.reporter.generate_detailed_json_report(results, validation_results)
         self.reporter.save_json_report(json_report, 'link_analysis_detailed.json')
         
         print("Reports saved:")
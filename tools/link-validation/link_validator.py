@@ -19,6 +19,43 @@ import json
 from urllib.parse import urlparse, urljoin
 from typing import List, Dict, Set, Tuple, Optional, Union
 from pathlib import Path
+from .api_routes import ApiRouteTable
+from .css_scanner import scan_css_text
+from .js_scanner import JS_SCRIPT_TYPES, JSReference, scan_js_text
+from .profiling import Profiler, get_profiler
+from .service_worker import DEFAULT_MANIFESTS, DEFAULT_SCRIPTS, extract_manifest_urls, extract_precache_urls
+from .srcset import SRCSET_TAG, parse_srcset
+from .vercel_config import VercelConfig
+
+
+# Inline <script> blocks without a src attribute
+INLINE_SCRIPT_PATTERN = re.compile(
+    r'<script\b(?P<attrs>(?:(?!\bsrc\s*=)[^>])*)>(?P<body>.*?)</script\s*>',
+    re.IGNORECASE | re.DOTALL
+)
+SCRIPT_TYPE_PATTERN = re.compile(r'\btype\s*=\s*["\']([^"\']*)["\']', re.IGNORECASE)
+
+
+def load_config(project_root: Union[str, Path], config_path: Optional[str] = None) -> Dict:
+    """Load link validation configuration from JSON file"""
+    if config_path is None:
+        config_path = Path(project_root) / "tools" / "link-validation" / "link_validation_config.json"
+    
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        # Return default config if file not found or invalid
+        return {
+            "validation_settings": {
+                "skip_dns_prefetch": True,
+                "skip_protocol_relative": True
+            },
+            "exclusion_patterns": {
+                "dns_prefetch_links": ["//fonts.googleapis.com", "//fonts.gstatic.com"],
+                "protocol_relative_pattern": "^//[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}"
+            }
+        }
 
 
 class LinkValidationResult:
@@ -35,14 +72,84 @@ class LinkValidationResult:
     def __str__(self):
         status = "✅" if self.is_valid else "❌"
         return f"{status} [{self.link_type}] {self.link}"
+    
+    def to_dict(self) -> Dict:
+        """Convert the result to a JSON-serializable dictionary"""
+        return {
+            'link': self.link,
+            'is_valid': self.is_valid,
+            'link_type': self.link_type,
+            'target_path': self.target_path,
+            'error_message': self.error_message
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'LinkValidationResult':
+        """Rebuild a result from its JSON dictionary form"""
+        return cls(
+            link=data['link'],
+            is_valid=data['is_valid'],
+            link_type=data['link_type'],
+            target_path=data.get('target_path'),
+            error_message=data.get('error_message')
+        )
+
+
+def summarize_results(all_results: Dict[str, List[LinkValidationResult]]) -> Tuple[Dict, Dict[str, List[Dict]]]:
+    """Aggregate per-file results into summary totals and issues grouped by link type
+    
+    The same broken link on several pages is one issue listing every page
+    ('pages'); 'file' is the first of them.
+    """
+    total_links = 0
+    valid_links = 0
+    issues_by_type = {}
+    issue_index = {}
+    
+    for file_path, file_results in all_results.items():
+        for result in file_results:
+            total_links += 1
+            if result.is_valid:
+                valid_links += 1
+            else:
+                key = (result.link_type, result.link, result.error_message)
+                issue = issue_index.get(key)
+                if issue is None:
+                    issue = issue_index[key] = {
+                        'file': file_path,
+                        'link': result.link,
+                        'error': result.error_message,
+                        'pages': []
+                    }
+                    issues_by_type.setdefault(result.link_type, []).append(issue)
+                if file_path not in issue['pages']:
+                    issue['pages'].append(file_path)
+    
+    for issue in issue_index.values():
+        issue['pages'].sort()
+        issue['file'] = issue['pages'][0]
+    
+    summary = {
+        'total_links': total_links,
+        'valid_links': valid_links,
+        'invalid_links': total_links - valid_links,
+        'validation_rate': round((valid_links / total_links) * 100, 2) if total_links > 0 else 0
+    }
+    return summary, issues_by_type
 
 
 class LinkValidator:
     """Comprehensive link validator for the A Lo Cubano Boulder Fest website"""
     
-    def __init__(self, project_root: str, config_path: Optional[str] = None):
-        """Initialize validator with project root directory"""
+    def __init__(self, project_root: str, config_path: Optional[str] = None,
+                 profiler: Optional[Profiler] = None, site_index=None):
+        """Initialize validator with project root directory
+        
+        Pass a SiteIndex to reuse a file and route index built elsewhere (for
+        example by another test worker) instead of walking the tree again.
+        """
         self.project_root = Path(project_root).resolve()
+        self.profiler = get_profiler(profiler)
         self.pages_dir = self.project_root / "pages"
         self.css_dir = self.project_root / "css"
         self.js_dir = self.project_root / "js"
@@ -54,38 +161,110 @@ class LinkValidator:
         
         # Cache of existing files for performance
         self._file_cache = {}
-        self._build_file_cache()
+        self._api_routes = None
+        if site_index is not None:
+            self._file_cache = site_index.file_cache()
+            self._api_routes = site_index.api_routes
+        else:
+            self._build_file_cache()
+        self._vercel = None
+        self._resource_hint_auditor = None
+        self._resource_hint_findings: Dict[str, List] = {}
+        self._responsive_images = None
+        self._service_worker_files = None
+        self._image_proxy_ids = None
     
     def _load_config(self, config_path: Optional[str] = None) -> Dict:
         """Load configuration from JSON file"""
-        if config_path is None:
-            config_path = self.project_root / "tools" / "link-validation" / "link_validation_config.json"
-        
-        try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            # Return default config if file not found or invalid
-            return {
-                "validation_settings": {
-                    "skip_dns_prefetch": True,
-                    "skip_protocol_relative": True
-                },
-                "exclusion_patterns": {
-                    "dns_prefetch_links": ["//fonts.googleapis.com", "//fonts.gstatic.com"],
-                    "protocol_relative_pattern": "^//[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}",
-                    "skip_rel_attributes": ["dns-prefetch", "preconnect", "prefetch"]
-                }
-            }
+        return load_config(self.project_root, config_path)
     
     def _build_file_cache(self) -> None:
         """Build cache of all existing files for fast lookups"""
-        for directory in [self.pages_dir, self.css_dir, self.js_dir, self.images_dir, self.api_dir]:
-            if directory.exists():
-                for file_path in directory.rglob("*"):
-                    if file_path.is_file():
-                        relative_path = file_path.relative_to(self.project_root)
-                        self._file_cache[str(relative_path)] = file_path
+        with self.profiler.phase('file_cache'):
+            for directory in [self.pages_dir, self.css_dir, self.js_dir, self.images_dir, self.api_dir]:
+                if directory.exists():
+                    for file_path in directory.rglob("*"):
+                        if file_path.is_file():
+                            relative_path = file_path.relative_to(self.project_root)
+                            self._file_cache[str(relative_path)] = file_path
+        self.profiler.count('files_indexed', len(self._file_cache))
+    
+    @property
+    def api_routes(self) -> ApiRouteTable:
+        """Serverless routes from the api/ directory, built on first use"""
+        if self._api_routes is None:
+            with self.profiler.phase('api_routes'):
+                self._api_routes = ApiRouteTable(self.project_root)
+        return self._api_routes
+    
+    @property
+    def vercel(self) -> VercelConfig:
+        """Rewrites and redirects compiled from vercel.json, built on first use"""
+        if self._vercel is None:
+            self._vercel = VercelConfig(self.project_root)
+        return self._vercel
+    
+    def page_resource_hint_findings(self, source_file: str) -> List:
+        """Resource hint audit of one page, run on first use and kept per page"""
+        page = os.path.abspath(source_file)
+        findings = self._resource_hint_findings.get(page)
+        if findings is None:
+            if self._resource_hint_auditor is None:
+                from .html_link_parser import HTMLLinkExtractor
+                from .resource_hints import ResourceHintAuditor
+                
+                self._resource_hint_auditor = (
+                    HTMLLinkExtractor(str(self.project_root), profiler=self.profiler),
+                    ResourceHintAuditor(str(self.project_root), profiler=self.profiler, config=self.config)
+                )
+            extractor, auditor = self._resource_hint_auditor
+            findings = auditor.audit(extractor.parse_file(page)).get(page, [])
+            self._resource_hint_findings[page] = findings
+        return findings
+    
+    @property
+    def responsive_images(self):
+        """Checker for srcset candidate widths and icon sizes, built on first use"""
+        if self._responsive_images is None:
+            from .responsive_images import ResponsiveImageAuditor
+            
+            self._responsive_images = ResponsiveImageAuditor(
+                str(self.project_root), profiler=self.profiler, config=self.config
+            )
+        return self._responsive_images
+    
+    @property
+    def image_proxy_ids(self):
+        """Known image proxy file IDs from local manifests, opened on first use"""
+        if self._image_proxy_ids is None:
+            from .image_proxy_ids import DEFAULT_FALSE_POSITIVE_RATE, ImageProxyIndex
+            
+            settings = self.config.get("image_proxy", {})
+            self._image_proxy_ids = ImageProxyIndex(
+                self.project_root,
+                manifests=settings.get("id_manifests"),
+                false_positive_rate=settings.get("false_positive_rate", DEFAULT_FALSE_POSITIVE_RATE),
+                profiler=self.profiler
+            )
+        return self._image_proxy_ids
+    
+    def get_cached_files(self) -> Dict[str, Path]:
+        """Return the project-relative path to file mapping built at startup"""
+        return self._file_cache
+    
+    def _path_exists(self, path: Path) -> bool:
+        """Check whether a file exists, consulting the file cache before the filesystem"""
+        try:
+            relative_path = str(path.relative_to(self.project_root))
+        except ValueError:
+            relative_path = None
+        
+        if relative_path in self._file_cache:
+            self.profiler.count('cache_hits')
+            return True
+        
+        self.profiler.count('stat_calls')
+        return path.exists()
     
     def _should_skip_link(self, link: str, link_attributes: Dict[str, str] = None) -> Tuple[bool, str]:
         """Check if a link should be skipped based on configuration patterns"""
@@ -95,12 +274,6 @@ class LinkValidator:
         exclusions = self.config.get("exclusion_patterns", {})
         settings = self.config.get("validation_settings", {})
         
-        # Skip DNS prefetch and similar rel attributes
-        rel_attr = link_attributes.get("rel", "").lower()
-        skip_rel_attrs = exclusions.get("skip_rel_attributes", [])
-        if rel_attr in skip_rel_attrs:
-            return True, f"Skipped: rel='{rel_attr}' link (DNS prefetch/preconnect)"
-        
         # Skip specific DNS prefetch links
         dns_prefetch_links = exclusions.get("dns_prefetch_links", [])
         if link in dns_prefetch_links:
@@ -180,34 +353,46 @@ class LinkValidator:
         # Static JSON files in public directory
         if path == 'featured-photos.json':
             target_file = self.project_root / "public" / "featured-photos.json"
+            exists = self._path_exists(target_file)
             return LinkValidationResult(
                 link=link,
-                is_valid=target_file.exists(),
+                is_valid=exists,
                 link_type="internal",
-                target_path=str(target_file) if target_file.exists() else None,
-                error_message=None if target_file.exists() else f"Featured photos JSON not found: {target_file}"
+                target_path=str(target_file) if exists else None,
+                error_message=None if exists else f"Featured photos JSON not found: {target_file}"
             )
         
         # Gallery data JSON files
         if path.startswith('gallery-data/') and path.endswith('.json'):
             target_file = self.project_root / "public" / path
+            exists = self._path_exists(target_file)
             return LinkValidationResult(
                 link=link,
-                is_valid=target_file.exists(),
+                is_valid=exists,
                 link_type="internal",
-                target_path=str(target_file) if target_file.exists() else None,
-                error_message=None if target_file.exists() else f"Gallery data JSON not found: {target_file}"
+                target_path=str(target_file) if exists else None,
+                error_message=None if exists else f"Gallery data JSON not found: {target_file}"
             )
         
         # Check for direct asset access
         if any(path.startswith(asset_type + '/') for asset_type in ['css', 'js', 'images']):
             return self._validate_asset_link(link)
         
+        # Clean URLs, redirects and rewrites declared in vercel.json
+        routed_page = self.vercel.resolve_page(link)
+        if routed_page is not None:
+            return LinkValidationResult(
+                link=link,
+                is_valid=True,
+                link_type="internal",
+                target_path=str(routed_page)
+            )
+        
         # Clean URL routing logic from server.py lines 194-207
         # Try adding .html extension for page links
         html_file_path = self.pages_dir / f"{path}.html"
         
-        if html_file_path.exists():
+        if self._path_exists(html_file_path):
             return LinkValidationResult(
                 link=link,
                 is_valid=True,
@@ -216,20 +401,18 @@ class LinkValidator:
             )
         
         # Check if it's a directory with index.html
-        dir_path = self.pages_dir / path
-        if dir_path.is_dir():
-            index_path = dir_path / "index.html"
-            if index_path.exists():
-                return LinkValidationResult(
-                    link=link,
-                    is_valid=True,
-                    link_type="internal",
-                    target_path=str(index_path)
-                )
+        index_path = self.pages_dir / path / "index.html"
+        if self._path_exists(index_path):
+            return LinkValidationResult(
+                link=link,
+                is_valid=True,
+                link_type="internal",
+                target_path=str(index_path)
+            )
         
         # Check root level files
         root_file = self.project_root / f"{path}.html"
-        if root_file.exists():
+        if self._path_exists(root_file):
             return LinkValidationResult(
                 link=link,
                 is_valid=True,
@@ -262,7 +445,7 @@ class LinkValidator:
             asset_type = "asset"
         
         # Check if file exists (ignoring query parameters)
-        is_valid = target_file.exists()
+        is_valid = self._path_exists(target_file)
         query_info = f" (with query: {parsed.query})" if parsed.query else ""
         
         return LinkValidationResult(
@@ -297,8 +480,17 @@ class LinkValidator:
                 target_path=f"Server endpoint: {path}"
             )
         
-        # Check image proxy pattern
+        # Check image proxy pattern, and the ID itself when a manifest of known IDs exists
         if re.match(image_proxy_pattern, path):
+            file_id = path.rsplit('/', 1)[1]
+            known_ids = self.image_proxy_ids
+            if known_ids.available and file_id not in known_ids:
+                return LinkValidationResult(
+                    link=link,
+                    is_valid=False,
+                    link_type="api",
+                    error_message=f"Unknown image proxy file ID: {file_id} (not in {known_ids.describe()})"
+                )
             return LinkValidationResult(
                 link=link,
                 is_valid=True,
@@ -306,6 +498,16 @@ class LinkValidator:
                 target_path=f"Image proxy endpoint: {path}"
             )
         
+        # Fall back to the serverless functions under api/
+        source = self.api_routes.match(link)
+        if source is not None:
+            return LinkValidationResult(
+                link=link,
+                is_valid=True,
+                link_type="api",
+                target_path=f"Serverless function: {source}"
+            )
+        
         return LinkValidationResult(
             link=link,
             is_valid=False,
@@ -490,7 +692,7 @@ class LinkValidator:
         try:
             target_path = (source_dir / link).resolve()
             
-            if target_path.exists():
+            if self._path_exists(target_path):
                 return LinkValidationResult(
                     link=link,
                     is_valid=True,
@@ -518,7 +720,7 @@ class LinkValidator:
         
         # Enhanced pattern to capture link tags with attributes
         # This pattern captures the entire link tag to extract all attributes
-        link_tag_pattern = r'<(\w+)([^>]*?(?:href|src|action)=[^>]*?)>'
+        link_tag_pattern = r'<(\w+)([^>]*?(?:href|src|srcset|action)=[^>]*?)>'
         
         for match in re.finditer(link_tag_pattern, html_content, re.IGNORECASE | re.DOTALL):
             attributes_str = match.group(2)
@@ -544,30 +746,149 @@ class LinkValidator:
             # Skip javascript: and data: URLs
             if link_url and not link_url.startswith(('javascript:', 'data:')):
                 links.append((link_url, attributes))
+            
+            # Each srcset candidate is a link of its own, carrying its descriptor
+            tag = match.group(1).lower()
+            if tag in ('img', 'source') and attributes.get('srcset'):
+                for candidate in parse_srcset(attributes['srcset']):
+                    if candidate.url.startswith('data:'):
+                        continue
+                    candidate_attributes = {'element': tag, 'descriptor': candidate.descriptor}
+                    for name in ('sizes', 'width'):
+                        if name in attributes:
+                            candidate_attributes[name] = attributes[name]
+                    links.append((candidate.url, candidate_attributes))
         
         # Remove duplicates while preserving attributes
         seen = set()
         unique_links = []
         for link_url, attrs in links:
-            if link_url not in seen:
-                seen.add(link_url)
+            key = (link_url, attrs.get('descriptor'))
+            if key not in seen:
+                seen.add(key)
                 unique_links.append((link_url, attrs))
         
         return unique_links
     
     def validate_file_links(self, file_path: str) -> List[LinkValidationResult]:
         """Validate all links found in a specific HTML file"""
+        profiler = self.profiler
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            with profiler.file(file_path):
+                with profiler.phase('read'):
+                    with open(file_path, 'r', encoding='utf-8') as f:
+                        content = f.read()
+                
+                with profiler.phase('regex_extract'):
+                    links_with_attrs = self.extract_links_from_html(content)
+                results = []
+                
+                with profiler.phase('validate'):
+                    for link_url, attributes in links_with_attrs:
+                        if 'descriptor' in attributes:
+                            result = self.validate_srcset_candidate(link_url, file_path, attributes)
+                        elif 'rel' in attributes:
+                            result = self.validate_resource_hint(link_url, file_path, attributes)
+                        else:
+                            result = self.validate_link(link_url, file_path, attributes)
+                        results.append(result)
+                
+                with profiler.phase('js_scan'):
+                    references = self.extract_inline_script_references(content)
+                with profiler.phase('validate'):
+                    results.extend(self._validate_script_references(references, file_path))
             
-            links_with_attrs = self.extract_links_from_html(content)
-            results = []
+            profiler.count('links_validated', len(results))
+            return results
             
-            for link_url, attributes in links_with_attrs:
-                result = self.validate_link(link_url, file_path, attributes)
-                results.append(result)
+        except Exception as e:
+            return [LinkValidationResult(
+                link=file_path,
+                is_valid=False,
+                link_type="file",
+                error_message=f"Error reading file: {e}"
+            )]
+    
+    def validate_resource_hint(self, link: str, source_file: str, attributes: Dict[str, str]) -> LinkValidationResult:
+        """Audit preconnect, dns-prefetch and preload links against what the page loads
+        
+        Links whose rel is not an audited hint are validated as ordinary links.
+        """
+        from .resource_hints import CONNECTION_HINTS, PRELOAD_HINTS, hint_rel
+        
+        rel = hint_rel(attributes)
+        if rel not in CONNECTION_HINTS + PRELOAD_HINTS:
+            return self.validate_link(link, source_file, attributes)
+        
+        if rel in PRELOAD_HINTS:
+            # The preloaded file itself must exist
+            result = self.validate_link(link, source_file)
+            if not result.is_valid:
+                return result
+        
+        with self.profiler.phase('resource_hints'):
+            page_findings = self.page_resource_hint_findings(source_file)
+        problems = [finding.message for finding in page_findings if finding.target == link and finding.line_number]
+        return LinkValidationResult(
+            link=link,
+            is_valid=not problems,
+            link_type="resource_hint",
+            target_path=None if problems else f"{rel} hint in use",
+            error_message="; ".join(problems) if problems else None
+        )
+    
+    def page_warnings(self, source_file: str) -> List[Dict]:
+        """Advisory page-level findings (missing-preconnect, third-party-budget)
+        
+        These belong to no single link and nothing on the page is broken, so
+        they are reported as warnings rather than as invalid links.
+        """
+        if not source_file.endswith('.html'):
+            return []
+        with self.profiler.phase('resource_hints'):
+            page_findings = self.page_resource_hint_findings(source_file)
+        return [
+            {'rule': finding.rule, 'target': finding.target, 'message': finding.message}
+            for finding in page_findings if not finding.line_number
+        ]
+    
+    def validate_srcset_candidate(self, link: str, source_file: str, attributes: Dict[str, str]) -> LinkValidationResult:
+        """Check that a srcset candidate exists and that its descriptor matches the image"""
+        from .html_link_parser import LinkInfo
+        
+        result = self.validate_link(link, source_file)
+        if not result.is_valid:
+            return result
+        
+        candidate = LinkInfo(href=link, text="", source_file=source_file, line_number=0,
+                             tag=SRCSET_TAG, attributes=attributes)
+        with self.profiler.phase('srcset'):
+            problems = [finding.message for finding in self.responsive_images.check_candidate(candidate)]
+        return LinkValidationResult(
+            link=link,
+            is_valid=not problems,
+            link_type="srcset",
+            target_path=None if problems else result.target_path,
+            error_message="; ".join(problems) if problems else None
+        )
+    
+    def validate_stylesheet_links(self, file_path: str) -> List[LinkValidationResult]:
+        """Validate url() and @import references in a stylesheet"""
+        profiler = self.profiler
+        try:
+            with profiler.file(file_path):
+                with profiler.phase('read'):
+                    with open(file_path, 'r', encoding='utf-8') as f:
+                        content = f.read()
+                
+                with profiler.phase('css_scan'):
+                    references = scan_css_text(content)
+                
+                # Relative references resolve against the stylesheet's own directory
+                with profiler.phase('validate'):
+                    results = [self.validate_link(reference.href, file_path) for reference in references]
             
+            profiler.count('links_validated', len(results))
             return results
             
         except Exception as e:
@@ -578,16 +899,166 @@ class LinkValidator:
                 error_message=f"Error reading file: {e}"
             )]
     
-    def validate_all_site_links(self) -> Dict[str, List[LinkValidationResult]]:
-        """Validate links in all HTML files across the site"""
+    def extract_inline_script_references(self, html_content: str) -> List[JSReference]:
+        """Extract URL references from inline JavaScript blocks in HTML content"""
+        references = []
+        for match in INLINE_SCRIPT_PATTERN.finditer(html_content):
+            type_match = SCRIPT_TYPE_PATTERN.search(match.group('attrs'))
+            script_type = type_match.group(1).strip().lower() if type_match else ''
+            if script_type not in JS_SCRIPT_TYPES:
+                continue
+            line_offset = html_content.count('\n', 0, match.start('body'))
+            references.extend(scan_js_text(match.group('body'), line_offset=line_offset))
+        return references
+    
+    def validate_script_links(self, file_path: str) -> List[LinkValidationResult]:
+        """Validate fetch(), import and navigation references in a JavaScript module"""
+        profiler = self.profiler
+        try:
+            with profiler.file(file_path):
+                with profiler.phase('read'):
+                    with open(file_path, 'r', encoding='utf-8') as f:
+                        content = f.read()
+                
+                with profiler.phase('js_scan'):
+                    references = scan_js_text(content)
+                
+                with profiler.phase('validate'):
+                    results = self._validate_script_references(references, file_path)
+            
+            profiler.count('links_validated', len(results))
+            return results
+            
+        except Exception as e:
+            return [LinkValidationResult(
+                link=file_path,
+                is_valid=False,
+                link_type="file",
+                error_message=f"Error reading file: {e}"
+            )]
+    
+    def validate_precache_links(self, file_path: str) -> List[LinkValidationResult]:
+        """Validate the URLs a service worker precaches; one missing entry fails its install"""
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                entries = extract_precache_urls(f.read(), file_path)
+        except OSError as e:
+            return [LinkValidationResult(link=file_path, is_valid=False, link_type="file",
+                                         error_message=f"Error reading file: {e}")]
+        
+        results = []
+        with self.profiler.phase('validate'):
+            for entry in entries:
+                result = self.validate_link(entry.url, file_path)
+                results.append(LinkValidationResult(
+                    link=entry.url,
+                    is_valid=result.is_valid,
+                    link_type="precache",
+                    target_path=result.target_path,
+                    error_message=None if result.is_valid else
+                    f"Precache entry ({entry.field}, line {entry.line_number}): {result.error_message}"
+                ))
+        return results
+    
+    def validate_manifest_links(self, file_path: str) -> List[LinkValidationResult]:
+        """Validate start_url, scope, icons and shortcuts of a web app manifest"""
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                entries = extract_manifest_urls(json.load(f), file_path)
+        except (OSError, ValueError) as e:
+            return [LinkValidationResult(link=file_path, is_valid=False, link_type="file",
+                                         error_message=f"Error reading manifest: {e}")]
+        
+        results = []
+        with self.profiler.phase('validate'):
+            for entry in entries:
+                result = self.validate_link(entry.url, file_path)
+                results.append(LinkValidationResult(
+                    link=entry.url,
+                    is_valid=result.is_valid,
+                    link_type="manifest",
+                    target_path=result.target_path,
+                    error_message=None if result.is_valid else f"Manifest {entry.field}: {result.error_message}"
+                ))
+        return results
+    
+    def _validate_script_references(self, references: List[JSReference], file_path: str) -> List[LinkValidationResult]:
+        """Validate script references; URLs built at runtime are checked by prefix only"""
+        results = []
+        for reference in references:
+            if not reference.dynamic:
+                results.append(self.validate_link(reference.href, file_path))
+            elif reference.href.startswith('/api/'):
+                is_valid = self.api_routes.matches_prefix(reference.href)
+                results.append(LinkValidationResult(
+                    link=reference.href,
+                    is_valid=is_valid,
+                    link_type="api",
+                    target_path="Dynamic API prefix" if is_valid else None,
+                    error_message=None if is_valid else f"No API route matches prefix: {reference.href}"
+                ))
+            else:
+                results.append(LinkValidationResult(
+                    link=reference.href,
+                    is_valid=True,
+                    link_type="skipped",
+                    target_path="Skipped: URL built at runtime"
+                ))
+        return results
+    
+    @property
+    def service_worker_files(self) -> Tuple[Set[Path], Set[Path]]:
+        """Configured service worker scripts and web manifests that exist, found on first use"""
+        if self._service_worker_files is None:
+            settings = self.config.get("service_workers", {})
+            scripts = {self.project_root / path for path in settings.get("scripts", DEFAULT_SCRIPTS)}
+            manifests = {self.project_root / path for path in settings.get("manifests", DEFAULT_MANIFESTS)}
+            self._service_worker_files = (
+                {path for path in scripts if path.is_file()},
+                {path for path in manifests if path.is_file()}
+            )
+        return self._service_worker_files
+    
+    def discover_site_files(self) -> List[Path]:
+        """List the HTML files, stylesheets, scripts, service workers and manifests validated site-wide"""
+        with self.profiler.phase('discover'):
+            # Root-level pages plus every page under pages/, including section subdirectories
+            html_files = sorted(self.project_root.glob("*.html"))
+            if self.pages_dir.exists():
+                html_files += sorted(self.pages_dir.rglob("*.html"))
+            stylesheets = sorted(self.css_dir.rglob("*.css")) if self.css_dir.exists() else []
+            scripts = sorted(self.js_dir.rglob("*.js")) if self.js_dir.exists() else []
+            workers, manifests = self.service_worker_files
+            extra = sorted((workers | manifests) - set(scripts))
+        return html_files + stylesheets + scripts + extra
+    
+    def validate_site_file(self, file_path: Path) -> List[LinkValidationResult]:
+        """Validate one site file with the checker matching its type"""
+        workers, manifests = self.service_worker_files
+        if file_path in manifests:
+            return self.validate_manifest_links(str(file_path))
+        if file_path.suffix == '.css':
+            return self.validate_stylesheet_links(str(file_path))
+        if file_path.suffix == '.js':
+            results = self.validate_script_links(str(file_path))
+            if file_path in workers:
+                results.extend(self.validate_precache_links(str(file_path)))
+            return results
+        return self.validate_file_links(str(file_path))
+    
+    def validate_all_site_links(self, files: Optional[List[Path]] = None) -> Dict[str, List[LinkValidationResult]]:
+        """Validate links in all HTML files, stylesheets and scripts across the site
+        
+        Pass files to validate a subset, e.g. one shard of discover_site_files().
+        """
         results = {}
         
-        # Validate links in all HTML files
-        html_files = list(self.project_root.glob("*.html")) + list(self.pages_dir.glob("*.html"))
+        if files is None:
+            files = self.discover_site_files()
         
-        for html_file in html_files:
-            relative_path = html_file.relative_to(self.project_root)
-            results[str(relative_path)] = self.validate_file_links(str(html_file))
+        for file_path in files:
+            relative_path = file_path.relative_to(self.project_root)
+            results[str(relative_path)] = self.validate_site_file(file_path)
         
         return results
     
@@ -599,11 +1070,14 @@ class LinkValidator:
         valid_urls.add('/')
         valid_urls.add('/home')  # Root redirects here
         
-        # Add all pages that exist
+        # Add all pages that exist, as the clean URLs _validate_internal_link resolves:
+        # pages/core/tickets.html is /core/tickets, pages/admin/index.html is /admin
         if self.pages_dir.exists():
-            for html_file in self.pages_dir.glob("*.html"):
-                page_name = html_file.stem
-                valid_urls.add(f'/{page_name}')
+            for html_file in self.pages_dir.rglob("*.html"):
+                page = html_file.relative_to(self.pages_dir).with_suffix('')
+                if page.name == 'index' and page.parent != Path('.'):
+                    page = page.parent
+                valid_urls.add(f'/{page.as_posix()}')
         
         # Add known API endpoints
         api_endpoints = [
@@ -616,40 +1090,43 @@ class LinkValidator:
         
         return valid_urls
     
-    def generate_link_validation_report(self) -> Dict:
+    def generate_link_validation_report(self, files: Optional[List[Path]] = None) -> Dict:
         """Generate comprehensive link validation report"""
-        all_results = self.validate_all_site_links()
-        
-        # Aggregate statistics
-        total_links = 0
-        valid_links = 0
-        issues_by_type = {}
-        
-        for file_path, file_results in all_results.items():
-            for result in file_results:
-                total_links += 1
-                if result.is_valid:
-                    valid_links += 1
-                else:
-                    if result.link_type not in issues_by_type:
-                        issues_by_type[result.link_type] = []
-                    issues_by_type[result.link_type].append({
-                        'file': file_path,
-                        'link': result.link,
-                        'error': result.error_message
-                    })
+        all_results = self.validate_all_site_links(files)
         
-        return {
-            'summary': {
-                'total_links': total_links,
-                'valid_links': valid_links,
-                'invalid_links': total_links - valid_links,
-                'validation_rate': round((valid_links / total_links) * 100, 2) if total_links > 0 else 0
-            },
-            'issues_by_type': issues_by_type,
-            'detailed_results': all_results,
-            'valid_internal_urls': sorted(list(self.get_all_valid_internal_urls()))
-        }
+        with self.profiler.phase('report'):
+            # Aggregate statistics
+            summary, issues_by_type = summarize_results(all_results)
+            warnings = {}
+            for relative_path in all_results:
+                page_warnings = self.page_warnings(str(self.project_root / relative_path))
+                if page_warnings:
+                    warnings[relative_path] = page_warnings
+            summary['warnings'] = sum(len(items) for items in warnings.values())
+            
+            report = {
+                'summary': summary,
+                'issues_by_type': issues_by_type,
+                'warnings': warnings,
+                'detailed_results': all_results,
+                'valid_internal_urls': sorted(list(self.get_all_valid_internal_urls()))
+            }
+        
+        if self.profiler.enabled:
+            report['profile'] = self.profiler.to_dict()
+        
+        return report
+    
+    def save_json_report(self, report: Dict, filename: str) -> None:
+        """Save a validation report as JSON, serializing detailed results"""
+        with self.profiler.phase('report_write'):
+            data = dict(report)
+            data['detailed_results'] = {
+                file_path: [result.to_dict() for result in file_results]
+                for file_path, file_results in report['detailed_results'].items()
+            }
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
 
 
 # Convenience functions for testing framework integration
@@ -672,33 +1149,228 @@ def get_site_link_validation_report(project_root: str) -> Dict:
     return validator.generate_link_validation_report()
 
 
-if __name__ == "__main__":
-    # Example usage for testing
+def merge_main(argv: List[str]) -> None:
+    """Merge shard JSON reports: link_validator merge shard-1.json shard-2.json -o merged.json"""
+    import argparse
+    from .sharding import load_report, merge_reports
+    
+    parser = argparse.ArgumentParser(
+        prog="link_validator merge",
+        description="Merge sharded link validation reports into one report"
+    )
+    parser.add_argument('reports', nargs='+', help='Shard JSON reports written with --json/--output')
+    parser.add_argument('-o', '--output', default='link_validation_merged.json',
+                        help='Merged report file (default: link_validation_merged.json)')
+    args = parser.parse_args(argv)
+    
+    merged = merge_reports([load_report(path) for path in args.reports])
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(merged, f, indent=2, ensure_ascii=False)
+    
+    summary = merged['summary']
+    print(f"📊 Merged {len(args.reports)} reports ({len(merged['detailed_results'])} files):")
+    print(f"   Total links: {summary['total_links']}")
+    print(f"   Valid links: {summary['valid_links']}")
+    print(f"   Invalid links: {summary['invalid_links']}")
+    print(f"   Validation rate: {summary['validation_rate']}%")
+    print(f"   Warnings: {summary['warnings']}")
+    missing = merged['merged_from'].get('missing_shards')
+    if missing:
+        print(f"⚠️  Missing shards: {', '.join(str(index) for index in missing)}")
+    print(f"\n📄 Merged report saved to {args.output}")
+
+
+def main():
+    """Command-line entry point for site-wide link validation"""
+    import argparse
     import sys
     
-    project_root = sys.argv[1] if len(sys.argv) > 1 else "."
+    if len(sys.argv) > 1 and sys.argv[1] == 'merge':
+        merge_main(sys.argv[2:])
+        return
+    
+    parser = argparse.ArgumentParser(
+        description="A Lo Cubano Boulder Fest - Link Validation"
+    )
+    parser.add_argument('project_root', nargs='?', default='.',
+                        help='Project root directory (default: current directory)')
+    parser.add_argument('--json', action='store_true',
+                        help='Also write the report to the configured JSON output file')
+    parser.add_argument('--output', type=str, metavar='FILE',
+                        help='Write the JSON report to FILE (implies --json)')
+    parser.add_argument('--shard', type=str, metavar='I/N',
+                        help="Validate only shard I of N (e.g. 2/4); merge results with 'merge'")
+    parser.add_argument('--diff-from', type=str, metavar='RUN',
+                        help="Only report changes since a recorded run ('last' or a run id)")
+    parser.add_argument('--no-history', action='store_true',
+                        help='Do not record this run in the local run history')
+    parser.add_argument('--list-runs', action='store_true',
+                        help='List recorded runs (of the given --shard, if any) and exit')
+    parser.add_argument('--build-dir', type=str, metavar='DIR',
+                        help="Validate a Vite build (e.g. dist) against its manifest instead of the source tree")
+    parser.add_argument('--profile', action='store_true',
+                        help='Print per-phase and per-file timings and counters')
+    parser.add_argument('--profile-memory', action='store_true',
+                        help='Include tracemalloc peak memory per phase (implies --profile)')
+    args = parser.parse_args()
+    
+    history_mode = None
+    if args.shard:
+        from .run_history import shard_mode
+        from .sharding import parse_shard_spec
+        
+        try:
+            shard_index, shard_count = parse_shard_spec(args.shard)
+        except ValueError as e:
+            parser.error(str(e))
+        history_mode = shard_mode(shard_index, shard_count)
+    
+    if args.list_runs:
+        from .run_history import RunHistory, SITE_MODE
+        
+        for run in RunHistory(args.project_root, mode=history_mode or SITE_MODE).runs():
+            counts = run['counts']
+            print(f"{run['run_id']}  {run['created_at']}  {counts.get('total', 0)} links, "
+                  f"{counts.get('invalid', 0)} invalid")
+        return
+    
+    profiler = None
+    if args.profile or args.profile_memory:
+        profiler = Profiler(trace_memory=args.profile_memory)
     
     print("🔗 A Lo Cubano Boulder Fest - Link Validation")
     print("=" * 50)
     
-    validator = LinkValidator(project_root)
-    report = validator.generate_link_validation_report()
+    if args.build_dir:
+        # Build output is a different set of files, so it never joins the source-tree history
+        if args.diff_from:
+            print("ℹ️  --diff-from is ignored with --build-dir; build runs are not recorded\n")
+        build_main(args, profiler)
+        return
+    
+    validator = LinkValidator(args.project_root, profiler=profiler)
+    
+    files = None
+    if args.shard:
+        from .sharding import select_shard
+        
+        files = select_shard(validator.discover_site_files(), validator.project_root, shard_index, shard_count)
+        print(f"🧩 Shard {shard_index}/{shard_count}: {len(files)} files")
+    
+    report = validator.generate_link_validation_report(files)
+    if args.shard:
+        report['shard'] = {'index': shard_index, 'count': shard_count, 'files': len(files)}
+    
+    history = None
+    run = None
+    if args.diff_from or not args.no_history:
+        from .run_history import RunHistory, RunRecord, SITE_MODE
+        
+        max_runs = validator.config.get("history", {}).get("max_runs", 50)
+        try:
+            # A shard only sees part of the site, so it is compared with earlier runs of the same shard
+            history = RunHistory(validator.project_root, max_runs=max_runs, mode=history_mode or SITE_MODE)
+        except ValueError as e:
+            parser.error(f"{e} (history.max_runs in link_validation_config.json)")
+        run = RunRecord.from_entries(history.new_run_id(), history_entries(report))
+    
+    if args.diff_from:
+        from .run_history import diff_runs, format_diff
+        
+        previous = history.load(args.diff_from)
+        if previous is None:
+            print(f"No recorded run matches '{args.diff_from}'; showing the full report.\n")
+        else:
+            print(format_diff(diff_runs(previous, run)))
+            finish_run(args, validator, report, history, run)
+            return
     
     print(f"📊 Summary:")
     print(f"   Total links: {report['summary']['total_links']}")
     print(f"   Valid links: {report['summary']['valid_links']}")
     print(f"   Invalid links: {report['summary']['invalid_links']}")
     print(f"   Validation rate: {report['summary']['validation_rate']}%")
+    print(f"   Warnings: {report['summary']['warnings']}")
     
     if report['issues_by_type']:
         print(f"\n❌ Issues by type:")
         for link_type, issues in report['issues_by_type'].items():
             print(f"   {link_type}: {len(issues)} issues")
             for issue in issues[:3]:  # Show first 3 issues per type
-                print(f"      • {issue['file']}: {issue['link']} - {issue['error']}")
+                others = len(issue['pages']) - 1
+                pages = f"{issue['file']} (+{others} more)" if others else issue['file']
+                print(f"      • {pages}: {issue['link']} - {issue['error']}")
             if len(issues) > 3:
                 print(f"      ... and {len(issues) - 3} more")
     
+    if report['warnings']:
+        print(f"\n⚠️  Warnings ({report['summary']['warnings']}, not counted as broken):")
+        for file_path, page_warnings in list(report['warnings'].items())[:5]:
+            for warning in page_warnings:
+                print(f"      • {file_path}: [{warning['rule']}] {warning['message']}")
+        if len(report['warnings']) > 5:
+            print(f"      ... and {len(report['warnings']) - 5} more pages")
+    
     print(f"\n✅ Valid internal URLs ({len(report['valid_internal_urls'])}):")
     for url in report['valid_internal_urls']:
-        print(f"   • {url}")
\ No newline at end of file
+        print(f"   • {url}")
+    
+    finish_run(args, validator, report, history, run)
+
+
+def build_main(args, profiler: Optional[Profiler]) -> None:
+    """Validate emitted build output against the Vite manifest and print bundle sizes"""
+    import sys
+    from .vite_build import BuildValidator, format_build_report
+    
+    config = load_config(Path(args.project_root).resolve())
+    validator = BuildValidator(args.project_root, args.build_dir, profiler=profiler, config=config)
+    try:
+        report = validator.validate()
+    except FileNotFoundError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    print(format_build_report(report))
+    
+    if args.json or args.output:
+        json_file = args.output or "build_validation_report.json"
+        with open(json_file, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n📄 JSON report saved to {json_file}")
+    
+    if validator.profiler.enabled:
+        print()
+        print(validator.profiler.format_report())
+        validator.profiler.stop()
+
+
+def history_entries(report: Dict):
+    """Yield (file, link, status, message) for every validated link in a report"""
+    for file_path, file_results in report['detailed_results'].items():
+        for result in file_results:
+            if result.link_type == "skipped":
+                status = "skipped"
+            else:
+                status = "valid" if result.is_valid else "invalid"
+            yield file_path, result.link, status, result.error_message
+
+
+def finish_run(args, validator: LinkValidator, report: Dict, history, run) -> None:
+    """Record the run, write the JSON report and print profiling output"""
+    if run is not None and not args.no_history:
+        history.record(run)
+        print(f"\n🗂  Recorded run {run.run_id}")
+    
+    if args.json or args.output:
+        json_file = args.output or validator.config.get("reporting", {}).get("json_output_file", "link_validation_results.json")
+        validator.save_json_report(report, json_file)
+        print(f"\n📄 JSON report saved to {json_file}")
+    
+    if validator.profiler.enabled:
+        print()
+        print(validator.profiler.format_report())
+        validator.profiler.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Live Site Crawler
+
+Asynchronous crawl of a locally served A Lo Cubano Boulder Fest site. Where the other
+tools check the source tree, the crawler checks what the server actually returns:
+Vercel-style rewrites, clean URLs and redirects are all exercised for real.
+
+Starting from "/", HTML pages are fetched concurrently from the dev server (the
+configured base_url), every internal URL they reference is requested once, and the
+final status, redirect hops and response time are recorded. Uses only asyncio
+streams, so it has no third-party dependencies and can be pointed at any simple
+static server (e.g. ``python -m http.server``).
+"""
+
+import asyncio
+import ssl
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import urljoin, urlparse, urldefrag
+
+from .html_link_parser import ALCBFHTMLParser
+from .profiling import Profiler, get_profiler
+
+
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+
+DEFAULT_CRAWL_SETTINGS = {
+    "concurrency": 8,
+    "timeout": 10,
+    "max_redirects": 5,
+    "max_pages": 2000,
+    "slow_threshold_ms": 500
+}
+
+
+@dataclass
+class CrawlResult:
+    """Outcome of requesting a single internal URL."""
+    url: str
+    status: Optional[int] = None
+    final_url: str = ""
+    redirect_chain: List[Tuple[int, str]] = field(default_factory=list)
+    elapsed_ms: float = 0.0
+    content_type: str = ""
+    referrer: str = ""
+    error: str = ""
+
+    @property
+    def is_broken(self) -> bool:
+        return bool(self.error) or self.status is None or self.status >= 400
+
+    def to_dict(self) -> Dict:
+        return {
+            'url': self.url,
+            'status': self.status,
+            'final_url': self.final_url,
+            'redirect_chain': [{'status': status, 'location': location}
+                               for status, location in self.redirect_chain],
+            'elapsed_ms': round(self.elapsed_ms, 1),
+            'content_type': self.content_type,
+            'referrer': self.referrer,
+            'error': self.error
+        }
+
+
+@dataclass
+class _Response:
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+
+
+class LiveCrawler:
+    """Concurrent crawler for internal URLs served by a local server."""
+
+    def __init__(self, base_url: str, concurrency: int = 8, timeout: float = 10,
+                 max_redirects: int = 5, max_pages: int = 2000,
+                 slow_threshold_ms: float = 500, profiler: Optional[Profiler] = None):
+        parsed = urlparse(base_url)
+        if parsed.scheme not in ('http', 'https') or not parsed.hostname:
+            raise ValueError(f"Invalid crawl base URL: {base_url}")
+
+        self.base_url = base_url.rstrip('/')
+        self.origin = (parsed.scheme, parsed.netloc.lower())
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+        self.max_redirects = max_redirects
+        self.max_pages = max_pages
+        self.slow_threshold_ms = slow_threshold_ms
+        self.profiler = get_profiler(profiler)
+        self.skipped_urls: Set[str] = set()  # Distinct URLs not crawled because of max_pages
+
+    @classmethod
+    def from_config(cls, config: Dict, base_url: Optional[str] = None, **overrides) -> 'LiveCrawler':
+        """Create a crawler from link_validation_config.json settings."""
+        settings = dict(DEFAULT_CRAWL_SETTINGS)
+        settings.update(config.get("crawl_settings", {}))
+        settings.update({key: value for key, value in overrides.items() if value is not None})
+        base_url = base_url or config.get("project_settings", {}).get("base_url", "http://localhost:8000")
+        return cls(base_url, **settings)
+
+    def run(self, start_path: str = '/') -> Dict[str, CrawlResult]:
+        """Crawl synchronously and return results keyed by URL."""
+        return asyncio.run(self.crawl(start_path))
+
+    async def crawl(self, start_path: str = '/') -> Dict[str, CrawlResult]:
+        """Crawl the site starting at start_path."""
+        results: Dict[str, CrawlResult] = {}
+        queue: asyncio.Queue = asyncio.Queue()
+        self.skipped_urls = set()
+
+        start_url = self._normalize(urljoin(self.base_url + '/', start_path))
+        results[start_url] = CrawlResult(url=start_url)
+        queue.put_nowait(start_url)
+
+        with self.profiler.phase('crawl'):
+            workers = [asyncio.create_task(self._worker(queue, results))
+                       for _ in range(self.concurrency)]
+            await queue.join()
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        return results
+
+    async def _worker(self, queue: asyncio.Queue, results: Dict[str, CrawlResult]):
+        while True:
+            url = await queue.get()
+            try:
+                body = await self._check_url(results[url])
+                if body is not None:
+                    self._enqueue_links(url, body, queue, results)
+            except Exception as e:
+                # One bad page must not stop the worker, or queue.join() never returns
+                results[url].error = results[url].error or f"Crawl failed: {e}"
+            finally:
+                queue.task_done()
+
+    async def _check_url(self, result: CrawlResult) -> Optional[bytes]:
+        """Request a URL, following redirects; return the body of HTML pages."""
+        url = result.url
+        seen = {url}
+        start = time.perf_counter()
+
+        try:
+            for _ in range(self.max_redirects + 1):
+                response = await asyncio.wait_for(self._fetch(url), self.timeout)
+                result.status = response.status
+                result.content_type = response.headers.get('content-type', '')
+
+                location = response.headers.get('location')
+                if response.status not in REDIRECT_STATUSES or not location:
+                    break
+
+                next_url = self._normalize(urljoin(url, location))
+                result.redirect_chain.append((response.status, next_url))
+                if next_url in seen:
+                    result.error = "Redirect loop"
+                    break
+                seen.add(next_url)
+                url = next_url
+                # Off-site redirect targets are reported but not requested
+                if not self._is_internal(url):
+                    break
+            else:
+                result.error = f"Too many redirects (> {self.max_redirects})"
+        except asyncio.TimeoutError:
+            result.error = f"Timed out after {self.timeout}s"
+        except asyncio.IncompleteReadError as e:
+            result.error = f"Truncated response: got {len(e.partial)} of {e.expected} bytes"
+        except (OSError, ValueError) as e:
+            result.error = f"Request failed: {e}"
+        except Exception as e:
+            result.error = f"Request failed: {type(e).__name__}: {e}"
+
+        result.elapsed_ms = (time.perf_counter() - start) * 1000
+        result.final_url = url
+
+        if (not result.is_broken and self._is_internal(url)
+                and 'text/html' in result.content_type.lower()):
+            return response.body
+        return None
+
+    async def _fetch(self, url: str) -> _Response:
+        """Issue a single GET request without following redirects."""
+        parsed = urlparse(url)
+        secure = parsed.scheme == 'https'
+        port = parsed.port or (443 if secure else 80)
+        path = parsed.path or '/'
+        if parsed.query:
+            path += '?' + parsed.query
+
+        self.profiler.count('http_requests')
+        reader, writer = await asyncio.open_connection(
+            parsed.hostname, port, ssl=ssl.create_default_context() if secure else None
+        )
+        try:
+            request = (
+                f"GET {path} HTTP/1.1\r\n"
+                f"Host: {parsed.netloc}\r\n"
+                "User-Agent: ALCBFLinkValidator/1.0 (Website Link Checker)\r\n"
+                "Accept-Encoding: identity\r\n"
+                "Connection: close\r\n\r\n"
+            )
+            writer.write(request.encode('ascii'))
+            await writer.drain()
+
+            status_line = await reader.readline()
+            parts = status_line.decode('latin-1').split(None, 2)
+            if len(parts) < 2 or not parts[1].isdigit():
+                raise ValueError(f"Malformed status line: {status_line!r}")
+            status = int(parts[1])
+
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                headers[name.strip().lower()] = value.strip()
+
+            body = b''
+            content_type = headers.get('content-type', '').lower()
+            if 'text/html' in content_type and status not in REDIRECT_STATUSES:
+                body = await self._read_body(reader, headers)
+            return _Response(status, headers, body)
+        finally:
+            writer.close()
+
+    async def _read_body(self, reader: asyncio.StreamReader, headers: Dict[str, str]) -> bytes:
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            chunks = []
+            while True:
+                size_line = await reader.readline()
+                size = int(size_line.split(b';')[0].strip() or b'0', 16)
+                if size == 0:
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+            return b''.join(chunks)
+
+        if 'content-length' in headers:
+            return await reader.readexactly(int(headers['content-length']))
+        return await reader.read()
+
+    def _enqueue_links(self, page_url: str, body: bytes, queue: asyncio.Queue,
+                       results: Dict[str, CrawlResult]):
+        with self.profiler.phase('parse'):
+            parser = ALCBFHTMLParser(page_url)
+            parser.feed(body.decode('utf-8', errors='replace'))
+
+        for link in parser.links:
+            # Form actions usually expect POST requests
+            if link.tag == 'form':
+                continue
+            href = link.href.strip()
+            if not href or href.startswith(('#', 'mailto:', 'tel:', 'javascript:', 'data:')):
+                continue
+
+            url = self._normalize(urljoin(page_url, href))
+            if not self._is_internal(url) or url in results:
+                continue
+            if len(results) >= self.max_pages:
+                if url not in self.skipped_urls:
+                    self.skipped_urls.add(url)
+                    self.profiler.count('urls_over_limit')
+                continue
+
+            results[url] = CrawlResult(url=url, referrer=page_url)
+            queue.put_nowait(url)
+
+    def _normalize(self, url: str) -> str:
+        """Drop fragments so URLs differing only by anchor are fetched once."""
+        return urldefrag(url)[0]
+
+    def _is_internal(self, url: str) -> bool:
+        parsed = urlparse(url)
+        return (parsed.scheme, parsed.netloc.lower()) == self.origin
+
+    def build_report(self, results: Dict[str, CrawlResult]) -> Dict:
+        """Summarize crawl results into broken, slow and redirected URLs."""
+        ordered = sorted(results.values(), key=lambda result: result.url)
+        broken = [result for result in ordered if result.is_broken]
+        slow = sorted(
+            (result for result in ordered
+             if not result.error and result.elapsed_ms >= self.slow_threshold_ms),
+            key=lambda result: result.elapsed_ms, reverse=True
+        )
+        redirected = [result for result in ordered if result.redirect_chain]
+        timings = sorted(result.elapsed_ms for result in ordered if not result.error)
+
+        return {
+            'summary': {
+                'base_url': self.base_url,
+                'urls_checked': len(ordered),
+                'broken': len(broken),
+                'slow': len(slow),
+                'redirected': len(redirected),
+                'urls_over_limit': len(self.skipped_urls),
+                'slow_threshold_ms': self.slow_threshold_ms,
+                'median_ms': round(timings[len(timings) // 2], 1) if timings else 0,
+                'max_ms': round(timings[-1], 1) if timings else 0
+            },
+            'broken': [result.to_dict() for result in broken],
+            'slow': [result.to_dict() for result in slow],
+            'redirected': [result.to_dict() for result in redirected]
+        }
+
+    def format_report(self, report: Dict) -> str:
+        """Format a crawl report for terminal output."""
+        summary = report['summary']
+        lines = []
+        lines.append(f"Crawled {summary['urls_checked']} URLs from {summary['base_url']}")
+        lines.append(f"  Broken: {summary['broken']}")
+        lines.append(f"  Slow (>= {summary['slow_threshold_ms']}ms): {summary['slow']}")
+        lines.append(f"  Redirected: {summary['redirected']}")
+        if summary.get('urls_over_limit'):
+            lines.append(f"  Not crawled (over max_pages={self.max_pages}): {summary['urls_over_limit']}")
+        lines.append(f"  Median response: {summary['median_ms']}ms, max: {summary['max_ms']}ms")
+
+        if report['broken']:
+            lines.append("")
+            lines.append("BROKEN")
+            lines.append("-" * 20)
+            for entry in report['broken']:
+                status = entry['status'] if entry['status'] is not None else 'ERR'
+                detail = f" - {entry['error']}" if entry['error'] else ""
+                lines.append(f"  [{status}] {entry['url']} (from {entry['referrer'] or 'start'}){detail}")
+
+        if report['slow']:
+            lines.append("")
+            lines.append("SLOW")
+            lines.append("-" * 20)
+            for entry in report['slow']:
+                lines.append(f"  {entry['elapsed_ms']:8.1f}ms  {entry['url']}")
+
+        if report['redirected']:
+            lines.append("")
+            lines.append("REDIRECTS")
+            lines.append("-" * 20)
+            for entry in report['redirected']:
+                hops = " -> ".join(f"{hop['status']} {hop['location']}" for hop in entry['redirect_chain'])
+                lines.append(f"  {entry['url']} -> {hops}")
+
+        return "\n".join(lines)
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Page Weight Analysis
+
+Adds up the bytes each page makes the browser download: the HTML document itself
+plus every directly referenced stylesheet, script, image, font and media file.
+Assets referenced several times on a page count once for that page, and the site
+totals count every asset once no matter how many pages share it.
+
+Sizes are reported raw and compressed (gzip, and brotli when the optional
+``brotli`` package is installed). Already-compressed formats such as images and
+woff2 fonts are not recompressed, since servers send them as-is. Compressed sizes
+are cached per file by (mtime, size) so reruns only compress files that changed.
+"""
+
+import gzip
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from .asset_resolver import AssetResolver, is_local_reference
+from .html_link_parser import LinkInfo, ParseResults
+from .profiling import Profiler, get_profiler
+from .stat_cache import StatKeyedCache
+
+try:
+    import brotli
+except ImportError:  # Optional dependency
+    brotli = None
+
+
+# Tags whose src/href is fetched as part of loading the page
+LOADED_TAGS = {'script', 'img', 'source', 'video', 'audio', 'track', 'embed', 'input'}
+
+# <link rel> values that make the browser download the referenced resource
+LOADED_LINK_RELS = {'stylesheet', 'icon', 'apple-touch-icon', 'preload', 'modulepreload', 'manifest'}
+
+# Formats that servers send without further compression
+PRECOMPRESSED_EXTENSIONS = {
+    '.png', '.jpg', '.jpeg', '.gif', '.webp', '.avif', '.woff', '.woff2',
+    '.mp3', '.mp4', '.webm', '.pdf', '.zip', '.gz', '.br'
+}
+
+
+@dataclass
+class FileWeight:
+    """Raw and compressed size of a single file."""
+    path: str
+    raw: int
+    gzip: int
+    brotli: Optional[int] = None
+
+    @property
+    def transfer(self) -> int:
+        """Best-case bytes on the wire."""
+        return self.brotli if self.brotli is not None else self.gzip
+
+
+@dataclass
+class PageWeight:
+    """Weight of one page and the assets it loads."""
+    page: str
+    html: FileWeight
+    assets: List[FileWeight] = field(default_factory=list)
+    missing: List[str] = field(default_factory=list)
+    unique_assets: Set[str] = field(default_factory=set)
+
+    def total(self, kind: str) -> int:
+        values = [getattr(self.html, kind)] + [getattr(asset, kind) for asset in self.assets]
+        return sum(value or 0 for value in values)
+
+    def to_dict(self) -> Dict:
+        by_type: Dict[str, int] = {}
+        for asset in self.assets:
+            suffix = Path(asset.path).suffix.lower() or 'other'
+            by_type[suffix] = by_type.get(suffix, 0) + asset.raw
+
+        return {
+            'page': self.page,
+            'total_raw': self.total('raw'),
+            'total_gzip': self.total('gzip'),
+            'total_brotli': self.total('brotli') if self.html.brotli is not None else None,
+            'html_raw': self.html.raw,
+            'asset_count': len(self.assets),
+            'unique_asset_raw': sum(asset.raw for asset in self.assets if asset.path in self.unique_assets),
+            'raw_by_type': dict(sorted(by_type.items(), key=lambda item: item[1], reverse=True)),
+            'largest_assets': [
+                {'path': asset.path, 'raw': asset.raw, 'gzip': asset.gzip, 'brotli': asset.brotli}
+                for asset in sorted(self.assets, key=lambda asset: asset.raw, reverse=True)[:5]
+            ],
+            'missing_assets': self.missing
+        }
+
+
+def is_loaded_resource(link: LinkInfo) -> bool:
+    """Return True if the browser fetches this reference while loading the page."""
+    if link.tag in LOADED_TAGS:
+        return True
+    if link.tag == 'link':
+        rels = set(link.attributes.get('rel', '').lower().split())
+        return bool(rels & LOADED_LINK_RELS)
+    return False
+
+
+class PageWeightAnalyzer:
+    """Computes per-page and site-wide transfer weight."""
+
+    def __init__(self, project_root: str, profiler: Optional[Profiler] = None,
+                 resolver: Optional[AssetResolver] = None, use_cache: bool = True):
+        self.project_root = Path(project_root).resolve()
+        self.profiler = get_profiler(profiler)
+        self.resolver = resolver or AssetResolver(self.project_root)
+        self.cache = StatKeyedCache(self.project_root, 'compressed_sizes') if use_cache else None
+        self._weights: Dict[Path, FileWeight] = {}
+
+    def file_weight(self, path: Path) -> FileWeight:
+        """Return raw and compressed sizes for a file, using the cache when valid."""
+        weight = self._weights.get(path)
+        if weight is not None:
+            return weight
+
+        stat = path.stat()
+        relative = self.resolver.relative(path)
+        cached = self.cache.get(path, stat) if self.cache else None
+        if cached is not None and (cached.get('brotli') is not None or brotli is None):
+            self.profiler.count('compression_cache_hits')
+            weight = FileWeight(relative, stat.st_size, cached['gzip'], cached.get('brotli'))
+        else:
+            weight = self._measure(path, relative, stat.st_size)
+            if self.cache:
+                self.cache.set(path, {'gzip': weight.gzip, 'brotli': weight.brotli}, stat)
+
+        self._weights[path] = weight
+        return weight
+
+    def _measure(self, path: Path, relative: str, size: int) -> FileWeight:
+        if path.suffix.lower() in PRECOMPRESSED_EXTENSIONS:
+            return FileWeight(relative, size, size, size if brotli is not None else None)
+
+        self.profiler.count('compressions')
+        with self.profiler.phase('compress'):
+            data = path.read_bytes()
+            gzip_size = len(gzip.compress(data, compresslevel=6))
+            brotli_size = len(brotli.compress(data, quality=11)) if brotli is not None else None
+        return FileWeight(relative, size, gzip_size, brotli_size)
+
+    def analyze(self, results: ParseResults) -> Dict:
+        """Build the page weight report from parse results."""
+        pages: List[PageWeight] = []
+        asset_pages: Dict[str, int] = {}
+
+        with self.profiler.phase('page_weight'):
+            for source_file, links in results.get_links_by_file().items():
+                page_path = Path(source_file).resolve()
+                if not page_path.is_file():
+                    continue
+
+                page = PageWeight(self.resolver.relative(page_path), self.file_weight(page_path))
+                seen: Set[Path] = set()
+                for link in links:
+                    if not is_loaded_resource(link) or not is_local_reference(link.href):
+                        continue
+                    target = self.resolver.resolve(link.href, source_file)
+                    if target is None:
+                        if link.href not in page.missing:
+                            page.missing.append(link.href)
+                        continue
+                    if target not in seen:
+                        seen.add(target)
+                        page.assets.append(self.file_weight(target))
+
+                for asset in page.assets:
+                    asset_pages[asset.path] = asset_pages.get(asset.path, 0) + 1
+                pages.append(page)
+
+            for page in pages:
+                page.unique_assets = {asset.path for asset in page.assets if asset_pages[asset.path] == 1}
+
+        if self.cache:
+            self.cache.save()
+
+        return self._build_report(pages, asset_pages)
+
+    def _build_report(self, pages: List[PageWeight], asset_pages: Dict[str, int]) -> Dict:
+        ranked = sorted(pages, key=self._page_transfer, reverse=True)
+
+        unique_weights = {weight.path: weight for weight in self._weights.values()}
+        site_assets = [unique_weights[path] for path in asset_pages]
+        html_weights = [page.html for page in pages]
+        site_files = site_assets + html_weights
+
+        shared = sorted(
+            ((path, count) for path, count in asset_pages.items() if count > 1),
+            key=lambda item: unique_weights[item[0]].raw * item[1], reverse=True
+        )
+
+        return {
+            'summary': {
+                'pages': len(pages),
+                'unique_assets': len(site_assets),
+                'site_raw': sum(weight.raw for weight in site_files),
+                'site_gzip': sum(weight.gzip for weight in site_files),
+                'site_brotli': sum(weight.brotli for weight in site_files) if brotli is not None else None,
+                'brotli_available': brotli is not None,
+                'cache_hits': self.cache.hits if self.cache else 0,
+                'cache_misses': self.cache.misses if self.cache else 0
+            },
+            'pages': [page.to_dict() for page in ranked],
+            'shared_assets': [
+                {'path': path, 'pages': count, 'raw': unique_weights[path].raw}
+                for path, count in shared
+            ]
+        }
+
+    def _page_transfer(self, page: PageWeight) -> int:
+        return page.html.transfer + sum(asset.transfer for asset in page.assets)
+
+    def format_report(self, report: Dict, top: int = 15) -> str:
+        """Format the page weight report for terminal output."""
+        summary = report['summary']
+        lines = []
+        lines.append(f"Pages analyzed: {summary['pages']}")
+        lines.append(f"Unique assets: {summary['unique_assets']}")
+        lines.append(f"Site total (each file once): {_kib(summary['site_raw'])} raw, "
+                     f"{_kib(summary['site_gzip'])} gzip"
+                     + (f", {_kib(summary['site_brotli'])} brotli" if summary['site_brotli'] is not None else
+                        " (install 'brotli' for brotli sizes)"))
+        lines.append("")
+        lines.append("HEAVIEST PAGES")
+        lines.append("-" * 20)
+        lines.append(f"{'Raw':>10} {'Gzip':>10} {'Brotli':>10} {'Assets':>6}  Page")
+        for page in report['pages'][:top]:
+            brotli_size = _kib(page['total_brotli']) if page['total_brotli'] is not None else 'n/a'
+            lines.append(f"{_kib(page['total_raw']):>10} {_kib(page['total_gzip']):>10} "
+                         f"{brotli_size:>10} {page['asset_count']:>6}  {page['page']}")
+            if page['missing_assets']:
+                lines.append(f"{'':>40}missing: {', '.join(page['missing_assets'][:3])}")
+
+        if report['shared_assets']:
+            lines.append("")
+            lines.append("MOST SHARED ASSETS")
+            lines.append("-" * 20)
+            for entry in report['shared_assets'][:10]:
+                lines.append(f"{_kib(entry['raw']):>10} x {entry['pages']:3d} pages  {entry['path']}")
+
+        return "\n".join(lines)
+
+
+def _kib(size: int) -> str:
+    return f"{size / 1024:.1f}K"
@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+Content-Addressed Parse Cache
+
+Persists the raw output of the HTML link parser (links, inline script blocks and
+performance lint findings)
+keyed by a hash of each file's bytes, so unchanged pages are never fed through
+``html.parser`` again, whichever process (CLI, test run, CI shard) parsed them
+first. Moving or copying a file keeps its cache entry because the key is the
+content, not the path.
+
+The cache is a single binary file made of fixed-width records::
+
+    header | entries (sorted by digest) | links | blocks | findings | string index | string blob
+
+Strings (hrefs, link text, attribute JSON, ...) are interned once in a string
+table and records refer to them by index. The file is memory-mapped and an entry
+is found by binary search over the sorted digests, so a lookup decodes only the
+records and strings of that one file instead of unpickling the whole cache.
+
+Each entry also records the file it was last parsed from (path, mtime and
+size). Saving merges this run's entries into whatever is on disk at that moment,
+so a run that only parsed part of the site keeps the entries of the rest, and
+drops only entries whose source file is gone or has changed since.
+
+Writes go to a temporary file that is renamed into place, so concurrent readers
+keep a consistent view of the file they mapped; concurrent writers each merge
+the latest published file before writing, and entries are content-addressed,
+so whichever wins is correct.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from .profiling import Profiler, get_profiler
+from .stat_cache import atomic_write_bytes, get_cache_dir
+
+
+MAGIC = b'ALPC'
+FORMAT_VERSION = 3
+
+# Bump when the parser's output changes so stale entries are discarded
+PARSER_VERSION = 4
+
+DIGEST_SIZE = 16
+
+_HEADER = struct.Struct('<4sHHIIIII')     # magic, format, parser version, entries, links, blocks, findings, strings
+# digest, first/count of links, blocks and findings, source path, mtime_ns, size
+_ENTRY = struct.Struct(f'<{DIGEST_SIZE}sIIIIIIIQQ')
+_LINK = struct.Struct('<IIIIII')          # href, text, line, tag, attributes, context
+_BLOCK = struct.Struct('<IIII')           # tag, line, content, attributes
+_FINDING = struct.Struct('<IIII')         # rule, line, target, message
+_STRING = struct.Struct('<II')            # offset, length in the blob
+
+# (href, text, line_number, tag, attributes_json, context)
+LinkRecord = Tuple[str, str, int, str, str, str]
+# (tag, line_number, content, attributes_json)
+BlockRecord = Tuple[str, int, str, str]
+# (rule, line_number, target, message)
+FindingRecord = Tuple[str, int, str, str]
+Records = Tuple[List[LinkRecord], List[BlockRecord], List[FindingRecord]]
+# (absolute path, mtime_ns, size) of the file an entry was last parsed from
+Source = Tuple[str, int, int]
+
+
+def content_digest(data: bytes) -> bytes:
+    """Fixed-size digest of a file's bytes used as its cache key."""
+    return hashlib.blake2b(data, digest_size=DIGEST_SIZE).digest()
+
+
+def encode_attributes(attributes: Dict[str, str]) -> str:
+    return json.dumps(attributes, separators=(',', ':'), sort_keys=True) if attributes else ''
+
+
+def decode_attributes(value: str) -> Dict[str, str]:
+    return json.loads(value) if value else {}
+
+
+def file_source(path: Union[str, Path], stat: os.stat_result) -> Source:
+    """Source stamp for an entry parsed from path with the given stat."""
+    return os.path.abspath(path), stat.st_mtime_ns, stat.st_size
+
+
+def source_is_current(source: Source) -> bool:
+    """Whether the source file still exists unchanged."""
+    path, mtime_ns, size = source
+    if not path:
+        return False
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return False
+    return stat.st_mtime_ns == mtime_ns and stat.st_size == size
+
+
+class _CacheFile:
+    """Read-only view of one published cache file."""
+
+    def __init__(self, mapped: mmap.mmap, entry_count: int, offsets: Tuple[int, int, int, int, int]):
+        self.map = mapped
+        self.entry_count = entry_count
+        self.offsets = offsets
+
+    @classmethod
+    def open(cls, path: Path) -> Optional['_CacheFile']:
+        """Map a cache file; None if it is missing, empty or from another version."""
+        try:
+            with open(path, 'rb') as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None  # Missing or empty cache file
+
+        if len(mapped) < _HEADER.size:
+            mapped.close()
+            return None
+        magic, format_version = _HEADER.unpack_from(mapped, 0)[:2]
+        if magic != MAGIC or format_version != FORMAT_VERSION:
+            mapped.close()
+            return None
+        _, _, parser_version, entries, links, blocks, findings, strings = _HEADER.unpack_from(mapped, 0)
+        entries_at = _HEADER.size
+        links_at = entries_at + entries * _ENTRY.size
+        blocks_at = links_at + links * _LINK.size
+        findings_at = blocks_at + blocks * _BLOCK.size
+        strings_at = findings_at + findings * _FINDING.size
+        blob_at = strings_at + strings * _STRING.size
+        if parser_version != PARSER_VERSION or blob_at > len(mapped):
+            mapped.close()
+            return None
+        return cls(mapped, entries, (links_at, blocks_at, findings_at, strings_at, blob_at))
+
+    def close(self):
+        self.map.close()
+
+    def string(self, index: int) -> str:
+        strings_at, blob_at = self.offsets[3:]
+        offset, length = _STRING.unpack_from(self.map, strings_at + index * _STRING.size)
+        start = blob_at + offset
+        return self.map[start:start + length].decode('utf-8', errors='surrogatepass')
+
+    def _entry(self, position: int) -> Tuple:
+        return _ENTRY.unpack_from(self.map, _HEADER.size + position * _ENTRY.size)
+
+    def find(self, digest: bytes) -> Optional[Tuple]:
+        low, high = 0, self.entry_count
+        while low < high:
+            middle = (low + high) // 2
+            entry = self._entry(middle)
+            if entry[0] < digest:
+                low = middle + 1
+            elif entry[0] > digest:
+                high = middle
+            else:
+                return entry
+        return None
+
+    def entries(self) -> Iterator[Tuple]:
+        for position in range(self.entry_count):
+            yield self._entry(position)
+
+    def source(self, entry: Tuple) -> Source:
+        path, mtime_ns, size = entry[7:]
+        return self.string(path), mtime_ns, size
+
+    def records(self, entry: Tuple) -> Records:
+        first_link, link_count, first_block, block_count, first_finding, finding_count = entry[1:7]
+        links_at, blocks_at, findings_at = self.offsets[:3]
+        mapped, string = self.map, self.string
+        links = []
+        for position in range(links_at + first_link * _LINK.size,
+                              links_at + (first_link + link_count) * _LINK.size, _LINK.size):
+            href, text, line, tag, attributes, context = _LINK.unpack_from(mapped, position)
+            links.append((string(href), string(text), line, string(tag), string(attributes), string(context)))
+        blocks = []
+        for position in range(blocks_at + first_block * _BLOCK.size,
+                              blocks_at + (first_block + block_count) * _BLOCK.size, _BLOCK.size):
+            tag, line, content, attributes = _BLOCK.unpack_from(mapped, position)
+            blocks.append((string(tag), line, string(content), string(attributes)))
+        findings = []
+        for position in range(findings_at + first_finding * _FINDING.size,
+                              findings_at + (first_finding + finding_count) * _FINDING.size, _FINDING.size):
+            rule, line, target, message = _FINDING.unpack_from(mapped, position)
+            findings.append((string(rule), line, string(target), string(message)))
+        return links, blocks, findings
+
+
+class ParseCache:
+    """Memory-mapped, content-addressed store of parser output."""
+
+    def __init__(self, project_root: Union[str, Path], name: str = 'parse_cache',
+                 profiler: Optional[Profiler] = None):
+        self.path = get_cache_dir(Path(project_root).resolve()) / f"{name}.bin"
+        self.profiler = get_profiler(profiler)
+        self.hits = 0
+        self.misses = 0
+        self._file: Optional[_CacheFile] = _CacheFile.open(self.path)
+        self._used: Dict[bytes, Records] = {}
+        self._sources: Dict[bytes, Source] = {}
+        self._added = False
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def get(self, digest: bytes, source: Optional[Source] = None) -> Optional[Records]:
+        """Return cached link, block and finding records for a content digest.
+
+        source, when given, is the file being looked up; it replaces the
+        entry's recorded source the next time the cache is saved.
+        """
+        records = self._used.get(digest)
+        if records is None and self._file is not None:
+            entry = self._file.find(digest)
+            if entry is not None:
+                records = self._file.records(entry)
+                self._used[digest] = records
+                self._sources.setdefault(digest, self._file.source(entry))
+
+        if records is None:
+            self.misses += 1
+            self.profiler.count('parse_cache_misses')
+        else:
+            if source is not None:
+                self._sources[digest] = source
+            self.hits += 1
+            self.profiler.count('parse_cache_hits')
+        return records
+
+    def put(self, digest: bytes, links: List[LinkRecord], blocks: List[BlockRecord],
+            findings: List[FindingRecord], source: Optional[Source] = None):
+        """Record parser output for a content digest parsed from source."""
+        self._used[digest] = (links, blocks, findings)
+        if source is not None:
+            self._sources[digest] = source
+        self._added = True
+
+    def _merged_entries(self) -> Dict[bytes, Tuple[Records, Source]]:
+        """This run's entries plus every still-current entry published on disk."""
+        merged: Dict[bytes, Tuple[Records, Source]] = {}
+        # Reopen: another process may have published entries since this one mapped the file
+        published = _CacheFile.open(self.path)
+        if published is not None:
+            try:
+                for entry in published.entries():
+                    if entry[0] in self._used:
+                        continue
+                    source = published.source(entry)
+                    if source_is_current(source):
+                        merged[entry[0]] = (published.records(entry), source)
+                    else:
+                        self.profiler.count('parse_cache_pruned')
+            finally:
+                published.close()
+        for digest, records in self._used.items():
+            merged[digest] = (records, self._sources.get(digest, ('', 0, 0)))
+        return merged
+
+    def save(self):
+        """Merge this run's new entries into the cache file.
+
+        Entries not used in this run are kept as long as their source file is
+        unchanged; entries for files that were deleted or modified are pruned,
+        so the file tracks the current site instead of growing forever. A run
+        that only read from the cache does not rewrite it.
+        """
+        if not self._added:
+            return
+
+        with self.profiler.phase('parse_cache_write'):
+            merged = self._merged_entries()
+
+            strings: Dict[str, int] = {}
+
+            def intern(value: str) -> int:
+                index = strings.get(value)
+                if index is None:
+                    index = strings[value] = len(strings)
+                return index
+
+            entries, links, blocks, findings = [], [], [], []
+            link_count = block_count = finding_count = 0
+            for digest in sorted(merged):
+                (entry_links, entry_blocks, entry_findings), (path, mtime_ns, size) = merged[digest]
+                entries.append(_ENTRY.pack(digest, link_count, len(entry_links), block_count, len(entry_blocks),
+                                           finding_count, len(entry_findings), intern(path), mtime_ns, size))
+                for href, text, line, tag, attributes, context in entry_links:
+                    links.append(_LINK.pack(intern(href), intern(text), line, intern(tag),
+                                            intern(attributes), intern(context)))
+                for tag, line, content, attributes in entry_blocks:
+                    blocks.append(_BLOCK.pack(intern(tag), line, intern(content), intern(attributes)))
+                for rule, line, target, message in entry_findings:
+                    findings.append(_FINDING.pack(intern(rule), line, intern(target), intern(message)))
+                link_count += len(entry_links)
+                block_count += len(entry_blocks)
+                finding_count += len(entry_findings)
+
+            index, blob, offset = [], [], 0
+            for value in strings:
+                data = value.encode('utf-8', errors='surrogatepass')
+                index.append(_STRING.pack(offset, len(data)))
+                blob.append(data)
+                offset += len(data)
+
+            header = _HEADER.pack(MAGIC, FORMAT_VERSION, PARSER_VERSION,
+                                  len(entries), link_count, block_count, finding_count, len(strings))
+            self.close()
+            atomic_write_bytes(self.path, b''.join([header] + entries + links + blocks + findings + index + blob))
+        self._file = _CacheFile.open(self.path)
+        self._added = False
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Core Web Vitals Lint
+
+Performance lint rules evaluated while the HTML link parser walks a page, so
+checking them costs no extra parse. The parser forwards every start and end tag
+to a ``PerfLinter``, which tracks where it is in the document (``<head>``,
+``<header>``, ``<main>``, ``<footer>``, ``<noscript>``) and records findings for:
+
+- images without ``width``/``height`` (layout shift, CLS)
+- below-the-fold images that are not ``loading="lazy"``
+- the likely LCP hero image marked ``loading="lazy"`` (LCP)
+- scripts in ``<head>`` without ``defer``/``async`` (render blocking)
+- stylesheets in ``<head>`` placed after a parser-blocking script
+- iframes that are not ``loading="lazy"``
+
+The rules themselves take no settings, so their findings can be stored in the
+parse cache with the rest of the parser output. Disabled rules and severity
+overrides from ``performance_lint`` in the config are applied when reporting.
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from .js_scanner import JS_SCRIPT_TYPES
+
+
+SEVERITIES = ('error', 'warning', 'info')
+
+# rule id -> (default severity, description)
+RULES = {
+    'lcp-image-lazy': ('error', 'Likely LCP image is lazy-loaded, delaying Largest Contentful Paint'),
+    'render-blocking-script': ('error', 'Script in <head> without defer/async blocks rendering'),
+    'img-missing-dimensions': ('warning', 'Image has no width/height, so content shifts when it loads'),
+    'stylesheet-after-script': ('warning', 'Stylesheet follows a parser-blocking script and is discovered late'),
+    'iframe-not-lazy': ('warning', 'Iframe is not lazy-loaded'),
+    'img-below-fold-eager': ('info', 'Below-the-fold image is not lazy-loaded'),
+}
+
+# Images in document order that are treated as above the fold on a phone
+ABOVE_FOLD_IMAGES = 2
+
+# Containers whose content is never rendered as part of the page
+_INERT_TAGS = ('noscript', 'template')
+
+
+@dataclass
+class PerfFinding:
+    """A single performance lint finding."""
+    rule: str
+    source_file: str
+    line_number: int
+    target: str
+    message: str
+
+    @property
+    def severity(self) -> str:
+        return RULES[self.rule][0]
+
+    def to_dict(self) -> Dict:
+        return {
+            'rule': self.rule,
+            'severity': self.severity,
+            'line_number': self.line_number,
+            'target': self.target,
+            'message': self.message
+        }
+
+
+def _value(attrs: Dict[str, Optional[str]], name: str) -> str:
+    return (attrs.get(name) or '').strip().lower()
+
+
+def _has_dimensions(attrs: Dict[str, Optional[str]]) -> bool:
+    if _value(attrs, 'width') and _value(attrs, 'height'):
+        return True
+    style = _value(attrs, 'style').replace(' ', '')
+    declarations = {part.split(':', 1)[0] for part in style.split(';') if ':' in part}
+    return 'aspect-ratio' in declarations or {'width', 'height'} <= declarations
+
+
+class PerfLinter:
+    """Collects Core Web Vitals findings from one page's tag stream."""
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.findings: List[PerfFinding] = []
+        self._open = {'head': 0, 'header': 0, 'main': 0, 'footer': 0, 'noscript': 0, 'template': 0}
+        self._images: List[Dict] = []
+        self._blocking_script_line: Optional[int] = None
+
+    def start_tag(self, tag: str, attrs: Dict[str, Optional[str]], line_number: int):
+        if tag in self._open:
+            self._open[tag] += 1
+        if tag == 'body':
+            self._open['head'] = 0
+        if any(self._open[inert] for inert in _INERT_TAGS):
+            return
+
+        if tag == 'img':
+            self._images.append({
+                'line': line_number,
+                'attrs': attrs,
+                'header': self._open['header'] > 0,
+                'main': self._open['main'] > 0,
+                'footer': self._open['footer'] > 0
+            })
+        elif tag == 'script':
+            self._check_script(attrs, line_number)
+        elif tag == 'link':
+            self._check_stylesheet(attrs, line_number)
+        elif tag == 'iframe' and _value(attrs, 'loading') != 'lazy':
+            self._add('iframe-not-lazy', line_number, attrs.get('src') or '<iframe>',
+                      'Add loading="lazy" to iframes outside the first screen')
+
+    def end_tag(self, tag: str):
+        if self._open.get(tag):
+            self._open[tag] -= 1
+
+    def _check_script(self, attrs: Dict[str, Optional[str]], line_number: int):
+        if not self._open['head'] or not attrs.get('src'):
+            return
+        script_type = _value(attrs, 'type')
+        if script_type not in JS_SCRIPT_TYPES or script_type == 'module':
+            return  # Modules are deferred by default; data blocks never run
+        if 'defer' in attrs or 'async' in attrs:
+            return
+        self._add('render-blocking-script', line_number, attrs['src'],
+                  'Add defer (or async for independent scripts) or move it to the end of <body>')
+        if self._blocking_script_line is None:
+            self._blocking_script_line = line_number
+
+    def _check_stylesheet(self, attrs: Dict[str, Optional[str]], line_number: int):
+        if not self._open['head'] or self._blocking_script_line is None:
+            return
+        if 'stylesheet' not in _value(attrs, 'rel').split() or _value(attrs, 'media') == 'print':
+            return
+        self._add('stylesheet-after-script', line_number, attrs.get('href') or '<link>',
+                  f"Move it above the blocking script on line {self._blocking_script_line}")
+
+    def _lcp_candidate(self) -> Optional[int]:
+        """Index of the image most likely to be the Largest Contentful Paint."""
+        for index, image in enumerate(self._images):
+            if _value(image['attrs'], 'fetchpriority') == 'high':
+                return index
+        for index, image in enumerate(self._images):
+            names = f"{_value(image['attrs'], 'class')} {_value(image['attrs'], 'id')}"
+            if 'hero' in names:
+                return index
+        for index, image in enumerate(self._images):
+            if image['main']:
+                return index
+        return None
+
+    def finish(self) -> List[PerfFinding]:
+        """Evaluate the image rules, which need the whole page, and return all findings."""
+        lcp = self._lcp_candidate()
+        for index, image in enumerate(self._images):
+            attrs = image['attrs']
+            target = attrs.get('src') or '<img>'
+            lazy = _value(attrs, 'loading') == 'lazy'
+
+            if not _has_dimensions(attrs):
+                self._add('img-missing-dimensions', image['line'], target,
+                          'Set width and height (or CSS aspect-ratio) to reserve its space')
+
+            if index == lcp:
+                if lazy:
+                    self._add('lcp-image-lazy', image['line'], target,
+                              'Remove loading="lazy" and consider fetchpriority="high"')
+                continue
+
+            above_fold = not image['footer'] and (
+                image['header'] or index < ABOVE_FOLD_IMAGES or (lcp is not None and index < lcp)
+            )
+            if not above_fold and not lazy:
+                self._add('img-below-fold-eager', image['line'], target, 'Add loading="lazy"')
+
+        self._images = []
+        self.findings.sort(key=lambda finding: finding.line_number)
+        return self.findings
+
+    def _add(self, rule: str, line_number: int, target: str, message: str):
+        self.findings.append(PerfFinding(rule, self.file_path, line_number, target, message))
+
+
+def lint_settings(config: Dict) -> Dict:
+    """Rule settings from the config: disabled rules and severity overrides."""
+    settings = config.get('performance_lint', {})
+    return {
+        'disabled_rules': set(settings.get('disabled_rules', [])),
+        'severity_overrides': settings.get('severity_overrides', {})
+    }
+
+
+def build_lint_report(findings: List[PerfFinding], project_root: str, config: Optional[Dict] = None) -> Dict:
+    """Per-page counts by severity and rule, worst pages first."""
+    settings = lint_settings(config or {})
+    pages: Dict[str, Dict] = {}
+    totals = {severity: 0 for severity in SEVERITIES}
+    by_rule: Dict[str, int] = {}
+
+    for finding in findings:
+        if finding.rule in settings['disabled_rules']:
+            continue
+        entry = finding.to_dict()
+        entry['severity'] = settings['severity_overrides'].get(finding.rule, finding.severity)
+
+        page = os.path.relpath(finding.source_file, project_root)
+        summary = pages.setdefault(page, {
+            'page': page,
+            'counts': {severity: 0 for severity in SEVERITIES},
+            'rules': {},
+            'findings': []
+        })
+        summary['counts'][entry['severity']] += 1
+        summary['rules'][finding.rule] = summary['rules'].get(finding.rule, 0) + 1
+        summary['findings'].append(entry)
+        totals[entry['severity']] += 1
+        by_rule[finding.rule] = by_rule.get(finding.rule, 0) + 1
+
+    ranked = sorted(pages.values(),
+                    key=lambda page: tuple(-page['counts'][severity] for severity in SEVERITIES) + (page['page'],))
+    return {
+        'summary': {
+            'pages_with_findings': len(ranked),
+            'findings': sum(totals.values()),
+            'by_severity': totals,
+            'by_rule': dict(sorted(by_rule.items(), key=lambda item: -item[1]))
+        },
+        'rules': {rule: {'severity': settings['severity_overrides'].get(rule, severity), 'description': description}
+                  for rule, (severity, description) in RULES.items() if rule not in settings['disabled_rules']},
+        'pages': ranked
+    }
+
+
+def format_lint_report(report: Dict, top: int = 15) -> str:
+    """Format a lint report for terminal output."""
+    summary = report['summary']
+    counts = summary['by_severity']
+    lines = [
+        f"Findings: {summary['findings']} on {summary['pages_with_findings']} pages "
+        f"({counts['error']} errors, {counts['warning']} warnings, {counts['info']} info)"
+    ]
+    for rule, count in summary['by_rule'].items():
+        lines.append(f"  {rule:24}: {count:4d}  {report['rules'][rule]['description']}")
+
+    if report['pages']:
+        lines.append("")
+        lines.append("Pages:")
+        for page in report['pages'][:top]:
+            page_counts = page['counts']
+            lines.append(f"  {page_counts['error']:3d}E {page_counts['warning']:3d}W {page_counts['info']:3d}I  "
+                         f"{page['page']}")
+            for finding in page['findings']:
+                if finding['severity'] == 'error':
+                    lines.append(f"        line {finding['line_number']}: {finding['rule']} {finding['target']}")
+        if len(report['pages']) > top:
+            lines.append(f"  ... and {len(report['pages']) - top} more")
+    return "\n".join(lines)
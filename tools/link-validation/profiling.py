@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Link Validation Profiling
+
+Lightweight instrumentation shared by the link validation tools. A Profiler records
+wall-clock timers per phase (file cache building, parsing, regex extraction,
+filesystem checks, report writing) and per file, simple counters such as links
+processed, stat calls, cache hits and HTTP requests, and optional tracemalloc
+peak memory per phase.
+
+A disabled profiler is a cheap no-op, so instrumented code paths do not need to
+check whether profiling was requested.
+"""
+
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+
+@dataclass
+class PhaseStats:
+    """Accumulated timing for a single named phase."""
+    name: str
+    calls: int = 0
+    total_seconds: float = 0.0
+    peak_memory_bytes: int = 0
+
+
+class Profiler:
+    """Collects phase timers, per-file timers and counters for one run."""
+
+    def __init__(self, enabled: bool = True, trace_memory: bool = False):
+        self.enabled = enabled
+        self.trace_memory = enabled and trace_memory
+        self.phases: Dict[str, PhaseStats] = {}
+        self.files: Dict[str, float] = {}
+        self.counters: Dict[str, int] = {}
+        self._started = time.perf_counter()
+        self._memory_stack: List[List[int]] = []
+        self._started_tracemalloc = False
+
+        self._tracemalloc = None
+
+        if self.trace_memory:
+            import tracemalloc  # Only loaded when memory tracing is requested
+            self._tracemalloc = tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time a named phase; nested phases are recorded independently."""
+        if not self.enabled:
+            yield
+            return
+
+        if self.trace_memory:
+            self._enter_memory_scope()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            stats = self.phases.get(name)
+            if stats is None:
+                stats = self.phases[name] = PhaseStats(name)
+            stats.calls += 1
+            stats.total_seconds += elapsed
+            if self.trace_memory:
+                stats.peak_memory_bytes = max(stats.peak_memory_bytes, self._exit_memory_scope())
+
+    @contextmanager
+    def file(self, path: str):
+        """Time work attributed to a single source file."""
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.files[path] = self.files.get(path, 0.0) + time.perf_counter() - start
+
+    def count(self, name: str, amount: int = 1):
+        """Increment a named counter."""
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def _enter_memory_scope(self):
+        """Start a fresh tracemalloc peak, preserving the enclosing scope's peak."""
+        current, peak = self._tracemalloc.get_traced_memory()
+        if self._memory_stack:
+            self._memory_stack[-1][0] = max(self._memory_stack[-1][0], peak)
+        self._tracemalloc.reset_peak()
+        self._memory_stack.append([current])
+
+    def _exit_memory_scope(self) -> int:
+        """Return the peak traced memory for the innermost scope."""
+        peak = max(self._memory_stack.pop()[0], self._tracemalloc.get_traced_memory()[1])
+        if self._memory_stack:
+            self._memory_stack[-1][0] = max(self._memory_stack[-1][0], peak)
+        return peak
+
+    def elapsed(self) -> float:
+        """Seconds since the profiler was created."""
+        return time.perf_counter() - self._started
+
+    def stop(self):
+        """Stop tracemalloc if this profiler started it."""
+        if self._started_tracemalloc:
+            self._tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def slowest_files(self, top: int = 10) -> List[Tuple[str, float]]:
+        """Return the files that took the longest, slowest first."""
+        return sorted(self.files.items(), key=lambda item: item[1], reverse=True)[:top]
+
+    def slowest_phases(self, top: int = 10) -> List[PhaseStats]:
+        """Return the phases that took the longest, slowest first."""
+        return sorted(self.phases.values(), key=lambda stats: stats.total_seconds, reverse=True)[:top]
+
+    def to_dict(self, top: int = 10) -> Dict:
+        """Serialize profile data for inclusion in JSON reports."""
+        elapsed = self.elapsed()
+        rates = {}
+        for name in ('links_extracted', 'links_validated'):
+            if self.counters.get(name) and elapsed > 0:
+                rates[f"{name}_per_second"] = round(self.counters[name] / elapsed, 1)
+
+        return {
+            'total_seconds': round(elapsed, 4),
+            'phases': {
+                stats.name: {
+                    'calls': stats.calls,
+                    'total_seconds': round(stats.total_seconds, 4),
+                    **({'peak_memory_bytes': stats.peak_memory_bytes} if self.trace_memory else {})
+                }
+                for stats in self.slowest_phases(len(self.phases))
+            },
+            'slowest_files': [
+                {'file': path, 'seconds': round(seconds, 4)}
+                for path, seconds in self.slowest_files(top)
+            ],
+            'counters': dict(sorted(self.counters.items())),
+            'rates': rates
+        }
+
+    def format_report(self, top: int = 10) -> str:
+        """Format a human-readable profile summary."""
+        data = self.to_dict(top)
+        report = []
+        report.append("PROFILE")
+        report.append("-" * 20)
+        report.append(f"Total time: {data['total_seconds']:.3f}s")
+        report.append("")
+
+        report.append("Slowest phases:")
+        for name, stats in list(data['phases'].items())[:top]:
+            line = f"  {name:22}: {stats['total_seconds']:8.4f}s ({stats['calls']} calls)"
+            if 'peak_memory_bytes' in stats:
+                line += f", peak {stats['peak_memory_bytes'] / 1024:.1f} KiB"
+            report.append(line)
+
+        if data['slowest_files']:
+            report.append("")
+            report.append("Slowest files:")
+            for entry in data['slowest_files']:
+                report.append(f"  {entry['seconds']:8.4f}s  {entry['file']}")
+
+        if data['counters']:
+            report.append("")
+            report.append("Counters:")
+            for name, value in data['counters'].items():
+                report.append(f"  {name:28}: {value}")
+            for name, value in data['rates'].items():
+                report.append(f"  {name:28}: {value}")
+
+        return "\n".join(report)
+
+
+# Shared disabled profiler used when callers do not request profiling
+NULL_PROFILER = Profiler(enabled=False)
+
+
+def get_profiler(profiler: Optional[Profiler] = None) -> Profiler:
+    """Return the given profiler, or the shared no-op profiler."""
+    return profiler if profiler is not None else NULL_PROFILER
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Pytest Plugin: One Link Test per Site File
+
+Turns every site file the link validator discovers (pages, stylesheets,
+scripts, service workers and manifests) into its own test item, so a broken
+page fails as its own test with its broken links listed, and a suite
+parallelizes file by file with pytest-xdist.
+
+The file and route index (``SiteIndex``) is built once per session. Under
+pytest-xdist the controlling process builds and saves it, and each worker loads
+the saved copy instead of walking the tree again. Each process then keeps one
+validator, so stylesheets, scripts and the parse cache stay warm across the
+items it runs.
+
+Usage, from the project root::
+
+    python -m pytest -p tools.link-validation.pytest_plugin index.html pages css js
+    python -m pytest -p tools.link-validation.pytest_plugin -n auto index.html pages css js
+
+``run_link_tests.py`` runs the same thing with the right paths.
+"""
+
+import warnings
+from pathlib import Path
+from typing import List, Optional
+
+import pytest
+
+from .link_validator import LinkValidationResult, LinkValidator
+from .site_index import SiteIndex
+
+
+WORKER_INPUT_KEY = 'link_validation_site_index'
+
+
+class LinkValidationSession:
+    """Per-process state: the shared index and one validator built from it."""
+
+    def __init__(self, index: SiteIndex, index_path: Optional[Path] = None):
+        self.index = index
+        self.index_path = index_path
+        self.site_files = {str(path) for path in index.site_paths()}
+        self._validator = None
+
+    @property
+    def validator(self) -> LinkValidator:
+        if self._validator is None:
+            self._validator = LinkValidator(str(self.index.project_root), site_index=self.index)
+        return self._validator
+
+
+_SESSION = pytest.StashKey[LinkValidationSession]()
+
+
+class BrokenLinks(Exception):
+    """Raised by a link test with the invalid results of its file."""
+
+    def __init__(self, results: List[LinkValidationResult]):
+        super().__init__(f"{len(results)} broken links")
+        self.results = results
+
+
+class LinkValidationWarning(UserWarning):
+    """Advisory finding for a page (e.g. a missing preconnect); never fails its test."""
+
+
+def find_project_root(start: Path) -> Path:
+    """Nearest directory at or above start with a vercel.json, else start."""
+    for directory in [start, *start.parents]:
+        if (directory / 'vercel.json').is_file():
+            return directory
+    return start
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('link-validation')
+    group.addoption('--link-project-root', default=None,
+                    help='Site root to validate (default: nearest directory with a vercel.json)')
+    group.addoption('--link-site-index', default=None,
+                    help='Load a SiteIndex saved by an earlier process instead of building one')
+
+
+def pytest_configure(config):
+    workerinput = getattr(config, 'workerinput', None)
+    if workerinput is not None and workerinput.get(WORKER_INPUT_KEY):
+        # pytest-xdist worker: reuse the index the controller saved
+        index = SiteIndex.load(workerinput[WORKER_INPUT_KEY])
+        if index is not None:
+            config.stash[_SESSION] = LinkValidationSession(index)
+            return
+
+    index = None
+    saved = config.getoption('link_site_index')
+    if saved:
+        index = SiteIndex.load(saved)
+    if index is None:
+        root = config.getoption('link_project_root')
+        root = Path(root).resolve() if root else find_project_root(Path(config.invocation_params.dir).resolve())
+        index = SiteIndex.build(root)
+    index_path = index.save() if workerinput is None else None
+    config.stash[_SESSION] = LinkValidationSession(index, index_path)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """pytest-xdist: hand each worker the path of the index saved by the controller."""
+    session = node.config.stash.get(_SESSION, None)
+    if session is not None and session.index_path is not None:
+        node.workerinput[WORKER_INPUT_KEY] = str(session.index_path)
+
+
+def pytest_collect_file(file_path, parent):
+    session = parent.config.stash.get(_SESSION, None)
+    if session is not None and str(Path(file_path).resolve()) in session.site_files:
+        return SiteFile.from_parent(parent, path=file_path)
+    return None
+
+
+class SiteFile(pytest.File):
+    """A page, stylesheet, script or manifest with a single link test."""
+
+    def collect(self):
+        yield LinkValidationItem.from_parent(self, name='links')
+
+
+class LinkValidationItem(pytest.Item):
+    """Validates every link in one site file; fails if any is broken."""
+
+    def runtest(self):
+        session = self.config.stash[_SESSION]
+        path = Path(self.path).resolve()
+        results = session.validator.validate_site_file(path)
+        for warning in session.validator.page_warnings(str(path)):
+            warnings.warn(LinkValidationWarning(f"[{warning['rule']}] {warning['message']}"))
+        broken = [result for result in results if not result.is_valid]
+        if broken:
+            raise BrokenLinks(broken)
+
+    def repr_failure(self, excinfo, style=None):
+        if isinstance(excinfo.value, BrokenLinks):
+            lines = [f"{len(excinfo.value.results)} broken links in {self.fspath.basename}:"]
+            for result in excinfo.value.results:
+                lines.append(f"  ❌ [{result.link_type}] {result.link} - {result.error_message}")
+            return "\n".join(lines)
+        return super().repr_failure(excinfo, style)
+
+    def reportinfo(self):
+        return self.path, None, f"links: {self.nodeid.split('::', 1)[0]}"
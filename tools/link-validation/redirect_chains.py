@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Redirect Chain Analysis
+
+Resolves every root-relative internal link through the redirects compiled from
+vercel.json, including the platform's ``cleanUrls`` and ``trailingSlash``
+redirects, and reports:
+
+- links that cost a redirect round trip, with the page and line to update and
+  the canonical URL to use instead
+- chains of more than one hop, and where they end
+- redirect loops, which leave the link unusable
+
+Chains are computed once per unique URL path by ``VercelConfig.redirect_chain``
+and shared by every link to that path. Relative links are skipped: the URL
+they resolve against depends on the address a page is served at, not on where
+its file sits.
+"""
+
+import os
+from typing import Dict, List, Optional
+from urllib.parse import unquote, urlparse
+
+from .asset_resolver import is_local_reference
+from .html_link_parser import LinkInfo, ParseResults
+from .profiling import Profiler, get_profiler
+from .vercel_config import RedirectChain, VercelConfig
+
+
+# Extensions of URLs that are pages rather than assets
+PAGE_EXTENSIONS = ('', '.html', '.htm')
+
+
+def canonical_href(link: LinkInfo, chain: RedirectChain) -> str:
+    """The link's href rewritten to the chain's final URL, keeping query and fragment."""
+    parsed = urlparse(link.href.strip())
+    canonical = chain.final
+    if parsed.query:
+        canonical += f'?{parsed.query}'
+    if parsed.fragment:
+        canonical += f'#{parsed.fragment}'
+    return canonical
+
+
+class RedirectChainAnalyzer:
+    """Finds internal links that land on a redirect instead of the page itself."""
+
+    def __init__(self, project_root: str, profiler: Optional[Profiler] = None,
+                 vercel: Optional[VercelConfig] = None):
+        self.project_root = os.path.abspath(project_root)
+        self.profiler = get_profiler(profiler)
+        self.vercel = vercel or VercelConfig(self.project_root)
+
+    @staticmethod
+    def page_path(href: str) -> Optional[str]:
+        """URL path of a root-relative page link, or None for anything else."""
+        if not is_local_reference(href):
+            return None
+        path = unquote(urlparse(href.strip()).path)
+        if not path.startswith('/'):
+            return None
+        if os.path.splitext(path.rsplit('/', 1)[-1])[1].lower() not in PAGE_EXTENSIONS:
+            return None
+        return path
+
+    def analyze(self, results: ParseResults) -> Dict:
+        """Redirecting URLs with the links that use them, plus per-page fixes."""
+        links_by_path: Dict[str, List[LinkInfo]] = {}
+        checked = 0
+        with self.profiler.phase('redirect_chains'):
+            for link in results.links:
+                path = self.page_path(link.href)
+                if path is None:
+                    continue
+                checked += 1
+                links_by_path.setdefault(path, []).append(link)
+
+            chains = {path: self.vercel.redirect_chain(path) for path in links_by_path}
+        self.profiler.count('redirect_urls', len(chains))
+
+        redirects = []
+        fixes: Dict[str, List[Dict]] = {}
+        for path, chain in sorted(chains.items()):
+            if not chain.hops and not chain.loop:
+                continue
+            links = links_by_path[path]
+            redirects.append(self._chain_entry(chain, links))
+            for link in links:
+                page = os.path.relpath(link.source_file, self.project_root)
+                fixes.setdefault(page, []).append({
+                    'line_number': link.line_number,
+                    'href': link.href,
+                    'replace_with': None if chain.loop else canonical_href(link, chain),
+                    'hops': chain.length,
+                    'loop': chain.loop
+                })
+
+        redirecting_links = sum(len(links_by_path[entry['url']]) for entry in redirects)
+        return {
+            'summary': {
+                'links_checked': checked,
+                'unique_urls': len(chains),
+                'redirecting_urls': len(redirects),
+                'redirecting_links': redirecting_links,
+                'chains': sum(1 for entry in redirects if len(entry['hops']) > 1),
+                'loops': sum(1 for entry in redirects if entry['loop']),
+                'longest_chain': max((len(entry['hops']) for entry in redirects), default=0)
+            },
+            'redirects': sorted(redirects, key=lambda entry: (not entry['loop'], -len(entry['hops']),
+                                                               -len(entry['links']), entry['url'])),
+            'fixes': [{'page': page, 'links': sorted(items, key=lambda item: item['line_number'])}
+                      for page, items in sorted(fixes.items())]
+        }
+
+    def _chain_entry(self, chain: RedirectChain, links: List[LinkInfo]) -> Dict:
+        return {
+            'url': chain.path,
+            'final': chain.final,
+            'loop': chain.loop,
+            'external': chain.external,
+            'hops': [{'from': hop.source, 'to': hop.destination, 'status': hop.status, 'rule': hop.rule}
+                     for hop in chain.hops],
+            'links': [{'page': os.path.relpath(link.source_file, self.project_root), 'line_number': link.line_number}
+                      for link in links]
+        }
+
+
+def format_redirect_report(report: Dict, top: int = 20) -> str:
+    """Format a redirect chain report for terminal output."""
+    summary = report['summary']
+    lines = [
+        f"Internal page links checked: {summary['links_checked']} ({summary['unique_urls']} unique URLs)",
+        f"Links through a redirect: {summary['redirecting_links']} to {summary['redirecting_urls']} URLs",
+        f"Chains longer than one hop: {summary['chains']} (longest {summary['longest_chain']}), "
+        f"loops: {summary['loops']}"
+    ]
+
+    for entry in report['redirects'][:top]:
+        route = ' -> '.join([entry['url']] + [f"{hop['to']} ({hop['status']})" for hop in entry['hops']])
+        lines.append("")
+        lines.append(f"  {'LOOP ' if entry['loop'] else ''}{route}")
+        for link in entry['links'][:5]:
+            lines.append(f"      {link['page']}:{link['line_number']}")
+        if len(entry['links']) > 5:
+            lines.append(f"      ... and {len(entry['links']) - 5} more links")
+    if len(report['redirects']) > top:
+        lines.append(f"\n  ... and {len(report['redirects']) - top} more redirecting URLs")
+    return "\n".join(lines)
@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+Resource Hint Auditor
+
+Checks ``preconnect``, ``dns-prefetch`` and ``preload`` hints against what each
+page actually loads, and counts the third-party origins every page connects to:
+
+- preconnect/dns-prefetch to an origin the page never loads from (unused-preconnect)
+- origins serving render-critical resources with no preconnect (missing-preconnect)
+- preloads that nothing on the page consumes (unused-preload)
+- preloads without an ``as`` attribute, which browsers fetch twice (preload-missing-as)
+- more distinct third-party origins than the configured budget (third-party-budget)
+
+A page "loads from" an origin when one of its resource tags (stylesheets,
+scripts, images, iframes, media) points there, or when a stylesheet or script it
+loads does: local stylesheets and modules are followed through ``@import`` and
+``import`` chains, each scanned once per audit. Some origins are only reached
+through another one (Google Fonts CSS pulls font files from fonts.gstatic.com);
+these follow-on origins come from ``resource_hints.implied_origins`` in the
+config. Origins that only scripts reach at runtime with URLs from an API (gallery
+images on blob storage) are listed in ``resource_hints.runtime_origins``; hints
+to them are never reported as unused. Anchors and form actions are navigation,
+not page loads, and never count.
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import urljoin, urlparse
+
+from .asset_resolver import AssetResolver, is_local_reference
+from .css_scanner import CSSScanner
+from .html_link_parser import LinkInfo, ParseResults
+from .js_scanner import JS_SCRIPT_TYPES, JSScanner, scan_js_text
+from .profiling import Profiler, get_profiler
+
+
+CONNECTION_HINTS = ('preconnect', 'dns-prefetch')
+PRELOAD_HINTS = ('preload', 'modulepreload')
+HINT_RELS = CONNECTION_HINTS + PRELOAD_HINTS + ('prefetch', 'prerender')
+
+# rule id -> (severity, description)
+RULES = {
+    'unused-preconnect': ('warning', 'Connection hint for an origin the page never loads from'),
+    'missing-preconnect': ('warning', 'Render-critical resources from an origin without preconnect'),
+    'unused-preload': ('warning', 'Preloaded resource is never used by the page'),
+    'preload-missing-as': ('error', 'Preload without an as attribute is fetched twice'),
+    'third-party-budget': ('warning', 'Page loads from more third-party origins than the budget'),
+}
+
+# Tags whose href/src is navigation rather than a resource the page loads
+NAVIGATION_TAGS = {'a', 'area', 'form', 'base'}
+
+# <link rel> values that do not fetch anything
+NON_FETCHING_RELS = {'canonical', 'alternate', 'author', 'help', 'license', 'me', 'next', 'prev', 'search'}
+
+DEFAULT_THIRD_PARTY_BUDGET = 4
+
+
+@dataclass
+class HintFinding:
+    """A single resource hint finding on one page."""
+    rule: str
+    source_file: str
+    line_number: int
+    target: str
+    message: str
+
+    @property
+    def severity(self) -> str:
+        return RULES[self.rule][0]
+
+    def to_dict(self) -> Dict:
+        return {
+            'rule': self.rule,
+            'severity': self.severity,
+            'line_number': self.line_number,
+            'target': self.target,
+            'message': self.message
+        }
+
+
+def rel_tokens(attributes: Dict[str, str]) -> Set[str]:
+    return set((attributes.get('rel') or '').lower().split())
+
+
+def hint_rel(attributes: Dict[str, str]) -> Optional[str]:
+    """The resource hint a <link>'s rel declares, if any."""
+    tokens = rel_tokens(attributes)
+    for rel in HINT_RELS:
+        if rel in tokens:
+            return rel
+    return None
+
+
+def origin_of(href: str) -> Optional[str]:
+    """scheme://host for absolute and protocol-relative URLs, None for local ones."""
+    href = href.strip()
+    if href.startswith('//'):
+        href = 'https:' + href
+    parsed = urlparse(href)
+    if parsed.scheme not in ('http', 'https') or not parsed.netloc:
+        return None
+    return f"{parsed.scheme}://{parsed.netloc.lower()}"
+
+
+def is_render_critical(link: LinkInfo) -> bool:
+    """Whether the resource blocks or gates first render."""
+    attributes = link.attributes
+    if link.tag == 'link':
+        rels = rel_tokens(attributes)
+        if 'stylesheet' in rels:
+            return (attributes.get('media') or '').lower() != 'print'
+        if rels & set(PRELOAD_HINTS):
+            return (attributes.get('as') or '').lower() in ('style', 'font', 'script')
+        return False
+    if link.tag == 'script':
+        script_type = (attributes.get('type') or '').lower()
+        return (script_type in JS_SCRIPT_TYPES and script_type != 'module'
+                and 'async' not in attributes and 'defer' not in attributes)
+    return False
+
+
+class PageResources:
+    """Origins and resource keys one page loads, with the hints it declares."""
+
+    def __init__(self, page: str):
+        self.page = page
+        self.origins: Dict[str, bool] = {}   # origin -> used by a render-critical resource
+        self.consumed: Set[Tuple[str, str]] = set()
+        self.connection_hints: List[Tuple[LinkInfo, str]] = []
+        self.preloads: List[LinkInfo] = []
+
+    def use_origin(self, origin: Optional[str], critical: bool):
+        if origin is not None:
+            self.origins[origin] = self.origins.get(origin, False) or critical
+
+
+class ResourceHintAuditor:
+    """Audits resource hints and third-party origins page by page."""
+
+    def __init__(self, project_root: str, profiler: Optional[Profiler] = None, config: Optional[Dict] = None):
+        self.project_root = os.path.abspath(project_root)
+        self.profiler = get_profiler(profiler)
+        self.resolver = AssetResolver(self.project_root)
+        self.css_scanner = CSSScanner(self.resolver, profiler=self.profiler)
+        self.js_scanner = JSScanner(profiler=self.profiler)
+
+        config = config or {}
+        settings = config.get('resource_hints', {})
+        self.third_party_budget = settings.get('max_third_party_origins', DEFAULT_THIRD_PARTY_BUDGET)
+        self.implied_origins = {origin_of(source) or source: [origin_of(target) or target for target in targets]
+                                for source, targets in settings.get('implied_origins', {}).items()}
+        self.runtime_origins = {origin_of(origin) or origin for origin in settings.get('runtime_origins', [])}
+
+        production = config.get('project_settings', {}).get('production_url')
+        self.first_party = {origin_of(production)} if production else set()
+        self.pages: Dict[str, PageResources] = {}
+        self._css_cache: Dict[str, Tuple[Set[str], Set[Tuple[str, str]]]] = {}
+        self._js_cache: Dict[str, Tuple[Set[str], Set[Tuple[str, str]]]] = {}
+
+    def audit(self, results: ParseResults) -> Dict[str, List[HintFinding]]:
+        """Findings for every page in the parse results, keyed by source file.
+
+        Only the pages in these results are evaluated, so auditing one page at a
+        time does not re-evaluate the pages audited before it.
+        """
+        pages = {}
+        with self.profiler.phase('resource_hints'):
+            for source_file, links in results.get_links_by_file().items():
+                pages[source_file] = self._collect(source_file, links)
+            for block in results.inline_blocks:
+                if block.source_file in pages and block.tag == 'script' and \
+                        (block.attributes.get('type') or '').lower() in JS_SCRIPT_TYPES:
+                    references = scan_js_text(block.content, line_offset=block.line_number - 1)
+                    self._use_script_references(pages[block.source_file], block.source_file, references)
+            self.pages.update(pages)
+            findings = {source_file: self._evaluate(resources) for source_file, resources in pages.items()}
+        self.profiler.count('resource_hint_findings', sum(len(items) for items in findings.values()))
+        return findings
+
+    def third_party_origins(self, resources: PageResources) -> List[str]:
+        return sorted(origin for origin in resources.origins if origin not in self.first_party)
+
+    def _key(self, href: str, source_file: str) -> Tuple[str, str]:
+        """Identity of a referenced resource: its project file, or its absolute URL."""
+        if is_local_reference(href):
+            target = self.resolver.candidate_path(href, source_file)
+            if target is not None:
+                return ('file', str(target))
+        return ('url', urljoin('https://local/', href.strip()).split('#', 1)[0])
+
+    def _collect(self, source_file: str, links: List[LinkInfo]) -> PageResources:
+        resources = PageResources(source_file)
+        for link in links:
+            if not link.href or link.tag in NAVIGATION_TAGS:
+                continue
+            rel = hint_rel(link.attributes) if link.tag == 'link' else None
+            if rel in CONNECTION_HINTS:
+                resources.connection_hints.append((link, rel))
+                continue
+            if rel in PRELOAD_HINTS:
+                resources.preloads.append(link)
+                continue
+            if rel is not None or (link.tag == 'link' and rel_tokens(link.attributes) <= NON_FETCHING_RELS):
+                continue
+
+            critical = is_render_critical(link)
+            origin = origin_of(link.href)
+            self._use(resources, origin, critical)
+            resources.consumed.add(self._key(link.href, source_file))
+
+            if origin is not None or not is_local_reference(link.href):
+                continue
+            target = self.resolver.resolve(link.href, source_file)
+            if target is None:
+                continue
+            if link.tag == 'link' and 'stylesheet' in rel_tokens(link.attributes):
+                origins, consumed = self._stylesheet_uses(str(target))
+            elif link.tag == 'script':
+                origins, consumed = self._module_uses(str(target))
+            else:
+                continue
+            for used in origins:
+                self._use(resources, used, critical)
+            resources.consumed |= consumed
+
+        # Hints that are also stylesheets (rel="preload stylesheet") still load the file
+        for link in resources.preloads:
+            if 'stylesheet' in rel_tokens(link.attributes):
+                resources.consumed.add(self._key(link.href, source_file))
+        return resources
+
+    def _use(self, resources: PageResources, origin: Optional[str], critical: bool):
+        resources.use_origin(origin, critical)
+        for implied in self.implied_origins.get(origin, []):
+            resources.use_origin(implied, critical)
+
+    def _use_script_references(self, resources: PageResources, source_file: str, references):
+        for reference in references:
+            if reference.dynamic:
+                continue
+            resources.use_origin(origin_of(reference.href), False)
+            resources.consumed.add(self._key(reference.href, source_file))
+
+    def _stylesheet_uses(self, path: str, visiting: Optional[Set[str]] = None) -> Tuple[Set[str], Set[Tuple[str, str]]]:
+        """Origins and resources a local stylesheet loads, following @import."""
+        cached = self._css_cache.get(path)
+        if cached is not None:
+            return cached
+        visiting = visiting or set()
+        visiting.add(path)
+        origins, consumed = set(), set()
+        for reference in self.css_scanner.scan_file(path):
+            origin = origin_of(reference.href)
+            if origin is not None:
+                origins.add(origin)
+                origins.update(self.implied_origins.get(origin, []))
+            consumed.add(self._key(reference.href, path))
+        for imported in self.css_scanner.imports.get(os.path.abspath(path), []):
+            if imported not in visiting:
+                more_origins, more_consumed = self._stylesheet_uses(imported, visiting)
+                origins |= more_origins
+                consumed |= more_consumed
+        self._css_cache[path] = (origins, consumed)
+        return origins, consumed
+
+    def _module_uses(self, path: str, visiting: Optional[Set[str]] = None) -> Tuple[Set[str], Set[Tuple[str, str]]]:
+        """Origins and resources a local script loads, following static imports."""
+        cached = self._js_cache.get(path)
+        if cached is not None:
+            return cached
+        visiting = visiting or set()
+        visiting.add(path)
+        origins, consumed = set(), set()
+        for reference in self.js_scanner.scan_file(path):
+            if reference.dynamic:
+                continue
+            origin = origin_of(reference.href)
+            if origin is not None:
+                origins.add(origin)
+            consumed.add(self._key(reference.href, path))
+            if reference.kind != 'import' or origin is not None:
+                continue
+            target = self.resolver.resolve(reference.href, path)
+            if target is not None and str(target) not in visiting:
+                more_origins, more_consumed = self._module_uses(str(target), visiting)
+                origins |= more_origins
+                consumed |= more_consumed
+        self._js_cache[path] = (origins, consumed)
+        return origins, consumed
+
+    def _evaluate(self, resources: PageResources) -> List[HintFinding]:
+        page = resources.page
+        findings = []
+        preconnected: Dict[str, Set[str]] = {}
+
+        for link, rel in resources.connection_hints:
+            origin = origin_of(link.href)
+            if origin is None:
+                continue
+            preconnected.setdefault(origin, set()).add(rel)
+            if origin not in resources.origins and origin not in self.runtime_origins:
+                findings.append(HintFinding('unused-preconnect', page, link.line_number, link.href,
+                                            f"{rel} to {origin}, but the page loads nothing from it"))
+
+        for origin, critical in sorted(resources.origins.items()):
+            if not critical or origin in self.first_party or 'preconnect' in preconnected.get(origin, ()):
+                continue
+            detail = 'only dns-prefetch' if preconnected.get(origin) else 'no preconnect'
+            findings.append(HintFinding('missing-preconnect', page, 0, origin,
+                                        f"Render-critical resources load from {origin} with {detail}"))
+
+        for link in resources.preloads:
+            if not (link.attributes.get('as') or '').strip():
+                findings.append(HintFinding('preload-missing-as', page, link.line_number, link.href,
+                                            "Add as= (style, script, font, image, fetch) so the preload is reused"))
+            if self._key(link.href, page) not in resources.consumed:
+                findings.append(HintFinding('unused-preload', page, link.line_number, link.href,
+                                            "Nothing on the page uses this preload; remove it or fix its URL"))
+
+        third_party = self.third_party_origins(resources)
+        if len(third_party) > self.third_party_budget:
+            findings.append(HintFinding('third-party-budget', page, 0, ', '.join(third_party),
+                                        f"{len(third_party)} third-party origins (budget {self.third_party_budget})"))
+
+        findings.sort(key=lambda finding: finding.line_number)
+        return findings
+
+    def build_report(self, results: ParseResults) -> Dict:
+        """Per-page hint findings and third-party origins, worst pages first."""
+        findings = self.audit(results)
+        origins = {source_file: self.third_party_origins(resources) for source_file, resources in self.pages.items()}
+        by_rule: Dict[str, int] = {}
+        pages = []
+        for source_file, page_findings in findings.items():
+            for finding in page_findings:
+                by_rule[finding.rule] = by_rule.get(finding.rule, 0) + 1
+            pages.append({
+                'page': os.path.relpath(source_file, self.project_root),
+                'third_party_origins': origins.get(source_file, []),
+                'findings': [finding.to_dict() for finding in page_findings]
+            })
+        pages.sort(key=lambda page: (-len(page['findings']), page['page']))
+
+        origin_pages: Dict[str, int] = {}
+        for page_origins in origins.values():
+            for origin in page_origins:
+                origin_pages[origin] = origin_pages.get(origin, 0) + 1
+
+        return {
+            'summary': {
+                'pages': len(pages),
+                'pages_with_findings': sum(1 for page in pages if page['findings']),
+                'findings': sum(by_rule.values()),
+                'by_rule': dict(sorted(by_rule.items(), key=lambda item: -item[1])),
+                'third_party_budget': self.third_party_budget,
+                'third_party_origins': dict(sorted(origin_pages.items(), key=lambda item: (-item[1], item[0])))
+            },
+            'rules': {rule: {'severity': severity, 'description': description}
+                      for rule, (severity, description) in RULES.items()},
+            'pages': pages
+        }
+
+
+def format_hint_report(report: Dict, top: int = 15) -> str:
+    """Format a resource hint report for terminal output."""
+    summary = report['summary']
+    lines = [f"Findings: {summary['findings']} on {summary['pages_with_findings']} of {summary['pages']} pages"]
+    for rule, count in summary['by_rule'].items():
+        lines.append(f"  {rule:20}: {count:4d}  {report['rules'][rule]['description']}")
+
+    lines.append("")
+    lines.append(f"Third-party origins (budget {summary['third_party_budget']} per page):")
+    for origin, count in summary['third_party_origins'].items():
+        lines.append(f"  {count:4d} pages  {origin}")
+
+    shown = [page for page in report['pages'] if page['findings']][:top]
+    if shown:
+        lines.append("")
+        lines.append("Pages:")
+        for page in shown:
+            lines.append(f"  {page['page']} ({len(page['third_party_origins'])} third-party origins)")
+            for finding in page['findings']:
+                location = f"line {finding['line_number']}" if finding['line_number'] else "page"
+                lines.append(f"      {location}: {finding['rule']} - {finding['message']}")
+    return "\n".join(lines)
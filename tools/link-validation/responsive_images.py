@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Responsive Image Audit
+
+Checks every ``srcset`` candidate the parser found on ``<img>`` and ``<source>``
+against the image file it names, using header-only dimension reads:
+
+- the candidate file must exist
+- a ``w`` descriptor must match the file's real width; a wrongly labeled
+  candidate makes the browser pick a file larger or blurrier than it expects
+- no candidate may be wider than the widest slot ``sizes`` allows at the highest
+  device pixel ratio, nor an ``x`` candidate wider than its ``width`` attribute
+  times its density; anything larger is downloaded only to be scaled down
+
+``<link rel="icon" sizes="32x32">`` declarations make the same kind of promise
+about an image's dimensions and are checked too. Limits come from
+``responsive_images`` in the config; dimension reads share the stat-keyed
+``image_headers`` cache with the modern format report.
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from .asset_resolver import AssetResolver, is_local_reference
+from .html_link_parser import LinkInfo, ParseResults
+from .image_headers import ImageHeaderReader
+from .profiling import Profiler, get_profiler
+from .srcset import SRCSET_TAG, SrcsetCandidate, max_slot_width
+
+
+DEFAULT_MAX_VIEWPORT_WIDTH = 1920
+DEFAULT_MAX_DEVICE_PIXEL_RATIO = 3
+DEFAULT_WIDTH_TOLERANCE = 0.02
+DEFAULT_OVERSIZE_TOLERANCE = 0.25
+
+# rule id -> (severity, description)
+RULES = {
+    'missing-candidate': ('error', 'srcset candidate file does not exist'),
+    'invalid-descriptor': ('error', 'srcset descriptor cannot be parsed'),
+    'width-mismatch': ('error', "w descriptor does not match the image's real width"),
+    'oversized-candidate': ('warning', 'Candidate is wider than any slot needs at the highest pixel ratio'),
+    'icon-sizes-mismatch': ('warning', "Icon sizes attribute does not match the image's dimensions"),
+}
+
+
+@dataclass
+class SrcsetFinding:
+    """A problem with one srcset candidate or icon declaration."""
+    rule: str
+    source_file: str
+    line_number: int
+    target: str
+    message: str
+
+    @property
+    def severity(self) -> str:
+        return RULES[self.rule][0]
+
+    def to_dict(self) -> Dict:
+        return {
+            'rule': self.rule,
+            'severity': self.severity,
+            'line_number': self.line_number,
+            'target': self.target,
+            'message': self.message
+        }
+
+
+class ResponsiveImageAuditor:
+    """Checks srcset candidates and icon sizes against real image dimensions."""
+
+    def __init__(self, project_root: str, profiler: Optional[Profiler] = None,
+                 config: Optional[Dict] = None, use_cache: bool = True):
+        self.project_root = os.path.abspath(project_root)
+        self.profiler = get_profiler(profiler)
+        self.resolver = AssetResolver(self.project_root)
+        self.headers = ImageHeaderReader(self.project_root, profiler=self.profiler, use_cache=use_cache)
+
+        settings = (config or {}).get('responsive_images', {})
+        self.max_viewport_width = settings.get('max_viewport_width', DEFAULT_MAX_VIEWPORT_WIDTH)
+        self.max_device_pixel_ratio = settings.get('max_device_pixel_ratio', DEFAULT_MAX_DEVICE_PIXEL_RATIO)
+        self.width_tolerance = settings.get('width_tolerance', DEFAULT_WIDTH_TOLERANCE)
+        self.oversize_tolerance = settings.get('oversize_tolerance', DEFAULT_OVERSIZE_TOLERANCE)
+
+    def check_candidate(self, link: LinkInfo) -> List[SrcsetFinding]:
+        """Findings for one srcset candidate link."""
+        if not is_local_reference(link.href):
+            return []
+        attributes = link.attributes
+        candidate = SrcsetCandidate(link.href, attributes.get('descriptor', ''))
+
+        def finding(rule: str, message: str) -> SrcsetFinding:
+            return SrcsetFinding(rule, link.source_file, link.line_number, link.href, message)
+
+        if candidate.width is None and candidate.density is None:
+            return [finding('invalid-descriptor', f"Cannot parse descriptor '{candidate.descriptor}'")]
+
+        target = self.resolver.resolve(link.href, link.source_file)
+        if target is None:
+            return [finding('missing-candidate', f"No file for srcset candidate {link.href}")]
+        dimensions = self.headers.dimensions(target)
+        if dimensions is None:
+            return []
+        actual_width = dimensions[0]
+
+        findings = []
+        if candidate.width is not None:
+            if abs(actual_width - candidate.width) > candidate.width * self.width_tolerance:
+                findings.append(finding('width-mismatch',
+                                        f"Labeled {candidate.width}w but the image is {actual_width}px wide"))
+            slot = max_slot_width(attributes['sizes'], self.max_viewport_width) if attributes.get('sizes') else None
+            if slot is not None:
+                needed = slot * self.max_device_pixel_ratio
+                if actual_width > needed * (1 + self.oversize_tolerance):
+                    findings.append(finding('oversized-candidate',
+                                            f"{actual_width}px wide, but sizes never needs more than "
+                                            f"{needed:.0f}px at {self.max_device_pixel_ratio}x"))
+        else:
+            declared = attributes.get('width', '')
+            if declared.isdigit():
+                needed = int(declared) * candidate.density
+                if actual_width > needed * (1 + self.oversize_tolerance):
+                    findings.append(finding('oversized-candidate',
+                                            f"{actual_width}px wide for a {declared}px slot at {candidate.density:g}x "
+                                            f"({needed:.0f}px needed)"))
+        return findings
+
+    def check_icon(self, link: LinkInfo) -> List[SrcsetFinding]:
+        """Compare <link rel=icon sizes="WxH"> with the icon's real dimensions."""
+        sizes = (link.attributes.get('sizes') or '').lower().split()
+        if not sizes or 'any' in sizes or not is_local_reference(link.href):
+            return []
+        target = self.resolver.resolve(link.href, link.source_file)
+        dimensions = self.headers.dimensions(target) if target is not None else None
+        if dimensions is None:
+            return []
+        actual = f"{dimensions[0]}x{dimensions[1]}"
+        if actual in sizes:
+            return []
+        return [SrcsetFinding('icon-sizes-mismatch', link.source_file, link.line_number, link.href,
+                              f"Declared sizes=\"{' '.join(sizes)}\" but the image is {actual}")]
+
+    def audit(self, results: ParseResults) -> List[SrcsetFinding]:
+        """Findings for every srcset candidate and sized icon in the results."""
+        findings = []
+        candidates = 0
+        with self.profiler.phase('srcset'):
+            for link in results.links:
+                if link.tag == SRCSET_TAG:
+                    candidates += 1
+                    findings.extend(self.check_candidate(link))
+                elif link.tag == 'link' and 'icon' in (link.attributes.get('rel') or '').lower().split():
+                    findings.extend(self.check_icon(link))
+        self.headers.save()
+        self.profiler.count('srcset_candidates', candidates)
+        return findings
+
+    def build_report(self, results: ParseResults) -> Dict:
+        """Findings grouped by page with counts per rule."""
+        findings = self.audit(results)
+        pages: Dict[str, List[Dict]] = {}
+        by_rule: Dict[str, int] = {}
+        for item in findings:
+            page = os.path.relpath(item.source_file, self.project_root)
+            pages.setdefault(page, []).append(item.to_dict())
+            by_rule[item.rule] = by_rule.get(item.rule, 0) + 1
+
+        candidates = [link for link in results.links if link.tag == SRCSET_TAG]
+        return {
+            'summary': {
+                'srcset_candidates': len(candidates),
+                'elements_with_srcset': len({(link.source_file, link.line_number) for link in candidates}),
+                'findings': len(findings),
+                'by_rule': by_rule
+            },
+            'rules': {rule: {'severity': severity, 'description': description}
+                      for rule, (severity, description) in RULES.items()},
+            'pages': [{'page': page, 'findings': items} for page, items in sorted(pages.items())]
+        }
+
+
+def format_responsive_report(report: Dict, top: int = 15) -> str:
+    """Format a responsive image report for terminal output."""
+    summary = report['summary']
+    lines = [
+        f"srcset candidates: {summary['srcset_candidates']} on {summary['elements_with_srcset']} elements",
+        f"Findings: {summary['findings']}"
+    ]
+    for rule, count in sorted(summary['by_rule'].items(), key=lambda item: -item[1]):
+        lines.append(f"  {rule:20}: {count:4d}  {report['rules'][rule]['description']}")
+    for page in report['pages'][:top]:
+        lines.append("")
+        lines.append(f"  {page['page']}")
+        for finding in page['findings']:
+            lines.append(f"      line {finding['line_number']}: {finding['target']} - {finding['message']}")
+    return "\n".join(lines)
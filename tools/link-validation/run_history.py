@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Run History
+
+Records a compact summary of every validation run, one fingerprint and status
+per link, so a run can be compared with an earlier one and only the changes
+reported: new failures, fixed links and changed counts.
+
+A link's fingerprint is a short hash of its source file and URL. Each run stores
+its fingerprints sorted and split into buckets by the first hex digit pair, with
+a digest per bucket. Comparing two runs first compares the bucket digests and
+then merges the sorted entries of the buckets that differ, so unchanged parts of
+the site cost one digest comparison instead of a walk over every link. Messages
+are only kept for failing links, which is all a diff needs to display.
+
+Runs live in ``.cache/link-validation/history/`` as one JSON file each, plus an
+index listing them in order; old runs beyond the configured limit are pruned.
+Each run is recorded under a mode ("site" for a full run, "shard-2-of-4" for a
+shard), and every mode is its own timeline: a shard is only ever compared with
+earlier runs of the same shard.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from .stat_cache import atomic_write_bytes, get_cache_dir
+
+
+STATUS_CODES = {'valid': 'v', 'invalid': 'x', 'skipped': 's'}
+STATUS_NAMES = {code: name for name, code in STATUS_CODES.items()}
+
+# Worst status wins when the same link appears twice in one file
+_STATUS_RANK = {'v': 0, 's': 1, 'x': 2}
+
+BUCKET_PREFIX = 2
+DEFAULT_MAX_RUNS = 50
+SITE_MODE = 'site'
+
+
+def shard_mode(index: int, count: int) -> str:
+    """History mode of shard index (1-based) of count."""
+    return f"shard-{index}-of-{count}"
+
+
+def fingerprint(source_file: str, link: str) -> str:
+    """Stable short identifier of a link within its source file."""
+    return hashlib.blake2b(f"{source_file}\0{link}".encode('utf-8'), digest_size=8).hexdigest()
+
+
+class RunRecord:
+    """Sorted, bucketed fingerprints and statuses of one run."""
+
+    def __init__(self, run_id: str, created_at: str, counts: Dict[str, int],
+                 buckets: Dict[str, Dict], details: Dict[str, Dict]):
+        self.run_id = run_id
+        self.created_at = created_at
+        self.counts = counts
+        self.buckets = buckets
+        self.details = details
+
+    @classmethod
+    def from_entries(cls, run_id: str, entries: Iterable[Tuple[str, str, str, Optional[str]]]) -> 'RunRecord':
+        """Build a record from (source file, link, status, message) tuples."""
+        statuses: Dict[str, str] = {}
+        details: Dict[str, Dict] = {}
+        for source_file, link, status, message in entries:
+            key = fingerprint(source_file, link)
+            code = STATUS_CODES.get(status, 'x')
+            previous = statuses.get(key)
+            if previous is not None and _STATUS_RANK[previous] >= _STATUS_RANK[code]:
+                continue
+            statuses[key] = code
+            if code == 'x':
+                details[key] = {'file': source_file, 'link': link, 'message': message}
+
+        buckets: Dict[str, Dict] = {}
+        for key in sorted(statuses):
+            bucket = buckets.setdefault(key[:BUCKET_PREFIX], {'entries': []})
+            bucket['entries'].append(key + statuses[key])
+        for bucket in buckets.values():
+            bucket['digest'] = hashlib.blake2b(''.join(bucket['entries']).encode('ascii'),
+                                               digest_size=8).hexdigest()
+
+        counts = {name: 0 for name in STATUS_CODES}
+        for code in statuses.values():
+            counts[STATUS_NAMES[code]] += 1
+        counts['total'] = len(statuses)
+
+        return cls(run_id, time.strftime('%Y-%m-%dT%H:%M:%S'), counts, buckets, details)
+
+    def to_dict(self) -> Dict:
+        return {
+            'run_id': self.run_id,
+            'created_at': self.created_at,
+            'counts': self.counts,
+            'buckets': self.buckets,
+            'details': self.details
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'RunRecord':
+        return cls(data['run_id'], data['created_at'], data['counts'], data['buckets'], data['details'])
+
+
+def _merge_bucket(old: List[str], new: List[str], diff: Dict[str, List[str]]):
+    """Merge two sorted entry lists, collecting fingerprints whose status changed."""
+    i = j = 0
+    while i < len(old) or j < len(new):
+        old_key = old[i][:-1] if i < len(old) else None
+        new_key = new[j][:-1] if j < len(new) else None
+        if new_key is None or (old_key is not None and old_key < new_key):
+            diff['removed'].append(old[i])
+            i += 1
+        elif old_key is None or new_key < old_key:
+            diff['added'].append(new[j])
+            j += 1
+        else:
+            if old[i][-1] != new[j][-1]:
+                diff['changed'].append(old[i] + new[j][-1])
+            i += 1
+            j += 1
+
+
+def diff_runs(old: RunRecord, new: RunRecord) -> Dict:
+    """Compare two runs: new failures, fixed links and count changes."""
+    raw = {'added': [], 'removed': [], 'changed': []}
+    buckets_compared = 0
+    for prefix in sorted(set(old.buckets) | set(new.buckets)):
+        old_bucket = old.buckets.get(prefix)
+        new_bucket = new.buckets.get(prefix)
+        if old_bucket and new_bucket and old_bucket['digest'] == new_bucket['digest']:
+            continue
+        buckets_compared += 1
+        _merge_bucket(old_bucket['entries'] if old_bucket else [],
+                      new_bucket['entries'] if new_bucket else [], raw)
+
+    new_failures, fixed, removed_failures = [], [], []
+    for entry in raw['added']:
+        if entry[-1] == 'x':
+            new_failures.append(new.details.get(entry[:-1], {}))
+    for entry in raw['removed']:
+        if entry[-1] == 'x':
+            removed_failures.append(old.details.get(entry[:-1], {}))
+    for entry in raw['changed']:
+        key, was, now = entry[:-2], entry[-2], entry[-1]
+        if now == 'x':
+            new_failures.append(new.details.get(key, {}))
+        elif was == 'x':
+            fixed.append(dict(old.details.get(key, {}), status=STATUS_NAMES[now]))
+
+    return {
+        'from_run': old.run_id,
+        'to_run': new.run_id,
+        'new_failures': new_failures,
+        'fixed': fixed,
+        'removed_failures': removed_failures,
+        'links_added': len(raw['added']),
+        'links_removed': len(raw['removed']),
+        'status_changes': len(raw['changed']),
+        'buckets_compared': buckets_compared,
+        'counts': {
+            name: {'from': old.counts.get(name, 0), 'to': new.counts.get(name, 0)}
+            for name in new.counts
+            if old.counts.get(name, 0) != new.counts.get(name, 0)
+        }
+    }
+
+
+def format_diff(diff: Dict, top: int = 25) -> str:
+    """Format a run diff for terminal output."""
+    lines = [f"Changes since run {diff['from_run']}:"]
+    if diff['counts']:
+        for name, change in diff['counts'].items():
+            delta = change['to'] - change['from']
+            lines.append(f"  {name:8}: {change['from']} -> {change['to']} ({delta:+d})")
+    else:
+        lines.append("  Counts unchanged")
+    lines.append(f"  Links added: {diff['links_added']}, removed: {diff['links_removed']}, "
+                 f"status changes: {diff['status_changes']}")
+
+    sections = [
+        ('New failures', diff['new_failures']),
+        ('Fixed', diff['fixed']),
+        ('Failing links no longer present', diff['removed_failures']),
+    ]
+    for title, entries in sections:
+        if not entries:
+            continue
+        lines.append("")
+        lines.append(f"{title} ({len(entries)}):")
+        for entry in entries[:top]:
+            message = f" - {entry['message']}" if entry.get('message') and title == 'New failures' else ''
+            lines.append(f"  • {entry.get('file', '?')}: {entry.get('link', '?')}{message}")
+        if len(entries) > top:
+            lines.append(f"  ... and {len(entries) - top} more")
+
+    if not (diff['new_failures'] or diff['fixed'] or diff['removed_failures']):
+        lines.append("")
+        lines.append("No new failures and nothing fixed.")
+    return "\n".join(lines)
+
+
+class RunHistory:
+    """Directory of recorded runs with an ordered index, one timeline per mode."""
+
+    def __init__(self, project_root: Union[str, Path], max_runs: int = DEFAULT_MAX_RUNS,
+                 mode: str = SITE_MODE):
+        if max_runs < 1:
+            raise ValueError(f"history max_runs must be at least 1, got {max_runs}")
+        self.directory = get_cache_dir(project_root) / 'history'
+        self.directory.mkdir(exist_ok=True)
+        self.index_path = self.directory / 'index.json'
+        self.max_runs = max_runs
+        self.mode = mode
+
+    def _read_index(self) -> List[Dict]:
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f).get('runs', [])
+        except (FileNotFoundError, json.JSONDecodeError):
+            return []
+
+    def _in_mode(self, run: Dict) -> bool:
+        return run.get('mode', SITE_MODE) == self.mode
+
+    def runs(self) -> List[Dict]:
+        """Recorded runs of this mode, oldest first."""
+        return [run for run in self._read_index() if self._in_mode(run)]
+
+    def new_run_id(self) -> str:
+        return time.strftime('%Y%m%d-%H%M%S') + '-' + os.urandom(2).hex()
+
+    def load(self, reference: str) -> Optional[RunRecord]:
+        """Load a run of this mode by id, or its most recent run for 'last'."""
+        runs = self.runs()
+        if reference == 'last':
+            if not runs:
+                return None
+            reference = runs[-1]['run_id']
+        elif not any(run['run_id'] == reference for run in runs):
+            matches = [run['run_id'] for run in runs if run['run_id'].startswith(reference)]
+            if len(matches) != 1:
+                return None
+            reference = matches[0]
+
+        try:
+            with open(self.directory / f"{reference}.json", 'r', encoding='utf-8') as f:
+                return RunRecord.from_dict(json.load(f))
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            return None
+
+    def record(self, run: RunRecord):
+        """Store a run and prune this mode's oldest runs beyond the limit."""
+        data = json.dumps(run.to_dict(), separators=(',', ':'))
+        atomic_write_bytes(self.directory / f"{run.run_id}.json", data.encode('utf-8'))
+
+        runs = self._read_index()
+        runs.append({'run_id': run.run_id, 'created_at': run.created_at, 'mode': self.mode,
+                     'counts': run.counts})
+        own = [entry for entry in runs if self._in_mode(entry)]
+        stale = {entry['run_id'] for entry in own[:len(own) - self.max_runs]}
+        for run_id in stale:
+            try:
+                (self.directory / f"{run_id}.json").unlink()
+            except FileNotFoundError:
+                pass
+        runs = [entry for entry in runs if entry['run_id'] not in stale]
+        atomic_write_bytes(self.index_path, json.dumps({'runs': runs}, indent=1).encode('utf-8'))
@@ -1,37 +1,60 @@
 #!/usr/bin/env python3
 """
 Simple test runner for A Lo Cubano Boulder Fest link validation
+
+Runs the link validation pytest plugin with one test per discovered site file.
+The site index is built here once and handed to pytest, which shares it with
+every pytest-xdist worker when xdist is installed. Extra arguments are passed
+to pytest unchanged, e.g. ``-k gallery`` or ``-x``.
 """
 
-import sys
-import subprocess
+import argparse
+import importlib.util
 import os
+import subprocess
+import sys
+
 
 def main():
     """Run link validation tests with proper output handling"""
+    parser = argparse.ArgumentParser(description='Run link validation as one pytest item per site file')
+    parser.add_argument('-n', '--workers', default='auto',
+                       help='pytest-xdist worker count (default: auto; ignored without pytest-xdist)')
+    args, pytest_args = parser.parse_known_args()
+
     print("🎵 A Lo Cubano Boulder Fest - Running Link Validation Tests...")
-    
+
     # Get the project root directory
     script_dir = os.path.dirname(os.path.abspath(__file__))
     project_root = os.path.dirname(os.path.dirname(script_dir))
-    
-    # Test file is now in tests/unit/link-validation/
-    test_file = os.path.join(project_root, "tests", "unit", "link-validation", "test_link_validation.py")
-    
-    # Check if test file exists
-    if not os.path.exists(test_file):
-        print(f"ℹ️  Link validation test file not found at: {test_file}")
-        print("✅ Link validation tests have been removed or relocated")
-        return 0  # Return success since this is expected after cleanup
-    
+
+    if importlib.util.find_spec('pytest') is None:
+        print("❌ pytest is not installed; run: pip install pytest pytest-xdist")
+        return 1
+
+    sys.path.insert(0, project_root)
+    site_index = importlib.import_module('tools.link-validation.site_index')
+    index = site_index.SiteIndex.build(project_root)
+    index_path = index.save()
+
+    # Let pytest walk only the top-level entries holding site files
+    roots = sorted({relative.split('/', 1)[0] for relative in index.site_files})
+    command = [
+        sys.executable, '-m', 'pytest', '-p', 'tools.link-validation.pytest_plugin',
+        '--link-project-root', project_root, '--link-site-index', str(index_path)
+    ]
+    if importlib.util.find_spec('xdist') is not None and args.workers != '0':
+        command += ['-n', args.workers]
+    command += pytest_args + roots
+
+    print(f"📄 {len(index.site_files)} site files to check")
+
     try:
-        # Run the test framework
-        result = subprocess.run([
-            sys.executable, test_file
-        ], capture_output=False, text=True, cwd=project_root)
-        
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join(filter(None, [project_root, env.get('PYTHONPATH')]))
+        result = subprocess.run(command, capture_output=False, text=True, cwd=project_root, env=env)
         return result.returncode
-        
+
     except KeyboardInterrupt:
         print("\n\n⏹️ Tests interrupted by user")
         return 1
@@ -45,4 +68,4 @@ if __name__ == "__main__":
         print("\n🎊 All tests passed! Your festival website is ready to dance!")
     else:
         print(f"\n💃 Some links need attention before the festival starts!")
-    sys.exit(exit_code)
\ No newline at end of file
+    sys.exit(exit_code)
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Service Worker Precache and Web Manifest Check
+
+Service workers and web app manifests name URLs outside any HTML page, so the
+page-based checks never see them. A missing precache entry is worse than a
+broken link: ``cache.addAll()`` rejects and the worker never installs, which
+takes offline ticket QR display down with it.
+
+For each configured service worker script the URL lists passed to
+``cache.addAll(...)`` or ``precacheAndRoute(...)`` are extracted, either inline
+arrays or ``const NAME = [...]`` arrays the call names. For each manifest,
+``start_url``, ``scope``, icons, screenshots and shortcuts are extracted.
+Every URL is checked with the link validator's resolver, and the report gives
+the precache's total size, which the browser downloads before the worker
+installs. Manifest icon ``sizes`` are compared with the icons' real dimensions.
+"""
+
+import json
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .asset_resolver import AssetResolver
+from .image_headers import ImageHeaderReader
+from .js_scanner import array_literal_strings
+from .profiling import Profiler, get_profiler
+
+
+DEFAULT_SCRIPTS = ['js/sw.js', 'public/sw-qr-cache.js']
+DEFAULT_MANIFESTS = ['public/manifest.json']
+DEFAULT_MAX_PRECACHE_BYTES = 2 * 1024 * 1024
+
+_PRECACHE_CALL = re.compile(r'\b(?:addAll|precacheAndRoute)\s*\(\s*(?:(\[)|([A-Za-z_$][\w$]*))')
+
+
+@dataclass
+class ServiceWorkerURL:
+    """A URL named by a service worker's precache list or a web manifest."""
+    url: str
+    source_file: str
+    line_number: int
+    field: str  # precache array name, or manifest field such as 'icons[2].src'
+    sizes: Optional[str] = None  # declared icon sizes, manifests only
+
+
+def _array_start(text: str, name: str) -> Optional[int]:
+    match = re.search(r'\b(?:const|let|var)\s+' + re.escape(name) + r'\s*=\s*\[', text)
+    return match.end() - 1 if match else None
+
+
+def extract_precache_urls(text: str, source_file: str) -> List[ServiceWorkerURL]:
+    """URLs in every array handed to cache.addAll() or precacheAndRoute()."""
+    urls = []
+    seen_arrays = set()
+    for call in _PRECACHE_CALL.finditer(text):
+        if call.group(1):
+            start, name = call.start(1), 'addAll([...])'
+        else:
+            name = call.group(2)
+            start = _array_start(text, name)
+            if start is None:
+                continue  # Built at runtime; nothing to check statically
+        if start in seen_arrays:
+            continue
+        seen_arrays.add(start)
+        for literal in array_literal_strings(text, start):
+            if literal.href.startswith(('/', './', '../', 'http://', 'https://')):
+                urls.append(ServiceWorkerURL(literal.href, source_file, literal.line_number, name))
+    return urls
+
+
+def extract_manifest_urls(manifest: Dict, source_file: str) -> List[ServiceWorkerURL]:
+    """start_url, scope, icons, screenshots and shortcuts named by a web manifest."""
+    urls = []
+
+    def add(value, field_name: str, sizes: Optional[str] = None):
+        if isinstance(value, str) and value:
+            urls.append(ServiceWorkerURL(value, source_file, 0, field_name, sizes))
+
+    add(manifest.get('start_url'), 'start_url')
+    add(manifest.get('scope'), 'scope')
+    for key in ('icons', 'screenshots'):
+        for index, image in enumerate(manifest.get(key) or []):
+            add(image.get('src'), f'{key}[{index}].src', image.get('sizes'))
+    for index, shortcut in enumerate(manifest.get('shortcuts') or []):
+        add(shortcut.get('url'), f'shortcuts[{index}].url')
+        for icon_index, icon in enumerate(shortcut.get('icons') or []):
+            add(icon.get('src'), f'shortcuts[{index}].icons[{icon_index}].src', icon.get('sizes'))
+    return urls
+
+
+class ServiceWorkerAuditor:
+    """Validates service worker precache lists and web manifests."""
+
+    def __init__(self, project_root: str, profiler: Optional[Profiler] = None,
+                 config: Optional[Dict] = None, validator=None):
+        self.project_root = Path(project_root).resolve()
+        self.profiler = get_profiler(profiler)
+        self.resolver = AssetResolver(self.project_root)
+        self.headers = ImageHeaderReader(self.project_root, profiler=self.profiler)
+        if validator is None:
+            from .link_validator import LinkValidator
+            validator = LinkValidator(str(self.project_root), profiler=self.profiler)
+        self.validator = validator
+
+        settings = (config or {}).get('service_workers', {})
+        self.scripts = [self.project_root / path for path in settings.get('scripts', DEFAULT_SCRIPTS)]
+        self.manifests = [self.project_root / path for path in settings.get('manifests', DEFAULT_MANIFESTS)]
+        self.max_precache_bytes = settings.get('max_precache_bytes', DEFAULT_MAX_PRECACHE_BYTES)
+
+    def script_urls(self, path: Path) -> List[ServiceWorkerURL]:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            return extract_precache_urls(f.read(), str(path))
+
+    def manifest_urls(self, path: Path) -> List[ServiceWorkerURL]:
+        with open(path, 'r', encoding='utf-8') as f:
+            return extract_manifest_urls(json.load(f), str(path))
+
+    def check(self, entry: ServiceWorkerURL) -> Dict:
+        """Validation result, size and (for icons) dimension check of one URL."""
+        result = self.validator.validate_link(entry.url, entry.source_file)
+        target = self.resolver.resolve(entry.url, entry.source_file) if result.is_valid else None
+        if target is None and result.is_valid and result.target_path and os.path.isfile(result.target_path):
+            target = Path(result.target_path)
+        checked = {
+            'url': entry.url,
+            'field': entry.field,
+            'line_number': entry.line_number,
+            'valid': result.is_valid,
+            'link_type': result.link_type,
+            'error': result.error_message,
+            'size': target.stat().st_size if target is not None else None
+        }
+        if entry.sizes and target is not None:
+            dimensions = self.headers.dimensions(target)
+            if dimensions is not None:
+                actual = f"{dimensions[0]}x{dimensions[1]}"
+                if actual not in entry.sizes.lower().split() and 'any' not in entry.sizes.lower().split():
+                    checked['error'] = f"Declared sizes {entry.sizes} but the image is {actual}"
+                    checked['valid'] = False
+        return checked
+
+    def audit(self) -> Dict:
+        """Per-file results and precache totals for every configured worker and manifest."""
+        files = []
+        with self.profiler.phase('service_workers'):
+            for kind, paths, extract in (('service_worker', self.scripts, self.script_urls),
+                                         ('manifest', self.manifests, self.manifest_urls)):
+                for path in paths:
+                    entry = {'file': self.resolver.relative(path), 'kind': kind}
+                    try:
+                        entry['urls'] = [self.check(url) for url in extract(path)]
+                    except (OSError, ValueError) as e:
+                        entry['error'] = f"Cannot read {kind}: {e}"
+                        entry['urls'] = []
+                    files.append(entry)
+        self.headers.save()
+
+        for entry in files:
+            if entry['kind'] == 'service_worker':
+                entry['precache_bytes'] = sum(url['size'] or 0 for url in entry['urls'])
+                entry['over_budget'] = entry['precache_bytes'] > self.max_precache_bytes
+        invalid = sum(1 for entry in files for url in entry['urls'] if not url['valid'])
+        return {
+            'summary': {
+                'files': len(files),
+                'urls': sum(len(entry['urls']) for entry in files),
+                'invalid': invalid + sum(1 for entry in files if 'error' in entry),
+                'precache_bytes': sum(entry.get('precache_bytes', 0) for entry in files),
+                'max_precache_bytes': self.max_precache_bytes
+            },
+            'files': files
+        }
+
+
+def format_service_worker_report(report: Dict) -> str:
+    """Format a service worker and manifest report for terminal output."""
+    summary = report['summary']
+    lines = [
+        f"URLs checked: {summary['urls']} in {summary['files']} files ({summary['invalid']} invalid)",
+        f"Total precache: {summary['precache_bytes'] / 1024:.1f}K"
+    ]
+    for entry in report['files']:
+        lines.append("")
+        if entry['kind'] == 'service_worker':
+            budget = ' OVER BUDGET' if entry['over_budget'] else ''
+            lines.append(f"  {entry['file']}: {len(entry['urls'])} precached, "
+                         f"{entry['precache_bytes'] / 1024:.1f}K{budget}")
+        else:
+            lines.append(f"  {entry['file']}: {len(entry['urls'])} URLs")
+        if 'error' in entry:
+            lines.append(f"      {entry['error']}")
+        for url in entry['urls']:
+            if not url['valid']:
+                where = f"line {url['line_number']}" if url['line_number'] else url['field']
+                lines.append(f"      ❌ {where}: {url['url']} - {url['error']}")
+    return "\n".join(lines)
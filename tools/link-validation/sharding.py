@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Validation Sharding
+
+Splits site-wide validation across parallel CI jobs and merges their reports.
+
+Every job sees the same checkout, so each computes the same assignment on its own:
+files are ordered by size (largest first, ties broken by a stable hash of the
+path) and each file goes to the shard with the smallest total so far. That keeps
+shards balanced by bytes to validate, which tracks validation time far better
+than file counts, and the assignment never depends on filesystem order or
+Python's per-process hash seed.
+
+Shard reports are the JSON written by ``link_validator --shard i/N --output FILE``;
+merging them yields a report with the same layout as
+``generate_link_validation_report``.
+"""
+
+import hashlib
+import heapq
+import json
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+
+def parse_shard_spec(spec: str) -> Tuple[int, int]:
+    """Parse 'i/N' (1-based) into (index, count)."""
+    try:
+        index_text, count_text = spec.split('/', 1)
+        index, count = int(index_text), int(count_text)
+    except ValueError:
+        raise ValueError(f"Invalid shard '{spec}': expected i/N, e.g. 2/4")
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"Invalid shard '{spec}': index must be between 1 and {max(count, 1)}")
+    return index, count
+
+
+def _stable_hash(name: str) -> str:
+    return hashlib.blake2b(name.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def assign_shards(files: Sequence[Tuple[str, int]], count: int) -> List[List[str]]:
+    """Distribute (name, size) pairs over count shards, balancing total size."""
+    ordered = sorted(files, key=lambda item: (-item[1], _stable_hash(item[0]), item[0]))
+    shards: List[List[str]] = [[] for _ in range(count)]
+    loads = [(0, shard) for shard in range(count)]
+    for name, size in ordered:
+        load, shard = heapq.heappop(loads)
+        shards[shard].append(name)
+        heapq.heappush(loads, (load + size, shard))
+    return [sorted(names) for names in shards]
+
+
+def select_shard(paths: Sequence[Path], project_root: Path, index: int, count: int) -> List[Path]:
+    """Return the files belonging to shard index (1-based) of count."""
+    by_name = {path.relative_to(project_root).as_posix(): path for path in paths}
+    sizes = [(name, path.stat().st_size) for name, path in by_name.items()]
+    return [by_name[name] for name in assign_shards(sizes, count)[index - 1]]
+
+
+def load_report(path: str) -> Dict:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def merge_reports(reports: Sequence[Dict]) -> Dict:
+    """Merge shard reports into one report with recomputed totals.
+
+    Files validated by more than one shard (overlapping runs, retried jobs) are
+    counted once, so per-file issues are never duplicated in the totals, and a
+    broken link found on pages in different shards is one issue listing all of
+    them, exactly as in an unsharded report.
+    """
+    from .link_validator import LinkValidationResult, summarize_results
+
+    detailed: Dict[str, List[LinkValidationResult]] = {}
+    warnings: Dict[str, List[Dict]] = {}
+    valid_urls = set()
+    shards = []
+    duplicate_files = 0
+
+    for report in reports:
+        for file_path, results in report.get('detailed_results', {}).items():
+            if file_path in detailed:
+                duplicate_files += 1
+                continue
+            detailed[file_path] = [LinkValidationResult.from_dict(result) for result in results]
+            if report.get('warnings', {}).get(file_path):
+                warnings[file_path] = report['warnings'][file_path]
+        valid_urls.update(report.get('valid_internal_urls', []))
+        if report.get('shard'):
+            shards.append(report['shard'])
+
+    summary, issues_by_type = summarize_results(detailed)
+    summary['warnings'] = sum(len(items) for items in warnings.values())
+    merged = {
+        'summary': summary,
+        'issues_by_type': issues_by_type,
+        'warnings': dict(sorted(warnings.items())),
+        'detailed_results': {file_path: [result.to_dict() for result in results]
+                             for file_path, results in sorted(detailed.items())},
+        'valid_internal_urls': sorted(valid_urls),
+        'merged_from': {
+            'reports': len(reports),
+            'shards': sorted(shards, key=lambda shard: shard.get('index', 0)),
+            'duplicate_files_skipped': duplicate_files
+        }
+    }
+
+    counts = {shard.get('count') for shard in shards}
+    if len(counts) == 1:
+        expected = counts.pop()
+        missing = sorted(set(range(1, expected + 1)) - {shard.get('index') for shard in shards})
+        merged['merged_from']['missing_shards'] = missing
+    return merged
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Shared Site Index
+
+Snapshot of what the link validator learns about the tree before it validates
+anything: the file cache (every file under pages/, css/, js/, images/ and
+api/), the serverless route table, and the list of site files to validate.
+Building it walks the whole tree; everything else is per-file work.
+
+The snapshot is saved as JSON under the link validation cache so other
+processes can load it instead of walking the tree again. The pytest plugin
+builds it once in the controlling process and hands the path to every
+pytest-xdist worker, and ``LinkValidator(site_index=...)`` consumes it.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from .api_routes import ApiRouteTable
+from .profiling import Profiler, get_profiler
+from .stat_cache import atomic_write_bytes, get_cache_dir
+
+
+INDEX_VERSION = 1
+
+
+class SiteIndex:
+    """Project files, API routes and site files to validate, built once and shareable."""
+
+    def __init__(self, project_root: Union[str, Path], files: List[str], api_routes: ApiRouteTable,
+                 site_files: List[str]):
+        self.project_root = Path(project_root).resolve()
+        self.files = files             # project-relative paths, as keys of the validator's file cache
+        self.api_routes = api_routes
+        self.site_files = site_files   # project-relative paths, in validation order
+
+    @classmethod
+    def build(cls, project_root: Union[str, Path], profiler: Optional[Profiler] = None) -> 'SiteIndex':
+        """Walk the tree once with a link validator and keep what it found."""
+        from .link_validator import LinkValidator
+
+        profiler = get_profiler(profiler)
+        validator = LinkValidator(str(project_root), profiler=profiler)
+        root = validator.project_root
+        site_files = [path.relative_to(root).as_posix() for path in validator.discover_site_files()]
+        return cls(root, sorted(validator.get_cached_files()), validator.api_routes, site_files)
+
+    @staticmethod
+    def default_path(project_root: Union[str, Path]) -> Path:
+        return get_cache_dir(Path(project_root).resolve()) / 'site_index.json'
+
+    def file_cache(self) -> Dict[str, Path]:
+        """The validator's relative path to file mapping."""
+        return {relative: self.project_root / relative for relative in self.files}
+
+    def site_paths(self) -> List[Path]:
+        return [self.project_root / relative for relative in self.site_files]
+
+    def to_dict(self) -> Dict:
+        return {
+            'version': INDEX_VERSION,
+            'project_root': str(self.project_root),
+            'files': self.files,
+            'api_routes': self.api_routes.to_dict(),
+            'site_files': self.site_files
+        }
+
+    def save(self, path: Optional[Union[str, Path]] = None) -> Path:
+        """Write the index atomically; returns where it was written."""
+        path = Path(path) if path is not None else self.default_path(self.project_root)
+        atomic_write_bytes(path, json.dumps(self.to_dict(), separators=(',', ':')).encode('utf-8'))
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> Optional['SiteIndex']:
+        """Read a saved index; None if it is missing, unreadable or from another version."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if data.get('version') != INDEX_VERSION:
+            return None
+        root = data['project_root']
+        return cls(root, data['files'], ApiRouteTable.from_dict(root, data['api_routes']), data['site_files'])
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+SQLite Export
+
+Writes parse and validation results to an indexed SQLite database so questions
+such as "which pages load this script" or "which targets are broken" are a single
+query instead of a re-scan:
+
+- ``pages``: one row per HTML file (project-relative path and content hash)
+- ``targets``: one row per distinct target URL, with the project file serving it
+- ``links``: one row per link, pointing at its page and target
+- ``results``: validation status per target
+
+Relative and fragment-only references are normalized against their page before
+they become targets, so ``../css/main.css`` and ``#faq`` on different pages do not
+collide. All rows are written with bulk inserts inside one transaction.
+
+In incremental mode, pages whose content hash is unchanged keep their rows, and
+only changed, new and deleted pages are rewritten. Targets are upserted and every
+target is revalidated, since a target can break without its page changing.
+"""
+
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+
+from .asset_resolver import AssetResolver, is_local_reference
+from .html_link_parser import LinkInfo, ParseResults
+from .link_validator import LinkValidator
+from .parse_cache import content_digest
+from .profiling import Profiler, get_profiler
+from .vercel_config import VercelConfig
+
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS pages (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    content_hash TEXT NOT NULL,
+    link_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS targets (
+    id INTEGER PRIMARY KEY,
+    href TEXT NOT NULL UNIQUE,
+    resolved_path TEXT,
+    kind TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS links (
+    id INTEGER PRIMARY KEY,
+    page_id INTEGER NOT NULL REFERENCES pages(id) ON DELETE CASCADE,
+    target_id INTEGER NOT NULL REFERENCES targets(id),
+    href TEXT NOT NULL,
+    text TEXT,
+    line_number INTEGER,
+    tag TEXT,
+    category TEXT,
+    context TEXT,
+    attributes TEXT
+);
+CREATE TABLE IF NOT EXISTS results (
+    target_id INTEGER PRIMARY KEY REFERENCES targets(id) ON DELETE CASCADE,
+    status TEXT NOT NULL,
+    link_type TEXT,
+    message TEXT,
+    checked_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_links_href ON links(href);
+CREATE INDEX IF NOT EXISTS idx_links_target ON links(target_id);
+CREATE INDEX IF NOT EXISTS idx_links_page ON links(page_id);
+CREATE INDEX IF NOT EXISTS idx_links_category ON links(category);
+CREATE INDEX IF NOT EXISTS idx_targets_resolved_path ON targets(resolved_path);
+CREATE INDEX IF NOT EXISTS idx_results_status ON results(status);
+"""
+
+EXTERNAL_PREFIXES = ('http://', 'https://', '//')
+EMAIL_PREFIXES = ('mailto:', 'tel:')
+
+
+def normalize_href(href: str, page_path: str) -> str:
+    """Make relative and fragment-only references absolute against their page."""
+    href = href.strip()
+    if href.lower().startswith(EXTERNAL_PREFIXES + EMAIL_PREFIXES) or ':' in href.split('/', 1)[0]:
+        return href
+    return urljoin('/' + page_path, href)
+
+
+def target_kind(href: str, original: str) -> str:
+    """Classify a normalized target URL."""
+    lowered = href.lower()
+    if lowered.startswith(EXTERNAL_PREFIXES):
+        return 'external'
+    if lowered.startswith(EMAIL_PREFIXES):
+        return 'email'
+    if not is_local_reference(href):
+        return 'other'
+    if original.startswith('#'):
+        return 'anchor'
+    if href.startswith('/api/'):
+        return 'api'
+    path = href.split('#', 1)[0].split('?', 1)[0]
+    return 'page' if Path(path).suffix.lower() in ('', '.html') else 'asset'
+
+
+class SQLiteExporter:
+    """Writes ParseResults and per-target validation status to SQLite."""
+
+    def __init__(self, project_root: str, db_path: str, profiler: Optional[Profiler] = None,
+                 validator: Optional[LinkValidator] = None):
+        self.project_root = Path(project_root).resolve()
+        self.db_path = db_path
+        self.profiler = get_profiler(profiler)
+        self.validator = validator or LinkValidator(str(self.project_root), profiler=self.profiler)
+        self.resolver = AssetResolver(self.project_root)
+        self.router = VercelConfig(self.project_root)
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.db_path)
+        connection.execute('PRAGMA foreign_keys = ON')
+        connection.executescript(SCHEMA)
+        version = connection.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+        if version is not None and int(version[0]) != SCHEMA_VERSION:
+            raise ValueError(f"{self.db_path} uses schema version {version[0]}, expected {SCHEMA_VERSION}")
+        return connection
+
+    def export(self, results: ParseResults, incremental: bool = False) -> Dict:
+        """Write results to the database; returns counts of what changed."""
+        now = time.strftime('%Y-%m-%dT%H:%M:%S')
+        pages = self._collect_pages(results)
+
+        with self.profiler.phase('sqlite_export'):
+            connection = self._connect()
+            try:
+                with connection:
+                    stats = self._write(connection, pages, incremental, now)
+            finally:
+                connection.close()
+        return stats
+
+    def _collect_pages(self, results: ParseResults) -> Dict[str, Tuple[str, List[LinkInfo]]]:
+        pages = {}
+        for source_file, links in results.get_links_by_file().items():
+            path = Path(source_file).resolve()
+            try:
+                digest = content_digest(path.read_bytes()).hex()
+            except OSError:
+                continue
+            pages[self.resolver.relative(path)] = (digest, [link for link in links if link.href])
+        return pages
+
+    def _write(self, connection: sqlite3.Connection, pages: Dict[str, Tuple[str, List[LinkInfo]]],
+               incremental: bool, now: str) -> Dict:
+        if not incremental:
+            for table in ('links', 'results', 'targets', 'pages'):
+                connection.execute(f'DELETE FROM {table}')
+
+        existing = {path: digest for path, digest in connection.execute('SELECT path, content_hash FROM pages')}
+        changed = {path: entry for path, entry in pages.items() if existing.get(path) != entry[0]}
+        removed = [(path,) for path in existing if path not in pages]
+
+        # Pages: drop deleted ones, replace the links of changed ones
+        connection.executemany('DELETE FROM pages WHERE path = ?', removed)
+        connection.executemany(
+            'DELETE FROM links WHERE page_id = (SELECT id FROM pages WHERE path = ?)',
+            [(path,) for path in changed if path in existing]
+        )
+        connection.executemany(
+            'INSERT INTO pages (path, content_hash, link_count, updated_at) VALUES (?, ?, ?, ?) '
+            'ON CONFLICT(path) DO UPDATE SET content_hash = excluded.content_hash, '
+            'link_count = excluded.link_count, updated_at = excluded.updated_at',
+            [(path, digest, len(links), now) for path, (digest, links) in changed.items()]
+        )
+        page_ids = dict(connection.execute('SELECT path, id FROM pages'))
+
+        # Targets: upsert every target referenced by a changed page
+        rows: List[Tuple] = []
+        targets: Dict[str, Tuple[Optional[str], str]] = {}
+        for path, (_, links) in changed.items():
+            for link in links:
+                href = normalize_href(link.href, path)
+                if href not in targets:
+                    kind = target_kind(href, link.href)
+                    targets[href] = (self._resolve(href, kind), kind)
+                rows.append((page_ids[path], href, link))
+
+        connection.executemany(
+            'INSERT INTO targets (href, resolved_path, kind) VALUES (?, ?, ?) '
+            'ON CONFLICT(href) DO UPDATE SET resolved_path = excluded.resolved_path, kind = excluded.kind',
+            [(href, resolved, kind) for href, (resolved, kind) in targets.items()]
+        )
+        target_ids = dict(connection.execute('SELECT href, id FROM targets'))
+
+        connection.executemany(
+            'INSERT INTO links (page_id, target_id, href, text, line_number, tag, category, context, attributes) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            [
+                (page_id, target_ids[href], link.href, link.text, link.line_number, link.tag,
+                 link.category, link.context, json.dumps(link.attributes) if link.attributes else None)
+                for page_id, href, link in rows
+            ]
+        )
+        connection.execute('DELETE FROM targets WHERE id NOT IN (SELECT DISTINCT target_id FROM links)')
+
+        # Results: revalidate every remaining target
+        results, resolutions = [], []
+        for target_id, href, resolved, kind in connection.execute(
+                'SELECT id, href, resolved_path, kind FROM targets').fetchall():
+            if href not in targets:
+                # Files can appear or disappear without the referencing page changing
+                resolved = self._resolve(href, kind)
+                resolutions.append((resolved, target_id))
+            status, link_type, message = self._validate(href, resolved, kind)
+            results.append((target_id, status, link_type, message, now))
+        connection.executemany('UPDATE targets SET resolved_path = ? WHERE id = ?', resolutions)
+        connection.executemany(
+            'INSERT INTO results (target_id, status, link_type, message, checked_at) VALUES (?, ?, ?, ?, ?) '
+            'ON CONFLICT(target_id) DO UPDATE SET status = excluded.status, link_type = excluded.link_type, '
+            'message = excluded.message, checked_at = excluded.checked_at',
+            results
+        )
+        connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('schema_version', ?)",
+                           (str(SCHEMA_VERSION),))
+        connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('exported_at', ?)", (now,))
+
+        self.profiler.count('sqlite_rows', len(rows) + len(targets) + len(changed) + len(results))
+        return {
+            'pages': len(pages),
+            'pages_written': len(changed),
+            'pages_unchanged': len(pages) - len(changed),
+            'pages_removed': len(removed),
+            'links_written': len(rows),
+            'targets': len(results),
+            'invalid_targets': sum(1 for result in results if result[1] == 'invalid')
+        }
+
+    def _resolve(self, href: str, kind: str) -> Optional[str]:
+        if kind == 'page':
+            target = self.router.resolve_page(href)
+        elif kind in ('asset', 'anchor'):
+            target = self.resolver.resolve(href.split('#', 1)[0] or '/')
+        else:
+            return None
+        return self.resolver.relative(target) if target is not None else None
+
+    def _validate(self, href: str, resolved: Optional[str], kind: str) -> Tuple[str, str, Optional[str]]:
+        if kind in ('page', 'asset'):
+            if resolved is not None:
+                return 'valid', kind, None
+            return 'invalid', kind, f"No file serves {href}"
+
+        if kind == 'anchor' and resolved is not None:
+            result = self.validator.validate_link('#' + href.split('#', 1)[1],
+                                                  str(self.project_root / resolved))
+        else:
+            result = self.validator.validate_link(href)
+
+        if result.link_type == 'skipped':
+            return 'skipped', result.link_type, result.target_path
+        return ('valid' if result.is_valid else 'invalid'), result.link_type, result.error_message
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+srcset and sizes Parsing
+
+Splits ``srcset`` attributes into image candidates and bounds the slot widths a
+``sizes`` attribute can select. Kept free of parser imports so the HTML link
+parser can emit one link per candidate while it walks a page.
+
+``srcset`` follows the HTML candidate-string rules: URLs may contain commas,
+descriptors may not, and a URL ending in a comma has no descriptor. ``sizes``
+lengths in ``px``, ``vw`` and ``em``/``rem`` are evaluated against a maximum
+viewport width; ``calc()`` and other lengths that cannot be bounded statically
+make the whole attribute unknown.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import List, Optional
+
+
+SRCSET_TAG = 'srcset'
+
+ROOT_FONT_SIZE = 16
+
+_LENGTH = re.compile(r'^(\d+(?:\.\d+)?)(px|vw|em|rem)$')
+
+
+@dataclass
+class SrcsetCandidate:
+    """One image candidate from a srcset attribute."""
+    url: str
+    descriptor: str  # '480w', '2x' or '' (same as 1x)
+
+    @property
+    def width(self) -> Optional[int]:
+        if self.descriptor.endswith('w') and self.descriptor[:-1].isdigit():
+            return int(self.descriptor[:-1])
+        return None
+
+    @property
+    def density(self) -> Optional[float]:
+        if not self.descriptor:
+            return 1.0
+        if self.descriptor.endswith('x'):
+            try:
+                return float(self.descriptor[:-1])
+            except ValueError:
+                return None
+        return None
+
+
+def parse_srcset(value: str) -> List[SrcsetCandidate]:
+    """Split a srcset attribute into candidates, following the HTML parsing rules."""
+    candidates = []
+    position, length = 0, len(value)
+    while position < length:
+        while position < length and (value[position].isspace() or value[position] == ','):
+            position += 1
+        if position >= length:
+            break
+        start = position
+        while position < length and not value[position].isspace():
+            position += 1
+        url = value[start:position]
+
+        descriptor = ''
+        if url.endswith(','):
+            url = url.rstrip(',')
+        else:
+            start = position
+            depth = 0
+            while position < length:
+                character = value[position]
+                if character == '(':
+                    depth += 1
+                elif character == ')':
+                    depth = max(0, depth - 1)
+                elif character == ',' and depth == 0:
+                    break
+                position += 1
+            descriptor = ' '.join(value[start:position].split())
+            position += 1
+        if url:
+            candidates.append(SrcsetCandidate(url, descriptor.lower()))
+    return candidates
+
+
+def max_slot_width(sizes: str, max_viewport_width: int) -> Optional[float]:
+    """Widest CSS pixel slot a sizes attribute can select, or None if unknown."""
+    widest = None
+    for entry in sizes.split(','):
+        entry = entry.strip()
+        if not entry:
+            continue
+        length = entry.rsplit(None, 1)[-1] if not entry.endswith(')') else ''
+        match = _LENGTH.match(length.lower())
+        if not match:
+            return None
+        number, unit = float(match.group(1)), match.group(2)
+        if unit == 'vw':
+            width = number / 100 * max_viewport_width
+        elif unit in ('em', 'rem'):
+            width = number * ROOT_FONT_SIZE
+        else:
+            width = number
+        widest = width if widest is None else max(widest, width)
+    return widest
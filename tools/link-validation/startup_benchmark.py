@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark
+
+Measures how long it takes to import each link validation entry point in a fresh
+interpreter and fails when an entry point exceeds the startup budget or pulls in
+a module that only some commands need (networking, CSV export, memory tracing,
+asyncio). The JS test harness invokes these tools many times per run, so import
+time dominates small invocations.
+
+Each entry point is imported in a new ``python -X importtime`` process several
+times and the median cumulative import time is compared with the budget from
+``performance_budgets.startup_import_ms`` in the config. The test suite
+always checks that no entry point imports a lazy module; the millisecond budget
+depends on the machine, so ``tests/test_startup_benchmark.py`` only checks it
+with ``LINK_VALIDATION_STARTUP_BUDGET=1``.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .link_validator import load_config
+
+
+ENTRY_POINTS = ('link_analyzer', 'link_validator', 'html_link_parser')
+
+# Modules that must only load when a command needs them
+LAZY_MODULES = (
+    'requests', 'urllib3', 'charset_normalizer', 'chardet', 'csv',
+    'asyncio', 'tracemalloc', 'gzip', 'sqlite3'
+)
+
+DEFAULT_BUDGET_MS = 150.0
+
+# __import__ goes through the instrumented import path; importlib.import_module does not
+_PROBE = (
+    "import sys\n"
+    "__import__({module!r})\n"
+    "print(','.join(name for name in {lazy!r} if name in sys.modules))\n"
+)
+
+
+def _import_time_us(stderr: str, module: str) -> Optional[int]:
+    """Cumulative microseconds for a module from ``-X importtime`` output."""
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) == 3 and fields[2].strip() == module:
+            try:
+                return int(fields[1])
+            except ValueError:
+                return None
+    return None
+
+
+def measure_entry_point(entry_point: str, runs: int = 5) -> Dict:
+    """Import an entry point in fresh interpreters and report the median time."""
+    package = __package__ or 'tools.link-validation'
+    module = f"{package}.{entry_point}"
+    repo_root = Path(__file__).resolve().parents[2]
+    probe = _PROBE.format(module=module, lazy=LAZY_MODULES)
+
+    timings: List[int] = []
+    loaded: List[str] = []
+    for _ in range(runs):
+        completed = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', probe],
+            cwd=str(repo_root), capture_output=True, text=True
+        )
+        if completed.returncode != 0:
+            return {'entry_point': entry_point, 'error': completed.stderr.strip().splitlines()[-1:]}
+        elapsed = _import_time_us(completed.stderr, module)
+        if elapsed is None:
+            return {'entry_point': entry_point, 'error': ['no -X importtime entry for ' + module]}
+        timings.append(elapsed)
+        loaded = [name for name in completed.stdout.strip().split(',') if name]
+
+    return {
+        'entry_point': entry_point,
+        'median_ms': statistics.median(timings) / 1000,
+        'min_ms': min(timings) / 1000,
+        'runs': len(timings),
+        'lazy_modules_loaded': loaded
+    }
+
+
+def run_benchmark(budget_ms: float, runs: int = 5,
+                  entry_points: tuple = ENTRY_POINTS) -> Dict:
+    """Measure every entry point and flag budget or lazy-import violations."""
+    results = [measure_entry_point(entry_point, runs) for entry_point in entry_points]
+    failures = []
+    for result in results:
+        if 'error' in result:
+            failures.append(f"{result['entry_point']}: import failed {result['error']}")
+            continue
+        if result['median_ms'] > budget_ms:
+            failures.append(f"{result['entry_point']}: {result['median_ms']:.1f}ms exceeds "
+                            f"{budget_ms:.0f}ms budget")
+        if result['lazy_modules_loaded']:
+            failures.append(f"{result['entry_point']}: imports {', '.join(result['lazy_modules_loaded'])} "
+                            f"at startup")
+    return {'budget_ms': budget_ms, 'results': results, 'failures': failures}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check import-time startup budget of the link tools")
+    parser.add_argument('--project-root', type=str, default='.',
+                        help='Project root used to read the config (default: current directory)')
+    parser.add_argument('--runs', type=int, default=5,
+                        help='Fresh interpreter imports per entry point (default: 5)')
+    parser.add_argument('--budget-ms', type=float,
+                        help='Override performance_budgets.startup_import_ms from config')
+    args = parser.parse_args()
+
+    config = load_config(args.project_root)
+    budget_ms = args.budget_ms or config.get('performance_budgets', {}).get('startup_import_ms', DEFAULT_BUDGET_MS)
+    report = run_benchmark(budget_ms, runs=max(1, args.runs))
+
+    print(f"Startup budget: {budget_ms:.0f}ms (median of {args.runs} imports)")
+    for result in report['results']:
+        if 'error' in result:
+            print(f"  {result['entry_point']:18}: failed to import")
+            continue
+        print(f"  {result['entry_point']:18}: {result['median_ms']:7.1f}ms (min {result['min_ms']:.1f}ms)")
+
+    if report['failures']:
+        print("\nStartup budget violations:")
+        for failure in report['failures']:
+            print(f"  - {failure}")
+        sys.exit(1)
+    print("\nAll entry points within budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Stat-Keyed File Cache
+
+Small persistent cache for values derived from file contents (compressed sizes,
+image headers, ...). Entries are keyed by project-relative path and are only
+reused while the file's (mtime, size) pair is unchanged, so reruns skip the
+expensive work for untouched files.
+
+Caches live under ``.cache/link-validation/`` in the project root and are written
+atomically, so concurrent runs never observe a half-written file.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+
+CACHE_DIR_NAME = os.path.join(".cache", "link-validation")
+
+
+def get_cache_dir(project_root: Union[str, Path]) -> Path:
+    """Return (and create) the link validation cache directory."""
+    cache_dir = Path(project_root) / CACHE_DIR_NAME
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def atomic_write_bytes(path: Union[str, Path], data: bytes) -> None:
+    """Write a file via a temporary sibling and rename it into place."""
+    import tempfile  # Warm runs that find every cache entry never write
+
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+class StatKeyedCache:
+    """JSON-backed cache whose entries are invalidated by file mtime and size."""
+
+    def __init__(self, project_root: Union[str, Path], name: str, version: int = 1):
+        self.project_root = Path(project_root).resolve()
+        self.path = get_cache_dir(self.project_root) / f"{name}.json"
+        self.version = version
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[str, Dict] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        if data.get('version') == self.version:
+            self._entries = data.get('entries', {})
+
+    def _key(self, file_path: Path) -> str:
+        try:
+            return file_path.resolve().relative_to(self.project_root).as_posix()
+        except ValueError:
+            return file_path.resolve().as_posix()
+
+    def get(self, file_path: Union[str, Path], stat: Optional[os.stat_result] = None) -> Optional[Dict]:
+        """Return cached values for a file if its mtime and size still match."""
+        file_path = Path(file_path)
+        stat = stat or file_path.stat()
+        entry = self._entries.get(self._key(file_path))
+        if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            self.hits += 1
+            return entry['values']
+        self.misses += 1
+        return None
+
+    def set(self, file_path: Union[str, Path], values: Dict, stat: Optional[os.stat_result] = None):
+        """Store values for a file, keyed by its current mtime and size."""
+        file_path = Path(file_path)
+        stat = stat or file_path.stat()
+        self._entries[self._key(file_path)] = {
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'values': values
+        }
+        self._dirty = True
+
+    def save(self):
+        """Persist the cache if anything changed."""
+        if not self._dirty:
+            return
+        data = json.dumps({'version': self.version, 'entries': self._entries}, separators=(',', ':'))
+        atomic_write_bytes(self.path, data.encode('utf-8'))
+        self._dirty = False
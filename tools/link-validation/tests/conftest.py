@@ -0,0 +1,43 @@
+"""
+Tests for the link validation tools.
+
+The package directory has a hyphen in its name, so modules are imported as
+``importlib.import_module('tools.link-validation.<module>')`` with the project
+root on sys.path. Run from the project root::
+
+    python -m pytest tools/link-validation/tests
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+
+SITE_FILES = {
+    'vercel.json': '{"cleanUrls": true}',
+    'index.html': '<html><head><link rel="stylesheet" href="/css/main.css"></head><body>'
+                  '<a href="/core/tickets">Tickets</a><a href="/core/missing">Missing</a></body></html>',
+    'pages/404.html': '<html><body><a href="/">Home</a><a href="/core/missing">Missing</a></body></html>',
+    'pages/core/tickets.html': '<html><body><a href="/core/about">About</a>'
+                               '<a href="/core/missing">Missing</a><a href="/admin">Admin</a></body></html>',
+    'pages/core/about.html': '<html><body><a href="/core/tickets">Tickets</a>'
+                             '<img src="/images/missing.png" alt=""></body></html>',
+    'pages/admin/index.html': '<html><body><a href="/admin/nowhere">Nowhere</a></body></html>',
+    'css/main.css': 'body { background: url("/images/missing.png"); }',
+}
+
+
+@pytest.fixture
+def site_tree(tmp_path):
+    """Small site with nested pages and broken links shared between pages."""
+    for relative, content in SITE_FILES.items():
+        path = tmp_path / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding='utf-8')
+    return tmp_path
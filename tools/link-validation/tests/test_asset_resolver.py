@@ -0,0 +1,49 @@
+"""Asset resolution follows the rewrites in vercel.json."""
+
+import importlib
+import json
+
+asset_resolver = importlib.import_module('tools.link-validation.asset_resolver')
+
+
+REWRITES = [
+    {'source': '/wallet/:path*', 'destination': '/public/wallet/:path*'},
+    {'source': '/favicon.ico', 'destination': '/images/favicon.ico'},
+    {'source': '/gallery-data/:path*', 'destination': '/gallery-data/:path*'},
+    {'source': '/featured-photos.json', 'destination': '/featured-photos.json'},
+]
+
+
+def make_tree(root, files):
+    (root / 'vercel.json').write_text(json.dumps({'rewrites': REWRITES}), encoding='utf-8')
+    for relative in files:
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b'x')
+
+
+def test_rewrites_come_from_vercel_json(tmp_path):
+    make_tree(tmp_path, ['public/wallet/pass.pkpass', 'images/favicon.ico',
+                         'gallery-data/2025.json', 'featured-photos.json'])
+    resolver = asset_resolver.AssetResolver(tmp_path)
+    assert resolver.resolve('/wallet/pass.pkpass') == tmp_path / 'public/wallet/pass.pkpass'
+    assert resolver.resolve('/favicon.ico') == tmp_path / 'images/favicon.ico'
+    # Mapped to themselves, not to public/
+    assert resolver.resolve('/gallery-data/2025.json') == tmp_path / 'gallery-data/2025.json'
+    assert resolver.resolve('/featured-photos.json') == tmp_path / 'featured-photos.json'
+
+
+def test_files_on_disk_win_over_rewrites(tmp_path):
+    make_tree(tmp_path, ['favicon.ico', 'images/favicon.ico'])
+    resolver = asset_resolver.AssetResolver(tmp_path)
+    assert resolver.resolve('/favicon.ico') == tmp_path / 'favicon.ico'
+
+
+def test_unmatched_and_relative_references(tmp_path):
+    make_tree(tmp_path, ['css/main.css', 'pages/core/logo.png'])
+    resolver = asset_resolver.AssetResolver(tmp_path)
+    assert resolver.resolve('/css/main.css?v=2') == tmp_path / 'css/main.css'
+    assert resolver.resolve('/public/gallery-data/2025.json') is None
+    page = tmp_path / 'pages/core/about.html'
+    assert resolver.resolve('logo.png', str(page)) == tmp_path / 'pages/core/logo.png'
+    assert resolver.resolve('https://example.com/a.png') is None
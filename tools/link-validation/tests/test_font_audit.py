@@ -0,0 +1,30 @@
+"""Hosted font stylesheets are checked once per URL and reported on every page linking them."""
+
+import importlib
+
+font_audit = importlib.import_module('tools.link-validation.font_audit')
+html_link_parser = importlib.import_module('tools.link-validation.html_link_parser')
+
+
+FONTS_URL = 'https://fonts.googleapis.com/css2?family=Inter'
+
+
+def page(padding):
+    return ('<html><head>\n' + '<meta charset="utf-8">\n' * padding +
+            f'<link rel="stylesheet" href="{FONTS_URL}">\n</head><body></body></html>\n')
+
+
+def test_hosted_display_finding_names_each_page(tmp_path):
+    (tmp_path / 'index.html').write_text(page(0), encoding='utf-8')
+    (tmp_path / 'pages').mkdir()
+    (tmp_path / 'pages' / 'about.html').write_text(page(3), encoding='utf-8')
+
+    results = html_link_parser.HTMLLinkExtractor(str(tmp_path), use_cache=False).parse_project()
+    report = font_audit.WebFontAuditor(str(tmp_path)).build_report(results)
+
+    locations = {(page_report['page'], finding['line_number'])
+                 for page_report in report['pages'] for finding in page_report['findings']
+                 if finding['rule'] == 'missing-font-display'}
+    assert locations == {('index.html', 2), ('pages/about.html', 5)}
+    assert report['hosted'] == [{'url': FONTS_URL, 'missing_display': True, 'pages': 2}]
+    assert report['summary']['by_rule'] == {'missing-font-display': 2}
@@ -0,0 +1,111 @@
+"""Dimensions read from synthetic headers of every supported format."""
+
+import importlib
+import struct
+
+import pytest
+
+image_headers = importlib.import_module('tools.link-validation.image_headers')
+
+
+def png(width, height, color_type=6):
+    ihdr = struct.pack('>II5B', width, height, 8, color_type, 0, 0, 0)
+    return b'\x89PNG\r\n\x1a\n' + struct.pack('>I', len(ihdr)) + b'IHDR' + ihdr + b'\0' * 4
+
+
+def gif(width, height):
+    return b'GIF89a' + struct.pack('<HH', width, height) + b'\x00\x00\x00;'
+
+
+def riff(chunk, payload):
+    body = b'WEBP' + chunk + struct.pack('<I', len(payload)) + payload
+    return b'RIFF' + struct.pack('<I', len(body)) + body
+
+
+def webp_lossy(width, height):
+    return riff(b'VP8 ', b'\x00\x00\x00' + b'\x9d\x01\x2a' + struct.pack('<HH', width, height) + b'\0' * 8)
+
+
+def webp_lossless(width, height, alpha):
+    bits = (width - 1) | (height - 1) << 14 | int(alpha) << 28
+    return riff(b'VP8L', b'\x2f' + bits.to_bytes(4, 'little') + b'\0' * 8)
+
+
+def webp_extended(width, height, alpha, animated):
+    flags = (0x10 if alpha else 0) | (0x02 if animated else 0)
+    return riff(b'VP8X', bytes([flags, 0, 0, 0]) + (width - 1).to_bytes(3, 'little')
+                + (height - 1).to_bytes(3, 'little'))
+
+
+def jpeg(width, height, progressive, metadata_bytes=4000):
+    # A large APP1 (EXIF) segment before the frame header has to be skipped by length
+    app1 = b'\xff\xe1' + struct.pack('>H', metadata_bytes + 2) + b'E' * metadata_bytes
+    sof = b'\xff' + (b'\xc2' if progressive else b'\xc0') + struct.pack('>HBHHB', 11, 8, height, width, 1) + b'\0' * 3
+    return b'\xff\xd8' + app1 + sof + b'\xff\xd9'
+
+
+def box(box_type, payload):
+    return struct.pack('>I', 8 + len(payload)) + box_type + payload
+
+
+def avif(width, height, alpha):
+    ispe = box(b'ispe', b'\0' * 4 + struct.pack('>II', width, height))
+    thumbnail = box(b'ispe', b'\0' * 4 + struct.pack('>II', width // 4, height // 4))
+    properties = ispe + thumbnail
+    if alpha:
+        properties += box(b'auxC', b'\0' * 4 + b'urn:mpeg:mpegB:cicp:systems:auxiliary:alpha\0')
+    meta = box(b'meta', b'\0' * 4 + box(b'iprp', box(b'ipco', properties)))
+    return box(b'ftyp', b'avif' + b'\0' * 4 + b'mif1') + meta
+
+
+CASES = [
+    ('image.png', png(640, 480), ('png', 640, 480, True)),
+    ('opaque.png', png(32, 16, color_type=2), ('png', 32, 16, False)),
+    ('image.gif', gif(120, 90), ('gif', 120, 90, None)),
+    ('lossy.webp', webp_lossy(800, 600), ('webp', 800, 600, False)),
+    ('lossless.webp', webp_lossless(300, 200, alpha=True), ('webp', 300, 200, True)),
+    ('extended.webp', webp_extended(1920, 1080, alpha=True, animated=True), ('webp', 1920, 1080, True)),
+    ('photo.jpg', jpeg(1024, 768, progressive=False), ('jpeg', 1024, 768, False)),
+    ('image.avif', avif(2048, 1536, alpha=True), ('avif', 2048, 1536, True)),
+    ('mislabelled.jpg', png(64, 64), ('png', 64, 64, True)),
+]
+
+
+@pytest.mark.parametrize('name, data, expected', CASES, ids=[case[0] for case in CASES])
+def test_header_dimensions(tmp_path, name, data, expected):
+    path = tmp_path / name
+    path.write_bytes(data)
+    header = image_headers.read_image_header(path)
+    assert header is not None
+    assert (header.format, header.width, header.height, header.has_alpha) == expected
+
+
+def test_jpeg_progressive_flag(tmp_path):
+    path = tmp_path / 'progressive.jpg'
+    path.write_bytes(jpeg(400, 300, progressive=True))
+    header = image_headers.read_image_header(path)
+    assert (header.width, header.height, header.progressive) == (400, 300, True)
+
+
+def test_webp_animation_flag(tmp_path):
+    path = tmp_path / 'animated.webp'
+    path.write_bytes(webp_extended(50, 40, alpha=False, animated=True))
+    assert image_headers.read_image_header(path).animated is True
+
+
+@pytest.mark.parametrize('data', [b'', b'\x89PNG\r\n\x1a\n', b'GIF8', b'\xff\xd8\xff\xe0\x00', b'not an image'])
+def test_unknown_or_truncated_files(tmp_path, data):
+    path = tmp_path / 'broken.img'
+    path.write_bytes(data)
+    assert image_headers.read_image_header(path) is None
+
+
+def test_reader_caches_by_stat(tmp_path):
+    path = tmp_path / 'image.png'
+    path.write_bytes(png(10, 20))
+    reader = image_headers.ImageHeaderReader(tmp_path)
+    assert reader.dimensions(path) == (10, 20)
+    reader.save()
+
+    again = image_headers.ImageHeaderReader(tmp_path)
+    assert again.dimensions(path) == (10, 20)
@@ -0,0 +1,88 @@
+"""Image proxy ID index: Bloom filter with exact confirmation, rebuilt on manifest change."""
+
+import importlib
+import json
+import os
+
+image_proxy_ids = importlib.import_module('tools.link-validation.image_proxy_ids')
+profiling = importlib.import_module('tools.link-validation.profiling')
+
+
+def drive_id(number):
+    return f"1AbCdEfGhIjK{number:08d}"
+
+
+def write_manifest(root, ids):
+    path = root / '.gallery-sync-cache.json'
+    path.write_text(json.dumps({'files': {file_id: {'name': f'{file_id}.jpg'} for file_id in ids}}),
+                    encoding='utf-8')
+    return path
+
+
+def test_known_ids_are_found(tmp_path):
+    known = [drive_id(number) for number in range(500)]
+    write_manifest(tmp_path, known)
+    index = image_proxy_ids.ImageProxyIndex(tmp_path)
+    try:
+        assert index.available and len(index) == 500
+        assert all(file_id in index for file_id in known)
+        assert drive_id(999999) not in index
+        assert index.describe() == '.gallery-sync-cache.json'
+    finally:
+        index.close()
+
+
+def test_bloom_false_positives_are_rejected_by_exact_lookup(tmp_path):
+    known = [drive_id(number) for number in range(200)]
+    write_manifest(tmp_path, known)
+    profiler = profiling.Profiler()
+    # A loose filter so plenty of unknown IDs get past the Bloom test
+    index = image_proxy_ids.ImageProxyIndex(tmp_path, false_positive_rate=0.5, profiler=profiler)
+    try:
+        unknown = [drive_id(number) for number in range(10000, 12000)]
+        passed_bloom = [file_id for file_id in unknown if index.might_contain(file_id)]
+        assert passed_bloom
+        assert not any(file_id in index for file_id in unknown)
+        assert profiler.counters['image_proxy_bloom_false_positives'] == len(passed_bloom)
+    finally:
+        index.close()
+
+
+def test_index_is_reused_until_the_manifest_changes(tmp_path):
+    manifest = write_manifest(tmp_path, [drive_id(1), drive_id(2)])
+    image_proxy_ids.ImageProxyIndex(tmp_path).close()
+
+    profiler = profiling.Profiler()
+    reopened = image_proxy_ids.ImageProxyIndex(tmp_path, profiler=profiler)
+    assert drive_id(1) in reopened
+    assert 'image_proxy_ids' not in profiler.counters  # Opened, not rebuilt
+    reopened.close()
+
+    write_manifest(tmp_path, [drive_id(1), drive_id(2), drive_id(3)])
+    stat = manifest.stat()
+    os.utime(manifest, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    profiler = profiling.Profiler()
+    rebuilt = image_proxy_ids.ImageProxyIndex(tmp_path, profiler=profiler)
+    try:
+        assert profiler.counters['image_proxy_ids'] == 3
+        assert drive_id(3) in rebuilt
+    finally:
+        rebuilt.close()
+
+
+def test_unreadable_manifest_is_not_available(tmp_path):
+    (tmp_path / '.gallery-sync-cache.json').write_text('{not json', encoding='utf-8')
+    index = image_proxy_ids.ImageProxyIndex(tmp_path)
+    assert not index.available
+    assert drive_id(1) not in index
+
+
+def test_plain_text_and_list_manifests(tmp_path):
+    (tmp_path / 'ids.txt').write_text(f"{drive_id(1)}\nnot an id\n{drive_id(2)}\n", encoding='utf-8')
+    (tmp_path / 'ids.json').write_text(json.dumps([{'id': drive_id(3)}, {'id': 'x'}]), encoding='utf-8')
+    index = image_proxy_ids.ImageProxyIndex(tmp_path, manifests=['ids.txt', 'ids.json'])
+    try:
+        assert len(index) == 3
+        assert all(drive_id(number) in index for number in (1, 2, 3))
+    finally:
+        index.close()
@@ -0,0 +1,122 @@
+"""Live crawler against a local http.server running in a thread."""
+
+import importlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+live_crawler = importlib.import_module('tools.link-validation.live_crawler')
+
+
+INDEX = b"""<!DOCTYPE html>
+<html><body>
+<a href="/ok.html">ok</a>
+<a href="/missing.html">missing</a>
+<a href="/old">old</a>
+<a href="/truncated.html">truncated</a>
+</body></html>
+"""
+
+SHARED_NAV = b"""<html><body>
+<a href="/shared/one.html">1</a>
+<a href="/shared/two.html">2</a>
+<a href="/shared/three.html">3</a>
+</body></html>
+"""
+
+
+class SiteHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path == '/':
+            self._send(200, INDEX)
+        elif self.path == '/ok.html':
+            self._send(200, b"<html><body><a href='/'>home</a></body></html>")
+        elif self.path == '/old':
+            self.send_response(301)
+            self.send_header('Location', '/ok.html')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+        elif self.path == '/shared/':
+            self._send(200, b"<html><body><a href='a.html'>a</a><a href='b.html'>b</a></body></html>")
+        elif self.path in ('/shared/a.html', '/shared/b.html'):
+            # Both pages carry the same navigation links
+            self._send(200, SHARED_NAV)
+        elif self.path == '/truncated.html':
+            # Promise more bytes than are sent, then close the connection
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html')
+            self.send_header('Content-Length', '1000')
+            self.end_headers()
+            self.wfile.write(b"<html><bo")
+            self.close_connection = True
+        else:
+            self._send(404, b"<html><body>Not found</body></html>")
+
+    def _send(self, status, body):
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), SiteHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_crawl_statuses(server_url):
+    crawler = live_crawler.LiveCrawler(server_url, concurrency=4, timeout=5)
+    results = crawler.run('/')
+
+    ok = results[f"{server_url}/ok.html"]
+    assert ok.status == 200 and not ok.is_broken
+
+    missing = results[f"{server_url}/missing.html"]
+    assert missing.status == 404 and missing.is_broken
+    assert missing.referrer == f"{server_url}/"
+
+    old = results[f"{server_url}/old"]
+    assert old.redirect_chain == [(301, f"{server_url}/ok.html")]
+    assert old.status == 200 and old.final_url == f"{server_url}/ok.html"
+
+    truncated = results[f"{server_url}/truncated.html"]
+    assert truncated.is_broken
+    assert truncated.error.startswith("Truncated response")
+
+
+def test_report_counts(server_url):
+    crawler = live_crawler.LiveCrawler(server_url, concurrency=2, timeout=5)
+    report = crawler.build_report(crawler.run('/'))
+    summary = report['summary']
+    assert summary['urls_checked'] == 5
+    assert summary['broken'] == 2
+    assert summary['redirected'] == 1
+    assert summary['urls_over_limit'] == 0
+
+
+def test_max_pages_limit_is_reported(server_url):
+    crawler = live_crawler.LiveCrawler(server_url, concurrency=2, timeout=5, max_pages=2)
+    report = crawler.build_report(crawler.run('/'))
+    assert report['summary']['urls_checked'] == 2
+    assert report['summary']['urls_over_limit'] == 3
+    assert "over max_pages=2" in crawler.format_report(report)
+
+
+def test_urls_over_limit_counts_distinct_urls(server_url):
+    crawler = live_crawler.LiveCrawler(server_url, concurrency=1, timeout=5, max_pages=3)
+    report = crawler.build_report(crawler.run('/shared/'))
+    assert report['summary']['urls_checked'] == 3
+    # Three nav links on two pages: six rejected occurrences, three URLs
+    assert report['summary']['urls_over_limit'] == 3
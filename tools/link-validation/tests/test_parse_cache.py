@@ -0,0 +1,94 @@
+"""Parse cache round trips across partial runs."""
+
+import importlib
+import os
+
+html_link_parser = importlib.import_module('tools.link-validation.html_link_parser')
+parse_cache = importlib.import_module('tools.link-validation.parse_cache')
+
+
+def write_page(path, target):
+    path.write_text(f'<html><body><a href="{target}">link</a></body></html>', encoding='utf-8')
+
+
+def digest_of(path):
+    return parse_cache.content_digest(path.read_bytes())
+
+
+def parse_run(root, *pages):
+    """One run that parses only some pages, then saves the cache."""
+    extractor = html_link_parser.HTMLLinkExtractor(str(root))
+    extractor.parse_cache = parse_cache.ParseCache(root)
+    for page in pages:
+        extractor.parse_file(str(page))
+    extractor.parse_cache.save()
+    extractor.parse_cache.close()
+
+
+def cached(root, path):
+    cache = parse_cache.ParseCache(root)
+    try:
+        return cache.get(digest_of(path))
+    finally:
+        cache.close()
+
+
+def test_partial_runs_keep_each_others_entries(tmp_path):
+    first, second = tmp_path / 'first.html', tmp_path / 'second.html'
+    write_page(first, '/a.html')
+    write_page(second, '/b.html')
+
+    parse_run(tmp_path, first)
+    parse_run(tmp_path, second)
+
+    first_records = cached(tmp_path, first)
+    second_records = cached(tmp_path, second)
+    assert first_records is not None and first_records[0][0][0] == '/a.html'
+    assert second_records is not None and second_records[0][0][0] == '/b.html'
+
+
+def test_cache_hit_restores_links(tmp_path):
+    page = tmp_path / 'page.html'
+    write_page(page, '/tickets')
+    parse_run(tmp_path, page)
+
+    extractor = html_link_parser.HTMLLinkExtractor(str(tmp_path))
+    extractor.parse_cache = parse_cache.ParseCache(tmp_path)
+    results = extractor.parse_file(str(page))
+    assert extractor.parse_cache.hits == 1
+    assert [link.href for link in results.links] == ['/tickets']
+
+
+def test_changed_and_deleted_sources_are_pruned(tmp_path):
+    kept, changed, deleted, other = (tmp_path / f'{name}.html' for name in ('kept', 'changed', 'deleted', 'other'))
+    write_page(kept, '/kept.html')
+    write_page(changed, '/before.html')
+    write_page(deleted, '/deleted.html')
+    parse_run(tmp_path, kept, changed, deleted)
+
+    old_changed = digest_of(changed)
+    old_deleted = digest_of(deleted)
+    write_page(changed, '/after-the-edit.html')
+    os.remove(deleted)
+    write_page(other, '/other.html')
+    parse_run(tmp_path, other)
+
+    cache = parse_cache.ParseCache(tmp_path)
+    try:
+        assert cache.get(digest_of(kept)) is not None
+        assert cache.get(digest_of(other)) is not None
+        assert cache.get(old_changed) is None
+        assert cache.get(old_deleted) is None
+    finally:
+        cache.close()
+
+
+def test_read_only_run_does_not_rewrite(tmp_path):
+    page = tmp_path / 'page.html'
+    write_page(page, '/a.html')
+    parse_run(tmp_path, page)
+    cache_file = parse_cache.ParseCache(tmp_path).path
+    before = cache_file.stat().st_mtime_ns
+
+    parse_run(tmp_path, page)
+    assert cache_file.stat().st_mtime_ns == before
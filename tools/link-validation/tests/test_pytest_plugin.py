@@ -0,0 +1,103 @@
+"""The pytest plugin collects one link test per site file and shares its index."""
+
+import importlib
+import importlib.util
+import os
+import subprocess
+import sys
+
+import pytest
+
+from conftest import PROJECT_ROOT
+
+site_index = importlib.import_module('tools.link-validation.site_index')
+pytest_plugin = importlib.import_module('tools.link-validation.pytest_plugin')
+
+
+# Stands in for pytest-xdist: hands the session the index path a controller would
+WORKER_CONFTEST = f"""
+import os
+import pytest
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    config.workerinput = {{{pytest_plugin.WORKER_INPUT_KEY!r}: os.environ['LINK_INDEX_UNDER_TEST']}}
+"""
+
+
+def pytest_command(root, *args):
+    return [sys.executable, '-m', 'pytest', '-p', 'tools.link-validation.pytest_plugin', '-p', 'no:cacheprovider',
+            '--link-project-root', str(root), *args]
+
+
+def environment(**extra):
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [str(PROJECT_ROOT), env.get('PYTHONPATH')]))
+    env.update(extra)
+    return env
+
+
+def run_pytest(root, *args, **extra_env):
+    return subprocess.run(pytest_command(root, *args), cwd=root, env=environment(**extra_env),
+                          capture_output=True, text=True, timeout=120)
+
+
+def collected(output):
+    return {line.strip() for line in output.splitlines() if line.strip().endswith('::links')}
+
+
+def test_nested_pages_are_collected(site_tree):
+    result = run_pytest(site_tree, '--collect-only', '-q')
+    assert result.returncode == 0, result.stdout + result.stderr
+    items = collected(result.stdout)
+    assert 'pages/core/tickets.html::links' in items
+    assert 'pages/admin/index.html::links' in items
+    assert {'index.html::links', 'pages/404.html::links', 'css/main.css::links'} <= items
+
+
+def test_broken_links_fail_their_own_item(site_tree):
+    result = run_pytest(site_tree, '-q', 'pages/core/tickets.html', 'pages/core/about.html')
+    assert result.returncode == 1
+    assert 'FAILED pages/core/tickets.html::links' in result.stdout
+    assert '/core/missing' in result.stdout
+    assert 'pages/core/about.html::links' in result.stdout
+
+
+def test_sessions_share_the_saved_index(site_tree):
+    index_path = site_index.SiteIndex.build(site_tree).save()
+    # Added after the index was saved: sessions that load the index must not walk the tree again
+    (site_tree / 'pages' / 'core' / 'late.html').write_text('<html><body></body></html>', encoding='utf-8')
+    (site_tree / 'conftest.py').write_text(WORKER_CONFTEST, encoding='utf-8')
+
+    env = environment(LINK_INDEX_UNDER_TEST=str(index_path))
+    workers = [subprocess.Popen(pytest_command(site_tree, '--collect-only', '-q'), cwd=site_tree, env=env,
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+               for _ in range(2)]
+    outputs = [worker.communicate(timeout=120) for worker in workers]
+
+    for worker, (stdout, stderr) in zip(workers, outputs):
+        assert worker.returncode == 0, stdout + stderr
+        items = collected(stdout)
+        assert 'pages/core/tickets.html::links' in items
+        assert 'pages/core/late.html::links' not in items
+
+    # Without the shared index the new page is found
+    (site_tree / 'conftest.py').unlink()
+    assert 'pages/core/late.html::links' in collected(run_pytest(site_tree, '--collect-only', '-q').stdout)
+
+
+def test_saved_index_option_is_used(site_tree):
+    index_path = site_index.SiteIndex.build(site_tree).save(site_tree / 'index.json')
+    (site_tree / 'pages' / 'core' / 'late.html').write_text('<html><body></body></html>', encoding='utf-8')
+    result = run_pytest(site_tree, '--collect-only', '-q', '--link-site-index', str(index_path))
+    assert result.returncode == 0, result.stdout + result.stderr
+    items = collected(result.stdout)
+    assert 'pages/core/tickets.html::links' in items
+    assert 'pages/core/late.html::links' not in items
+
+
+@pytest.mark.skipif(importlib.util.find_spec('xdist') is None, reason='pytest-xdist is not installed')
+def test_xdist_workers(site_tree):
+    result = run_pytest(site_tree, '-n', '2', '-q', 'index.html', 'pages', 'css')
+    assert result.returncode == 1
+    assert 'FAILED pages/core/tickets.html::links' in result.stdout
@@ -0,0 +1,52 @@
+"""Resource hint findings surfaced through the link validator."""
+
+import importlib
+
+link_validator = importlib.import_module('tools.link-validation.link_validator')
+
+
+PAGE = """<html><head>
+<link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Inter">
+<link rel="preconnect" href="https://cdn.example.com">
+</head><body></body></html>
+"""
+
+
+def test_unused_hint_is_an_invalid_link(tmp_path):
+    page = tmp_path / 'index.html'
+    page.write_text(PAGE, encoding='utf-8')
+
+    results = link_validator.LinkValidator(str(tmp_path)).validate_file_links(str(page))
+    hints = [result for result in results if result.link_type == 'resource_hint']
+
+    assert len(hints) == 1 and not hints[0].is_valid
+    assert hints[0].link == 'https://cdn.example.com'
+    assert 'loads nothing from it' in hints[0].error_message
+
+
+def test_page_level_findings_are_warnings(tmp_path):
+    page = tmp_path / 'index.html'
+    page.write_text(PAGE, encoding='utf-8')
+
+    report = link_validator.LinkValidator(str(tmp_path)).generate_link_validation_report([page])
+    assert report['summary']['invalid_links'] == 1
+    assert report['summary']['warnings'] == 1
+
+    [warning] = report['warnings']['index.html']
+    assert warning['rule'] == 'missing-preconnect'
+    assert warning['target'] == 'https://fonts.googleapis.com'
+    assert 'no preconnect' in warning['message']
+    assert all(issue['link'] != warning['target']
+               for issues in report['issues_by_type'].values() for issue in issues)
+
+
+def test_only_the_validated_page_is_audited(tmp_path):
+    page = tmp_path / 'index.html'
+    page.write_text(PAGE, encoding='utf-8')
+    (tmp_path / 'pages').mkdir()
+    (tmp_path / 'pages' / 'other.html').write_text(PAGE, encoding='utf-8')
+
+    validator = link_validator.LinkValidator(str(tmp_path))
+    validator.validate_file_links(str(page))
+    _, auditor = validator._resource_hint_auditor
+    assert list(auditor.pages) == [str(page)]
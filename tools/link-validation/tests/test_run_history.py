@@ -0,0 +1,78 @@
+"""Recorded runs, their diff and per-mode timelines."""
+
+import importlib
+
+import pytest
+
+run_history = importlib.import_module('tools.link-validation.run_history')
+
+
+def record(history, entries, run_id):
+    run = run_history.RunRecord.from_entries(run_id, entries)
+    history.record(run)
+    return run
+
+
+def test_diff_between_two_recorded_runs(tmp_path):
+    history = run_history.RunHistory(tmp_path)
+    record(history, [
+        ('index.html', '/pages/tickets.html', 'valid', None),
+        ('index.html', '/pages/missing.html', 'invalid', 'File not found'),
+        ('pages/about.html', '/images/logo.png', 'valid', None),
+    ], 'run-1')
+    latest = run_history.RunRecord.from_entries('run-2', [
+        ('index.html', '/pages/tickets.html', 'invalid', 'File not found'),
+        ('index.html', '/pages/missing.html', 'valid', None),
+        ('pages/about.html', '/images/logo.png', 'valid', None),
+        ('pages/about.html', '/pages/new.html', 'valid', None),
+    ])
+
+    previous = history.load('last')
+    assert previous.run_id == 'run-1'
+    diff = run_history.diff_runs(previous, latest)
+
+    assert [entry['link'] for entry in diff['new_failures']] == ['/pages/tickets.html']
+    assert [entry['link'] for entry in diff['fixed']] == ['/pages/missing.html']
+    assert diff['links_added'] == 1
+    assert diff['status_changes'] == 2
+    assert diff['counts']['total'] == {'from': 3, 'to': 4}
+
+    output = run_history.format_diff(diff)
+    assert "Changes since run run-1:" in output
+    assert "New failures (1):" in output
+    assert "index.html: /pages/tickets.html - File not found" in output
+    assert "Fixed (1):" in output
+
+
+def test_identical_runs_compare_no_buckets(tmp_path):
+    entries = [('index.html', f'/pages/{number}.html', 'valid', None) for number in range(50)]
+    old = run_history.RunRecord.from_entries('a', entries)
+    new = run_history.RunRecord.from_entries('b', entries)
+    diff = run_history.diff_runs(old, new)
+    assert diff['buckets_compared'] == 0
+    assert "No new failures and nothing fixed." in run_history.format_diff(diff)
+
+
+def test_max_runs_below_one_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        run_history.RunHistory(tmp_path, max_runs=0)
+
+
+def test_prunes_oldest_runs(tmp_path):
+    history = run_history.RunHistory(tmp_path, max_runs=2)
+    for number in range(4):
+        record(history, [('index.html', '/', 'valid', None)], f'run-{number}')
+    assert [run['run_id'] for run in history.runs()] == ['run-2', 'run-3']
+    assert history.load('run-0') is None
+
+
+def test_modes_are_separate_timelines(tmp_path):
+    site = run_history.RunHistory(tmp_path, max_runs=1)
+    shard = run_history.RunHistory(tmp_path, max_runs=1, mode=run_history.shard_mode(1, 2))
+    record(site, [('index.html', '/', 'valid', None)], 'site-run')
+    record(shard, [('pages/a.html', '/', 'valid', None)], 'shard-run')
+
+    assert site.load('last').run_id == 'site-run'
+    assert shard.load('last').run_id == 'shard-run'
+    assert site.load('shard-run') is None
+    assert [run['run_id'] for run in site.runs()] == ['site-run']
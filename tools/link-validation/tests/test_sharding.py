@@ -0,0 +1,60 @@
+"""Sharded validation merges to the same totals as a single run."""
+
+import importlib
+
+import pytest
+
+link_validator = importlib.import_module('tools.link-validation.link_validator')
+sharding = importlib.import_module('tools.link-validation.sharding')
+
+
+def issue_set(report):
+    return {
+        (link_type, issue['link'], issue['error'], tuple(issue['pages']))
+        for link_type, issues in report['issues_by_type'].items()
+        for issue in issues
+    }
+
+
+def test_nested_pages_are_discovered(site_tree):
+    validator = link_validator.LinkValidator(str(site_tree))
+    files = {path.relative_to(site_tree).as_posix() for path in validator.discover_site_files()}
+    assert {'index.html', 'pages/404.html', 'pages/core/tickets.html',
+            'pages/core/about.html', 'pages/admin/index.html', 'css/main.css'} <= files
+
+    urls = validator.get_all_valid_internal_urls()
+    assert {'/core/tickets', '/core/about', '/admin', '/404'} <= urls
+
+
+def test_same_broken_link_is_one_issue_listing_its_pages(site_tree):
+    report = link_validator.LinkValidator(str(site_tree)).generate_link_validation_report()
+    missing = [issue for issues in report['issues_by_type'].values() for issue in issues
+               if issue['link'] == '/core/missing']
+    assert len(missing) == 1
+    assert missing[0]['pages'] == ['index.html', 'pages/404.html', 'pages/core/tickets.html']
+    assert missing[0]['file'] == 'index.html'
+
+
+@pytest.mark.parametrize('shard_count', [2, 3])
+def test_merged_shards_equal_full_run(site_tree, tmp_path_factory, shard_count):
+    full_validator = link_validator.LinkValidator(str(site_tree))
+    full = full_validator.generate_link_validation_report()
+
+    output = tmp_path_factory.mktemp('shards')
+    reports = []
+    for index in range(1, shard_count + 1):
+        validator = link_validator.LinkValidator(str(site_tree))
+        files = sharding.select_shard(validator.discover_site_files(), validator.project_root, index, shard_count)
+        report = validator.generate_link_validation_report(files)
+        report['shard'] = {'index': index, 'count': shard_count, 'files': len(files)}
+        path = output / f'shard-{index}.json'
+        validator.save_json_report(report, str(path))
+        reports.append(sharding.load_report(str(path)))
+
+    merged = sharding.merge_reports(reports)
+    assert merged['summary'] == full['summary']
+    assert issue_set(merged) == issue_set(full)
+    assert set(merged['detailed_results']) == set(full['detailed_results'])
+    assert merged['valid_internal_urls'] == full['valid_internal_urls']
+    assert merged['merged_from']['missing_shards'] == []
+    assert merged['merged_from']['duplicate_files_skipped'] == 0
@@ -0,0 +1,49 @@
+"""Startup cost of the link tool entry points.
+
+The lazy-import check always runs. The millisecond budget depends on the
+machine, so it only runs when LINK_VALIDATION_STARTUP_BUDGET=1 is set, e.g. on
+a dedicated benchmark job; ``python -m tools.link-validation.startup_benchmark``
+checks it by hand.
+"""
+
+import importlib
+import os
+
+import pytest
+
+from conftest import PROJECT_ROOT
+
+link_validator = importlib.import_module('tools.link-validation.link_validator')
+startup_benchmark = importlib.import_module('tools.link-validation.startup_benchmark')
+
+
+def configured_budget_ms():
+    return link_validator.load_config(str(PROJECT_ROOT)).get('performance_budgets', {}).get('startup_import_ms')
+
+
+@pytest.mark.parametrize('entry_point', startup_benchmark.ENTRY_POINTS)
+def test_entry_point_defers_optional_modules(entry_point):
+    result = startup_benchmark.measure_entry_point(entry_point, runs=1)
+    assert 'error' not in result, result.get('error')
+    assert result['lazy_modules_loaded'] == []
+
+
+@pytest.mark.skipif(os.environ.get('LINK_VALIDATION_STARTUP_BUDGET') != '1',
+                    reason='wall-clock budget; set LINK_VALIDATION_STARTUP_BUDGET=1 to run')
+def test_entry_points_within_startup_budget():
+    budget_ms = configured_budget_ms()
+    if not budget_ms:
+        pytest.skip("performance_budgets.startup_import_ms is not configured")
+
+    report = startup_benchmark.run_benchmark(budget_ms, runs=3)
+    assert not report['failures'], "\n".join(report['failures'])
+
+
+def test_import_time_parsing():
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 | tools\n"
+        "import time:      4000 |      52000 | tools.link-validation.link_analyzer\n"
+    )
+    assert startup_benchmark._import_time_us(stderr, 'tools.link-validation.link_analyzer') == 52000
+    assert startup_benchmark._import_time_us(stderr, 'tools.link-validation.link_validator') is None
@@ -0,0 +1,118 @@
+"""Build output validation against a small Vite build."""
+
+import importlib
+import json
+import subprocess
+import sys
+
+import pytest
+
+from conftest import PROJECT_ROOT
+
+vite_build = importlib.import_module('tools.link-validation.vite_build')
+
+
+MANIFEST = {
+    'src/main.jsx': {'file': 'assets/main-AbCd1234.js', 'src': 'src/main.jsx', 'isEntry': True,
+                     'imports': ['_vendor-EfGh5678.js'], 'dynamicImports': ['src/admin.jsx'],
+                     'css': ['assets/main-IjKl9012.css']},
+    '_vendor-EfGh5678.js': {'file': 'assets/vendor-EfGh5678.js'},
+    'src/admin.jsx': {'file': 'assets/admin-MnOp3456.js', 'src': 'src/admin.jsx', 'isDynamicEntry': True},
+}
+
+BUILD_FILES = {
+    '.vite/manifest.json': json.dumps(MANIFEST),
+    'assets/main-AbCd1234.js': 'x' * 2048,
+    'assets/vendor-EfGh5678.js': 'v' * 4096,
+    'assets/main-IjKl9012.css': 'c' * 1024,
+    'assets/admin-MnOp3456.js': 'a' * 512,
+    'index.html': '<html><head><script type="module" src="/dist/assets/main-AbCd1234.js"></script></head>\n'
+                  '<body><a href="/core/tickets">Tickets</a>\n<a href="/missing.html">Missing</a></body></html>',
+}
+
+SOURCE_PAGE = ('<html><head><script type="module" src="/dist/assets/main-Zz9Yy8Xx.js"></script></head>'
+               '<body></body></html>')
+
+
+@pytest.fixture
+def build_report(site_tree):
+    for relative, content in BUILD_FILES.items():
+        path = site_tree / 'dist' / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding='utf-8')
+    (site_tree / 'pages' / 'core' / 'app.html').write_text(SOURCE_PAGE, encoding='utf-8')
+    validator = vite_build.BuildValidator(str(site_tree), 'dist', config={'vite_build': {'base': '/dist/'}})
+    return validator.validate()
+
+
+def test_emitted_pages_are_labelled_by_build_dir(build_report):
+    pages = {issue['page'] for issue in build_report['issues']} | {row['page'] for row in build_report['pages']}
+    assert 'dist/index.html' in pages
+    assert not any(page.startswith('/dist/') for page in pages)
+
+
+def test_missing_page_link_in_emitted_html_is_reported(build_report):
+    by_link = {issue['link']: issue for issue in build_report['issues']}
+    assert '/missing.html' in by_link
+    assert by_link['/missing.html']['page'] == 'dist/index.html'
+    assert by_link['/missing.html']['line_number'] == 3
+    assert '/core/tickets' not in by_link
+
+
+def test_stale_source_reference_names_current_output(build_report):
+    stale = [issue for issue in build_report['issues'] if issue['link'].endswith('main-Zz9Yy8Xx.js')]
+    assert len(stale) == 1
+    assert 'assets/main-AbCd1234.js (from src/main.jsx)' in stale[0]['error']
+
+
+def test_per_page_bundle_cost(build_report):
+    rows = {row['page']: row for row in build_report['pages']}
+    emitted = rows['dist/index.html']
+    assert emitted['js_bytes'] == 2048 + 4096
+    assert emitted['css_bytes'] == 1024
+    assert emitted['lazy_bytes'] == 512
+    # The stale reference is costed as the output that replaces it
+    assert rows['pages/core/app.html']['total_bytes'] == emitted['total_bytes']
+
+    output = vite_build.format_build_report(build_report)
+    assert "Bundle cost per page" in output
+    assert "dist/index.html" in output
+    assert "entries: assets/main-AbCd1234.js (from src/main.jsx)" in output
+
+
+PWA_MANIFEST = {'name': 'A Lo Cubano Boulder Fest', 'start_url': '/',
+                'icons': [{'src': '/images/icon-192.png', 'sizes': '192x192'}]}
+
+
+def write_build(root, files):
+    for relative, content in files.items():
+        path = root / 'dist' / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding='utf-8')
+    return vite_build.BuildValidator(str(root), 'dist', config={'vite_build': {'base': '/dist/'}}).validate()
+
+
+def test_vite_manifest_is_preferred_over_pwa_manifest(site_tree):
+    report = write_build(site_tree, {**BUILD_FILES, 'manifest.json': json.dumps(PWA_MANIFEST)})
+    assert report['summary']['manifest'] == '.vite/manifest.json'
+    assert any(chunk['source'] == 'src/main.jsx' for chunk in report['chunks'])
+
+
+def test_pwa_manifest_alone_is_not_a_vite_manifest(site_tree):
+    files = {relative: content for relative, content in BUILD_FILES.items() if relative != '.vite/manifest.json'}
+    report = write_build(site_tree, {**files, 'manifest.json': json.dumps(PWA_MANIFEST)})
+    assert report['summary']['manifest'] is None
+
+
+def test_legacy_manifest_location_is_still_read(site_tree):
+    files = {relative: content for relative, content in BUILD_FILES.items() if relative != '.vite/manifest.json'}
+    report = write_build(site_tree, {**files, 'manifest.json': json.dumps(MANIFEST)})
+    assert report['summary']['manifest'] == 'manifest.json'
+
+
+def test_missing_build_dir_exits_non_zero(site_tree):
+    result = subprocess.run([sys.executable, '-m', 'tools.link-validation.link_validator', str(site_tree),
+                             '--build-dir', 'dist'],
+                            cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=120)
+    assert result.returncode == 1
+    assert 'Build directory not found' in result.stdout
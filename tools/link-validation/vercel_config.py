@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Vercel Routing Configuration
+
+Compiles the rewrites, redirects and headers declared in vercel.json into
+regular expressions once, so the validators can map a clean URL such as
+``/about`` or ``/boulder-fest-2026/artists`` to the page file that actually
+serves it, and tell which response headers a URL is served with.
+
+Source patterns use Vercel's path-to-regexp syntax: ``:name`` matches one path
+segment, ``:name*`` matches zero or more, ``(a|b)`` is a regex group, and ``\\.``
+escapes a literal character. Destinations substitute ``$1``-style groups and
+``:name`` parameters.
+
+Page resolution follows the platform's order: redirects first, then files on
+disk (with ``cleanUrls`` adding ``.html``), then the first matching rewrite.
+Every header rule whose source matches a path applies, and a later rule
+overrides a header an earlier one set.
+
+Redirect chains include the platform's own redirects: ``cleanUrls`` sends
+``/about.html`` to ``/about`` and ``trailingSlash`` adds or strips the final
+slash. A chain is computed once per unique path and shared by every chain that
+passes through it. Results are memoized per URL.
+"""
+
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Pattern, Tuple, Union
+from urllib.parse import unquote, urlparse
+
+
+_SOURCE_TOKEN = re.compile(r'''
+    \\(?P<escaped>.)                                             # escaped literal
+  | :(?P<name>\w+)(?:\((?P<param_re>[^)]*)\))?(?P<modifier>[*+?]?)  # named parameter
+  | (?P<group>\((?:\\.|[^()\\])*\))                            # regex group
+  | (?P<literal>.)
+''', re.VERBOSE | re.DOTALL)
+
+_DESTINATION_TOKEN = re.compile(r'\$(\d+)|:(\w+)\*?')
+
+MAX_REDIRECT_HOPS = 10
+
+
+def compile_source(source: str) -> Pattern:
+    """Compile a Vercel source pattern into an anchored regular expression."""
+    parts: List[str] = []
+    for token in _SOURCE_TOKEN.finditer(source):
+        if token.group('escaped') is not None:
+            parts.append(re.escape(token.group('escaped')))
+        elif token.group('name') is not None:
+            name, modifier = token.group('name'), token.group('modifier')
+            param_re = token.group('param_re') or ('.+' if modifier in ('*', '+') else '[^/]+')
+            if modifier in ('*', '?') and parts and parts[-1] == '/':
+                # An optional parameter swallows its leading slash: /images/:path* matches /images
+                parts[-1] = f'(?:/(?P<{name}>{param_re}))?'
+            elif modifier in ('*', '?'):
+                parts.append(f'(?P<{name}>{param_re})?')
+            else:
+                parts.append(f'(?P<{name}>{param_re})')
+        elif token.group('group') is not None:
+            parts.append(token.group('group'))
+        else:
+            literal = token.group('literal')
+            parts.append('/' if literal == '/' else re.escape(literal))
+    return re.compile('^' + ''.join(parts) + '$')
+
+
+@dataclass
+class RouteRule:
+    """A compiled rewrite or redirect rule from vercel.json."""
+    source: str
+    destination: str
+    pattern: Pattern
+    permanent: bool = False
+    status_code: Optional[int] = None
+
+    @property
+    def status(self) -> int:
+        return self.status_code or (308 if self.permanent else 307)
+
+    def apply(self, path: str) -> Optional[str]:
+        """Return the destination for a matching path, or None."""
+        match = self.pattern.match(path)
+        if match is None:
+            return None
+
+        def substitute(token) -> str:
+            if token.group(1) is not None:
+                index = int(token.group(1))
+                value = match.group(index) if index <= (match.re.groups or 0) else None
+            else:
+                value = match.groupdict().get(token.group(2))
+            return value or ''
+
+        return _DESTINATION_TOKEN.sub(substitute, self.destination)
+
+
+@dataclass
+class RedirectHop:
+    """One redirect response: where it goes, its status and the rule behind it."""
+    source: str
+    destination: str
+    status: int
+    rule: str  # vercel.json source pattern, or 'cleanUrls' / 'trailingSlash'
+
+
+@dataclass
+class RedirectChain:
+    """Every redirect a path goes through before it is served."""
+    path: str
+    hops: List[RedirectHop]
+    final: str
+    loop: bool = False
+    external: bool = False
+
+    @property
+    def length(self) -> int:
+        return len(self.hops)
+
+
+@dataclass
+class HeaderRule:
+    """A compiled headers rule from vercel.json."""
+    source: str
+    pattern: Pattern
+    headers: List[Tuple[str, str]]
+
+
+class VercelConfig:
+    """Compiled routing rules from vercel.json with memoized page resolution."""
+
+    def __init__(self, project_root: Union[str, Path], config_file: str = 'vercel.json'):
+        self.project_root = Path(project_root).resolve()
+        self.raw = self._load(self.project_root / config_file)
+        self.clean_urls = bool(self.raw.get('cleanUrls', False))
+        self.trailing_slash = self.raw.get('trailingSlash')
+        self.rewrites = self._compile_rules(self.raw.get('rewrites', []))
+        self.redirects = self._compile_rules(self.raw.get('redirects', []))
+        self.header_rules = self._compile_header_rules(self.raw.get('headers', []))
+        self._header_cache: Dict[str, Dict[str, Tuple[str, str]]] = {}
+        self._chain_cache: Dict[str, RedirectChain] = {}
+        self._page_cache: Dict[Tuple[str, str], Optional[Path]] = {}
+        self._file_cache: Dict[Path, bool] = {}
+
+    @staticmethod
+    def _load(config_path: Path) -> Dict:
+        try:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    @staticmethod
+    def _compile_rules(entries: List[Dict]) -> List[RouteRule]:
+        rules = []
+        for entry in entries:
+            source, destination = entry.get('source'), entry.get('destination')
+            if not source or destination is None:
+                continue
+            try:
+                pattern = compile_source(source)
+            except re.error:
+                continue
+            permanent = bool(entry.get('permanent', False))
+            rules.append(RouteRule(source, destination, pattern, permanent, entry.get('statusCode')))
+        return rules
+
+    @staticmethod
+    def _compile_header_rules(entries: List[Dict]) -> List[HeaderRule]:
+        rules = []
+        for entry in entries:
+            source = entry.get('source')
+            if not source:
+                continue
+            try:
+                pattern = compile_source(source)
+            except re.error:
+                continue
+            headers = [(header['key'], header.get('value', '')) for header in entry.get('headers', [])
+                       if header.get('key')]
+            rules.append(HeaderRule(source, pattern, headers))
+        return rules
+
+    def headers_for(self, path: str) -> Dict[str, Tuple[str, str]]:
+        """Response headers for a URL path: lowercased name -> (value, rule source)."""
+        path = unquote(urlparse(path).path) or '/'
+        headers = self._header_cache.get(path)
+        if headers is None:
+            headers = {}
+            for rule in self.header_rules:
+                if rule.pattern.match(path):
+                    for key, value in rule.headers:
+                        headers[key.lower()] = (value, rule.source)
+            self._header_cache[path] = headers
+        return headers
+
+    def rewrite(self, path: str) -> Optional[str]:
+        """Destination of the first rewrite matching the path, or None."""
+        for rule in self.rewrites:
+            destination = rule.apply(path)
+            if destination is not None:
+                return destination
+        return None
+
+    def redirect(self, path: str) -> Optional[RouteRule]:
+        """First redirect rule matching the path, or None."""
+        for rule in self.redirects:
+            if rule.pattern.match(path):
+                return rule
+        return None
+
+    def redirect_hop(self, path: str) -> Optional[RedirectHop]:
+        """The redirect a request for the path receives, or None when it is served."""
+        rule = self.redirect(path)
+        if rule is not None:
+            return RedirectHop(path, rule.apply(path), rule.status, rule.source)
+        if self.clean_urls and path.endswith('.html'):
+            destination = path[:-len('.html')]
+            if destination.endswith('/index'):
+                destination = destination[:-len('index')]
+            if self.trailing_slash is not True:
+                destination = destination.rstrip('/') or '/'
+            return RedirectHop(path, destination, 308, 'cleanUrls')
+        if self.trailing_slash is False and path != '/' and path.endswith('/'):
+            return RedirectHop(path, path.rstrip('/') or '/', 308, 'trailingSlash')
+        if self.trailing_slash is True and not path.endswith('/') and '.' not in path.rsplit('/', 1)[-1]:
+            return RedirectHop(path, path + '/', 308, 'trailingSlash')
+        return None
+
+    def redirect_chain(self, path: str) -> RedirectChain:
+        """All redirects from a URL path to the page that serves it, memoized per path."""
+        chain = self._chain_cache.get(path)
+        if chain is None:
+            chain = self._redirect_chain(path, ())
+        return chain
+
+    def _redirect_chain(self, path: str, seen: Tuple[str, ...]) -> RedirectChain:
+        cached = self._chain_cache.get(path)
+        if cached is not None and not (cached.loop and seen):
+            return cached
+        if path in seen or len(seen) >= MAX_REDIRECT_HOPS:
+            return RedirectChain(path, [], path, loop=True)
+
+        hop = self.redirect_hop(path)
+        if hop is None:
+            chain = RedirectChain(path, [], path)
+        else:
+            target = urlparse(hop.destination)
+            if target.scheme or target.netloc:
+                chain = RedirectChain(path, [hop], hop.destination, external=True)
+            else:
+                rest = self._redirect_chain(target.path or '/', seen + (path,))
+                chain = RedirectChain(path, [hop] + rest.hops, rest.final, rest.loop, rest.external)
+
+        # A looping chain depends on where the loop was entered, so it is only
+        # cached for, and reused by, requests made from outside a chain
+        if not chain.loop or not seen:
+            self._chain_cache[path] = chain
+        return chain
+
+    def resolve_page(self, href: str, source_file: Optional[str] = None) -> Optional[Path]:
+        """Return the HTML file served for a page URL, following redirects and rewrites."""
+        parsed = urlparse(href.strip())
+        if parsed.scheme or parsed.netloc:
+            return None
+        path = unquote(parsed.path)
+        if not path:
+            return Path(source_file).resolve() if source_file else None
+
+        base = ''
+        if not path.startswith('/'):
+            if not source_file:
+                return None
+            base = str(Path(source_file).resolve().parent)
+
+        key = (path, base)
+        if key not in self._page_cache:
+            self._page_cache[key] = self._resolve_page(path, base)
+        return self._page_cache[key]
+
+    def _resolve_page(self, path: str, base: str) -> Optional[Path]:
+        if base:
+            # Relative page links resolve against the referencing file on disk
+            return self._page_file(Path(base) / path)
+
+        chain = self.redirect_chain(path)
+        if chain.external or chain.loop:
+            return None
+        path = chain.final
+
+        page = self._page_file(self.project_root / path.lstrip('/'))
+        if page is not None:
+            return page
+
+        destination = self.rewrite(path)
+        if destination is None or destination.startswith(('http://', 'https://')):
+            return None
+        return self._page_file(self.project_root / urlparse(destination).path.lstrip('/'))
+
+    def _page_file(self, target: Path) -> Optional[Path]:
+        candidates = [target / 'index.html']
+        if target.suffix == '.html':
+            candidates.insert(0, target)
+        elif self.clean_urls or target.suffix == '':
+            candidates.insert(0, target.with_name(target.name + '.html'))
+
+        for candidate in candidates:
+            candidate = Path(candidate).resolve()
+            exists = self._file_cache.get(candidate)
+            if exists is None:
+                exists = self._file_cache[candidate] = candidate.is_file()
+            if exists:
+                return candidate
+        return None
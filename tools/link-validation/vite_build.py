@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+Vite Build Output Validation
+
+Checks references against what the build actually emitted rather than the
+source tree. A reference can be valid in source and still break after
+bundling: the hashed file name changed, a chunk was split, or an asset was
+inlined.
+
+The build directory is read in one streaming pass. Every emitted file is
+recorded with its size, emitted HTML is fed to the link parser in chunks as it
+is reached, and Vite's ``manifest.json`` (``.vite/manifest.json`` since Vite 5)
+is loaded wherever it appears in the walk. Validation runs after the pass
+against the complete file set:
+
+- emitted HTML references, and source pages' references under the build's
+  ``base`` (``/dist/`` here, where hand-written pages load the bundle), must
+  name emitted files
+- page links in emitted HTML that point outside the base must resolve to a
+  site page the way the source validator resolves them (files, clean URLs and
+  vercel.json routes)
+- a reference to a file that was not emitted but whose name matches a current
+  output apart from its hash is reported as stale, with the source it comes
+  from and the file to use now
+- each page's bundle cost is the entry chunks it loads plus their static
+  imports, CSS and assets, with lazily imported chunks counted separately; a
+  stale reference is costed as the output that replaces it
+
+Hashed outputs are mapped back to their source modules through the manifest in
+every message.
+"""
+
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from urllib.parse import unquote, urlparse
+
+from .asset_resolver import AssetResolver, is_local_reference
+from .html_link_parser import ALCBFHTMLParser, HTMLLinkExtractor, LinkInfo
+from .profiling import Profiler, get_profiler
+
+
+# In order of preference; a bare manifest.json may instead be a PWA manifest copied from public/
+MANIFEST_NAMES = ('.vite/manifest.json', 'manifest.json')
+DEFAULT_BASE = '/dist/'
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Rollup's default file names: name-HASH.ext, with an 8-character base64url hash
+_HASHED_NAME = re.compile(r'^(?P<stem>.+)-[A-Za-z0-9_-]{8}(?P<ext>\.\w+)$')
+
+
+@dataclass
+class ManifestChunk:
+    """One entry of Vite's build manifest."""
+    source: str
+    file: str
+    is_entry: bool = False
+    is_dynamic_entry: bool = False
+    imports: List[str] = field(default_factory=list)
+    dynamic_imports: List[str] = field(default_factory=list)
+    css: List[str] = field(default_factory=list)
+    assets: List[str] = field(default_factory=list)
+
+
+def is_vite_manifest(data) -> bool:
+    """True for Vite's manifest shape: a mapping of keys to chunks that each name a file."""
+    return isinstance(data, dict) and bool(data) and \
+        all(isinstance(entry, dict) and 'file' in entry for entry in data.values())
+
+
+def unhashed_name(path: str) -> str:
+    """Output path with its content hash removed: assets/main-BfoDxb1i.js -> assets/main.js."""
+    directory, _, name = path.rpartition('/')
+    match = _HASHED_NAME.match(name)
+    if match:
+        name = match.group('stem') + match.group('ext')
+    return f'{directory}/{name}' if directory else name
+
+
+class ViteManifest:
+    """Vite's manifest indexed by source key and by emitted file."""
+
+    def __init__(self, entries: Dict[str, Dict]):
+        self.chunks: Dict[str, ManifestChunk] = {}
+        for key, entry in entries.items():
+            self.chunks[key] = ManifestChunk(
+                source=entry.get('src', key),
+                file=entry.get('file', ''),
+                is_entry=bool(entry.get('isEntry')),
+                is_dynamic_entry=bool(entry.get('isDynamicEntry')),
+                imports=entry.get('imports', []),
+                dynamic_imports=entry.get('dynamicImports', []),
+                css=entry.get('css', []),
+                assets=entry.get('assets', [])
+            )
+        self.by_output = {chunk.file: key for key, chunk in self.chunks.items()}
+        for key, chunk in self.chunks.items():
+            for output in chunk.css + chunk.assets:
+                self.by_output.setdefault(output, key)
+        self._by_unhashed = {unhashed_name(output): output for output in self.by_output}
+
+    def source_of(self, output: str) -> Optional[str]:
+        """Source module an emitted file was built from."""
+        key = self.by_output.get(output)
+        return self.chunks[key].source if key is not None else None
+
+    def current_output(self, output: str) -> Optional[str]:
+        """The emitted file that replaces a stale hashed name, if one matches."""
+        return self._by_unhashed.get(unhashed_name(output))
+
+    def closure(self, output: str) -> Tuple[List[str], List[str]]:
+        """(files loaded with an emitted entry, files it imports lazily)."""
+        key = self.by_output.get(output)
+        if key is None:
+            return [output], []
+        loaded: List[str] = []
+        lazy: List[str] = []
+        seen: Set[str] = set()
+
+        def visit(chunk_key: str, target: List[str]):
+            if chunk_key in seen or chunk_key not in self.chunks:
+                return
+            seen.add(chunk_key)
+            chunk = self.chunks[chunk_key]
+            for file in [chunk.file] + chunk.css + chunk.assets:
+                if file and file not in loaded and file not in target:
+                    target.append(file)
+            for imported in chunk.imports:
+                visit(imported, target)
+            for imported in chunk.dynamic_imports:
+                visit(imported, lazy)
+
+        visit(key, loaded)
+        return loaded, [file for file in lazy if file not in loaded]
+
+
+@dataclass
+class BuildReference:
+    """A reference into the build output from an emitted or source page."""
+    page: str
+    line_number: int
+    href: str
+    output: Optional[str]  # path relative to the build directory, None outside the base
+
+
+class BuildValidator:
+    """Validates pages against the files a Vite build emitted."""
+
+    def __init__(self, project_root: str, build_dir: str, profiler: Optional[Profiler] = None,
+                 config: Optional[Dict] = None):
+        self.project_root = Path(project_root).resolve()
+        self.build_dir = (self.project_root / build_dir).resolve()
+        self.profiler = get_profiler(profiler)
+        self.resolver = AssetResolver(self.project_root)
+        settings = (config or {}).get('vite_build', {})
+        self.base = '/' + settings.get('base', DEFAULT_BASE).strip('/') + '/'
+        # Emitted pages are labelled by where they are on disk, e.g. dist/index.html
+        self.label = os.path.relpath(self.build_dir, self.project_root).replace(os.sep, '/')
+        self._site_validator = None
+
+        self.files: Dict[str, int] = {}
+        self.manifest: Optional[ViteManifest] = None
+        self.manifest_path: Optional[str] = None
+        self.emitted_links: List[LinkInfo] = []
+
+    def _walk(self) -> Iterator[Tuple[str, os.DirEntry]]:
+        stack = [self.build_dir]
+        while stack:
+            directory = stack.pop()
+            with os.scandir(directory) as entries:
+                for entry in sorted(entries, key=lambda entry: entry.name):
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(Path(entry.path))
+                    elif entry.is_file():
+                        yield os.path.relpath(entry.path, self.build_dir).replace(os.sep, '/'), entry
+
+    def scan(self):
+        """Single pass over the build directory: sizes, manifest and emitted HTML links."""
+        with self.profiler.phase('build_scan'):
+            for relative, entry in self._walk():
+                self.files[relative] = entry.stat().st_size
+                if relative.endswith('.html'):
+                    self.emitted_links.extend(self._stream_html(entry.path))
+            self._load_manifest()
+        self.profiler.count('build_files', len(self.files))
+
+    def _load_manifest(self):
+        """First of MANIFEST_NAMES in the build that has Vite's manifest shape."""
+        for name in MANIFEST_NAMES:
+            if name not in self.files:
+                continue
+            try:
+                with open(self.build_dir / name, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except ValueError:
+                continue
+            if is_vite_manifest(data):
+                self.manifest = ViteManifest(data)
+                self.manifest_path = name
+                return
+
+    def _stream_html(self, path: str) -> List[LinkInfo]:
+        parser = ALCBFHTMLParser(path)
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            for chunk in iter(lambda: f.read(STREAM_CHUNK_SIZE), ''):
+                parser.feed(chunk)
+        parser.close()
+        self.profiler.count('build_html_files')
+        return parser.links
+
+    def output_path(self, href: str) -> Optional[str]:
+        """Build-relative path of a URL under the base, or None."""
+        path = unquote(urlparse(href.strip()).path)
+        if path.startswith(self.base):
+            return path[len(self.base):]
+        return None
+
+    def references(self) -> List[BuildReference]:
+        """References from emitted HTML, plus source-page references under the base."""
+        references = []
+        for link in self.emitted_links:
+            if not is_local_reference(link.href):
+                continue
+            relative_page = os.path.relpath(link.source_file, self.build_dir).replace(os.sep, '/')
+            path = unquote(urlparse(link.href.strip()).path)
+            if path.startswith('/'):
+                output = self.output_path(link.href)
+            else:
+                output = os.path.normpath(os.path.join(os.path.dirname(relative_page), path)).replace(os.sep, '/')
+            references.append(BuildReference(f"{self.label}/{relative_page}", link.line_number, link.href, output))
+
+        source_results = HTMLLinkExtractor(str(self.project_root), profiler=self.profiler).parse_project()
+        for link in source_results.links:
+            output = self.output_path(link.href) if is_local_reference(link.href) else None
+            if output is not None:
+                page = os.path.relpath(link.source_file, self.project_root)
+                references.append(BuildReference(page, link.line_number, link.href, output))
+        return references
+
+    @property
+    def site_validator(self):
+        """Source-tree link validator for page links leaving the build, created on first use"""
+        if self._site_validator is None:
+            from .link_validator import LinkValidator
+            
+            self._site_validator = LinkValidator(str(self.project_root), profiler=self.profiler)
+        return self._site_validator
+
+    def describe(self, output: str) -> str:
+        source = self.manifest.source_of(output) if self.manifest else None
+        return f"{output} (from {source})" if source else output
+
+    def check(self, reference: BuildReference) -> Optional[str]:
+        """Error message for a reference that does not resolve after the build, or None."""
+        if reference.output is None:
+            # Outside the base: assets are served from the deployed project tree, pages are routed
+            path = unquote(urlparse(reference.href.strip()).path)
+            if os.path.splitext(path)[1].lower() in ('', '.html'):
+                result = self.site_validator.validate_link(path)
+                return None if result.is_valid else result.error_message
+            if self.resolver.resolve(path) is not None:
+                return None
+            return f"Not in the build or the project tree: {reference.href}"
+
+        if reference.output in self.files:
+            return None
+        current = self.manifest.current_output(reference.output) if self.manifest else None
+        if current is not None:
+            return (f"Stale build reference {reference.output}: the build now emits "
+                    f"{self.describe(current)}")
+        return f"Not emitted by the build: {reference.output}"
+
+    def page_bundles(self, references: List[BuildReference]) -> List[Dict]:
+        """Per page: bytes of entry chunks, their static imports, CSS and assets, and lazy chunks."""
+        by_page: Dict[str, List[str]] = {}
+        for reference in references:
+            output = reference.output
+            if output is not None and output not in self.files and self.manifest:
+                output = self.manifest.current_output(output)
+            if output in self.files:
+                outputs = by_page.setdefault(reference.page, [])
+                if output not in outputs:
+                    outputs.append(output)
+
+        pages = []
+        for page, outputs in sorted(by_page.items()):
+            loaded: List[str] = []
+            lazy: List[str] = []
+            for output in outputs:
+                files, lazy_files = self.manifest.closure(output) if self.manifest else ([output], [])
+                loaded.extend(file for file in files if file not in loaded)
+                lazy.extend(file for file in lazy_files if file not in lazy)
+            lazy = [file for file in lazy if file not in loaded]
+
+            def total(files: List[str], *extensions: str) -> int:
+                return sum(self.files.get(file, 0) for file in files
+                           if not extensions or file.endswith(extensions))
+
+            pages.append({
+                'page': page,
+                'entries': [self.describe(output) for output in outputs],
+                'js_bytes': total(loaded, '.js', '.mjs'),
+                'css_bytes': total(loaded, '.css'),
+                'total_bytes': total(loaded),
+                'lazy_bytes': total(lazy),
+                'chunks': [{'file': file, 'source': self.manifest.source_of(file) if self.manifest else None,
+                            'size': self.files.get(file, 0)} for file in loaded],
+                'lazy_chunks': lazy
+            })
+        pages.sort(key=lambda row: (-row['total_bytes'], row['page']))
+        return pages
+
+    def validate(self) -> Dict:
+        """Scan the build once, then validate every reference and size each page's bundle."""
+        if not self.build_dir.is_dir():
+            raise FileNotFoundError(f"Build directory not found: {self.build_dir}")
+        self.scan()
+        references = self.references()
+
+        issues = []
+        with self.profiler.phase('build_validate'):
+            for reference in references:
+                error = self.check(reference)
+                if error:
+                    issues.append({'page': reference.page, 'line_number': reference.line_number,
+                                   'link': reference.href, 'error': error})
+
+        return {
+            'summary': {
+                'build_dir': self.label,
+                'manifest': self.manifest_path,
+                'emitted_files': len(self.files),
+                'emitted_bytes': sum(self.files.values()),
+                'emitted_html': len({link.source_file for link in self.emitted_links}),
+                'references_checked': len(references),
+                'invalid_references': len(issues)
+            },
+            'issues': issues,
+            'pages': self.page_bundles(references),
+            'chunks': sorted(({'file': output, 'source': self.manifest.source_of(output), 'size': self.files[output]}
+                              for output in self.manifest.by_output if output in self.files),
+                             key=lambda chunk: -chunk['size']) if self.manifest else []
+        }
+
+
+def format_build_report(report: Dict, top: int = 15) -> str:
+    """Format a build validation report for terminal output."""
+    summary = report['summary']
+    lines = [
+        f"Build: {summary['build_dir']} ({summary['emitted_files']} files, "
+        f"{summary['emitted_bytes'] / 1024:.1f}K, manifest: {summary['manifest'] or 'not found'})",
+        f"References checked: {summary['references_checked']} "
+        f"({summary['emitted_html']} emitted HTML files), {summary['invalid_references']} invalid"
+    ]
+    for issue in report['issues'][:top]:
+        lines.append(f"   ❌ {issue['page']}:{issue['line_number']}: {issue['link']} - {issue['error']}")
+    if len(report['issues']) > top:
+        lines.append(f"   ... and {len(report['issues']) - top} more")
+
+    lines.append("")
+    if report['pages']:
+        lines.append("Bundle cost per page (JS / CSS / total, lazy):")
+        for page in report['pages'][:top]:
+            lines.append(f"  {page['js_bytes'] / 1024:8.1f}K {page['css_bytes'] / 1024:7.1f}K "
+                         f"{page['total_bytes'] / 1024:8.1f}K  +{page['lazy_bytes'] / 1024:.1f}K lazy  {page['page']}")
+            lines.append(f"      entries: {', '.join(page['entries'])}")
+        if len(report['pages']) > top:
+            lines.append(f"  ... and {len(report['pages']) - top} more")
+    else:
+        lines.append("Bundle cost per page: no page loads build output")
+
+    if report['chunks']:
+        lines.append("")
+        lines.append("Largest chunks:")
+        for chunk in report['chunks'][:top]:
+            lines.append(f"  {chunk['size'] / 1024:8.1f}K  {chunk['file']}  ({chunk['source']})")
+    return "\n".join(lines)